@@ -0,0 +1,76 @@
+'''
+Accuracy and run time of the closed-form interval type-2 reducers.
+Compares it2_nietan_reduce and it2_bmm_reduce with the mid point of the
+exact centroid found by it2_kernikmendel_reduce, on the sets created by
+create_gaussian_fixed_sigma and create_gaussian_fixed_mean. The sets are
+made asymmetric by placing them near the end of the primary domain, where
+both methods are no longer exact. The error is also given relative to the
+width of the centroid, the uncertainty the approximation discards.
+The run times compare the single set reducers with Karnik-Mendel, and the
+batch reducers with a loop over the sets
+
+usage: python benchmarks/benchmark_closedform_reducers.py
+'''
+import numpy as np
+from type2fuzzy.membership.generate_it2fs import create_gaussian_fixed_sigma, create_gaussian_fixed_mean
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_kernikmendel_reduce
+from type2fuzzy.type_reduction.it2_closedform_reducer import it2_nietan_reduce, it2_bmm_reduce
+from type2fuzzy.type_reduction.it2_closedform_reducer import it2_nietan_reduce_batch, it2_bmm_reduce_batch
+from timing import best_time
+
+
+def test_sets(resolution=101):
+    '''returns (description, set) pairs of gaussian sets with uncertain means and deviations'''
+    primary_domain = np.linspace(0, 10, resolution).tolist()
+
+    sets = []
+    for mean in [5, 8, 9.5]:
+        for spread in [0.25, 0.5, 1.0]:
+            sets.append((f'sigma 1, mean {mean - spread:.2f}-{mean + spread:.2f}',
+                        create_gaussian_fixed_sigma(primary_domain, mean - spread, mean + spread)))
+    for mean in [5, 8, 9.5]:
+        for sigma2 in [1.25, 1.5, 2.0]:
+            sets.append((f'mean {mean}, sigma 1.00-{sigma2:.2f}',
+                        create_gaussian_fixed_mean(primary_domain, 1, sigma2, mean=mean)))
+
+    return sets
+
+
+def main():
+    print(f'{"set":<28} {"km centroid":>18} {"nie-tan error":>14} {"bmm error":>10} '
+          f'{"nie-tan/width":>14} {"bmm/width":>10}')
+    for description, it2fs in test_sets():
+        exact = it2_kernikmendel_reduce(it2fs, information='full')
+        mid = (exact.left + exact.right) / 2
+        width = exact.right - exact.left
+
+        nietan_error = abs(it2_nietan_reduce(it2fs, information='full').left - mid)
+        bmm_error = abs(it2_bmm_reduce(it2fs, information='full').left - mid)
+        print(f'{description:<28} {f"[{exact.left:.4f}, {exact.right:.4f}]":>18} {nietan_error:>14.2e} '
+              f'{bmm_error:>10.2e} {nietan_error / width:>14.2%} {bmm_error / width:>10.2%}')
+
+    print()
+    print(f'{"points":>8} {"km (us)":>10} {"nie-tan (us)":>13} {"bmm (us)":>10}')
+    for resolution in [20, 100, 1000, 10000]:
+        it2fs = test_sets(resolution)[0][1]
+        repeats = max(5, 200000 // resolution)
+        km_time, nietan_time, bmm_time = [best_time(reducer, it2fs, repeats=repeats) for reducer in
+                                            [it2_kernikmendel_reduce, it2_nietan_reduce, it2_bmm_reduce]]
+        print(f'{resolution:>8} {km_time * 1e6:>10.1f} {nietan_time * 1e6:>13.1f} {bmm_time * 1e6:>10.1f}')
+
+    print()
+    it2fss = [it2fs for _, it2fs in test_sets(101)] * 50
+    print(f'batch of {len(it2fss)} sets of 101 points')
+    print(f'{"reducer":>8} {"loop (ms)":>10} {"batch (ms)":>11} {"speedup":>8}')
+    for name, reducer, batch_reducer in [('nie-tan', it2_nietan_reduce, it2_nietan_reduce_batch),
+                                            ('bmm', it2_bmm_reduce, it2_bmm_reduce_batch)]:
+        centroids = batch_reducer(it2fss)
+        assert all(abs(centroids.left[idx] - reducer(it2fs).left) <= 1e-5 for idx, it2fs in enumerate(it2fss))
+
+        loop_time = best_time(lambda sets: [reducer(it2fs) for it2fs in sets], it2fss, repeats=5)
+        batch_time = best_time(batch_reducer, it2fss, repeats=5)
+        print(f'{name:>8} {loop_time * 1e3:>10.2f} {batch_time * 1e3:>11.2f} {loop_time / batch_time:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+'''
+Benchmark of the interval type-2 reducers.
+Compares the run time of it2_kernikmendel_reduce with the Karnik-Mendel
+('km') and enhanced Karnik-Mendel ('ekm') algorithms, it2_iasc_reduce,
+it2_eiasc_reduce and it2_exhaustive_reduce on domains of 20 to 100000
+points, so that the fastest reducer of a domain size can be chosen
+
+usage: python benchmarks/benchmark_it2_reducers.py
+'''
+import numpy as np
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_kernikmendel_reduce
+from type2fuzzy.type_reduction.it2_iasc_reducer import it2_iasc_reduce, it2_eiasc_reduce
+from type2fuzzy.type_reduction.it2_exhaustive_reducer import it2_exhaustive_reduce
+from timing import best_time
+
+REDUCERS = [
+    ('km', lambda it2fs: it2_kernikmendel_reduce(it2fs, algorithm='km')),
+    ('ekm', lambda it2fs: it2_kernikmendel_reduce(it2fs, algorithm='ekm')),
+    ('iasc', it2_iasc_reduce),
+    ('eiasc', it2_eiasc_reduce),
+    ('exhaustive', it2_exhaustive_reduce),
+]
+
+
+def interval_type2_set(resolution, rng):
+    '''creates a gaussian interval type-2 fuzzy set with an uncertain mean and noisy bounds'''
+    primary_domain = np.linspace(0, 10, resolution)
+    upper_mf = np.maximum(np.exp(-((primary_domain - 4) ** 2) / 2), np.exp(-((primary_domain - 5) ** 2) / 2))
+    upper_mf[(primary_domain > 4) & (primary_domain < 5)] = 1
+    lower_mf = np.minimum(np.exp(-((primary_domain - 4) ** 2) / 2), np.exp(-((primary_domain - 5) ** 2) / 2))
+    lower_mf = lower_mf * (0.8 + 0.2 * rng.random(resolution))
+
+    return IntervalType2FuzzySet.from_hmf_lmf(primary_domain, upper_mf, lower_mf)
+
+
+def main():
+    rng = np.random.default_rng(0)
+
+    print(f'{"points":>8} ' + ' '.join(f'{name + " (us)":>15}' for name, _ in REDUCERS) + f' {"fastest":>8}')
+    for resolution in [20, 50, 100, 200, 1000, 10000, 100000]:
+        it2fs = interval_type2_set(resolution, rng)
+
+        centroids = [reducer(it2fs) for _, reducer in REDUCERS]
+        assert all(abs(centroid.left - centroids[0].left) <= 1e-5
+                    and abs(centroid.right - centroids[0].right) <= 1e-5 for centroid in centroids)
+
+        repeats = max(5, 200000 // resolution)
+        times = [best_time(reducer, it2fs, repeats=repeats) for _, reducer in REDUCERS]
+        fastest = REDUCERS[int(np.argmin(times))][0]
+        print(f'{resolution:>8} ' + ' '.join(f'{duration * 1e6:>15.1f}' for duration in times) + f' {fastest:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+'''
+Benchmark of the union and intersection of general type-2 fuzzy sets.
+Compares GeneralType2FuzzySet.union and intersection, which join and meet
+the vertical slices by running maximum sweeps, with the previous
+implementation visiting every pair of points of the vertical slices
+
+usage: python benchmarks/benchmark_join_meet.py
+'''
+import numpy as np
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from timing import best_time
+
+
+def pairwise_operation(gt2fs_a, gt2fs_b, operator):
+    '''the previous union, operator max, and intersection, operator min'''
+    resultant_gt2fs = GeneralType2FuzzySet()
+
+    for primary_domain_val in gt2fs_a.primary_domain():
+        elements_a = gt2fs_a[primary_domain_val].elements()
+        elements_b = gt2fs_b[primary_domain_val].elements()
+
+        result = {}
+        for domain_a, grade_a in elements_a.items():
+            for domain_b, grade_b in elements_b.items():
+                domain = operator(domain_a, domain_b)
+                result[domain] = max(result.get(domain, 0.0), min(grade_a, grade_b))
+
+        resultant_gt2fs._add_slice(primary_domain_val, list(result), list(result.values()))
+
+    return resultant_gt2fs
+
+
+def general_type2_set(primary_size, secondary_size, center):
+    '''creates a general type-2 fuzzy set with convex normal secondaries'''
+    primary_domain = np.linspace(0, 10, primary_size)
+    secondary_domain = np.linspace(0, 1, secondary_size)
+    set_array = np.round(np.exp(-((secondary_domain[:, np.newaxis] - center
+                        - 0.2 * np.sin(primary_domain[np.newaxis, :])) ** 2) / 0.02), 4)
+
+    return GeneralType2FuzzySet.from_array(primary_domain, secondary_domain, set_array)
+
+
+def main():
+    print(f'{"points/slice":>12} {"operation":>13} {"pairs (s)":>10} {"sweep (s)":>10} {"speedup":>8}')
+    for secondary_size in [50, 200, 600]:
+        gt2fs_a = general_type2_set(10, secondary_size, 0.4)
+        gt2fs_b = general_type2_set(10, secondary_size, 0.6)
+
+        for name, operator in [('union', max), ('intersection', min)]:
+            operation = getattr(GeneralType2FuzzySet, name)
+
+            expected = pairwise_operation(gt2fs_a, gt2fs_b, operator)
+            result = operation(gt2fs_a, gt2fs_b)
+            for primary_domain_val in expected.primary_domain():
+                assert expected[primary_domain_val].elements() == result[primary_domain_val].elements()
+
+            pairs_time = best_time(pairwise_operation, gt2fs_a, gt2fs_b, operator)
+            sweep_time = best_time(operation, gt2fs_a, gt2fs_b)
+            print(f'{secondary_size:>12} {name:>13} {pairs_time:>10.4f} '
+                  f'{sweep_time:>10.4f} {pairs_time / sweep_time:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
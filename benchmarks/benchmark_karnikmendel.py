@@ -0,0 +1,86 @@
+'''
+Benchmark of the Karnik-Mendel type reduction of interval type-2 fuzzy sets.
+Compares it2_kernikmendel_reduce, which iterates on switch points read from
+prefix sums, and its enhanced Karnik-Mendel algorithm, updating the sums
+incrementally from the Wu-Mendel switch points, with the original
+implementation looking up the bounds of every domain value at every
+iteration, for at most 15 iterations
+
+usage: python benchmarks/benchmark_karnikmendel.py
+'''
+import numpy as np
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_kernikmendel_reduce
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_kernikmendel_centroid
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_enhanced_kernikmendel_centroid
+from timing import best_time
+
+
+def lookup_loop_reduce(it2fs):
+    '''the original _it2_kernikmendel_reduce_noinfo, looking up every element, without rounding'''
+    error_threshold = 1e-5
+
+    limits = []
+    for left in (True, False):
+        centroid = it2fs.mid_domain_element()
+        counter = 0
+
+        while True:
+            previous = centroid
+            numerator = 0
+            denominator = 0
+
+            for domain_element in it2fs.primary_domain():
+
+                if (domain_element >= centroid) if left else (domain_element <= centroid):
+                    numerator = numerator + (domain_element * it2fs[domain_element].left)
+                    denominator = denominator + it2fs[domain_element].left
+                else:
+                    numerator = numerator + (domain_element * it2fs[domain_element].right)
+                    denominator = denominator + it2fs[domain_element].right
+
+            centroid = numerator / denominator
+
+            if abs(centroid - previous) <= error_threshold or counter == 15:
+                break
+
+            counter = counter + 1
+
+        limits.append(float(previous))
+
+    return limits
+
+
+def interval_type2_set(resolution):
+    '''creates a gaussian interval type-2 fuzzy set with an uncertain mean'''
+    primary_domain = np.linspace(0, 10, resolution)
+    upper_mf = np.maximum(np.exp(-((primary_domain - 4) ** 2) / 2), np.exp(-((primary_domain - 5) ** 2) / 2))
+    upper_mf[(primary_domain > 4) & (primary_domain < 5)] = 1
+    lower_mf = np.minimum(np.exp(-((primary_domain - 4) ** 2) / 2), np.exp(-((primary_domain - 5) ** 2) / 2))
+
+    return IntervalType2FuzzySet.from_hmf_lmf(primary_domain, upper_mf, lower_mf)
+
+
+def main():
+    print(f'{"points":>10} {"loop (s)":>10} {"km (s)":>10} {"ekm (s)":>10} {"km speedup":>11} '
+          f'{"ekm speedup":>12} {"km iterations":>14} {"ekm iterations":>15} {"difference":>11}')
+    for resolution in [1000, 10000, 100000]:
+        it2fs = interval_type2_set(resolution)
+        arrays = (it2fs.primary_domain(), it2fs.lower_membership_function(), it2fs.higher_membership_function())
+
+        expected = lookup_loop_reduce(it2fs)
+        centroid_left, centroid_right, iterations = it2_kernikmendel_centroid(*arrays)
+        enhanced_left, enhanced_right, enhanced_iterations = it2_enhanced_kernikmendel_centroid(*arrays)
+        assert abs(enhanced_left - centroid_left) < 1e-9 and abs(enhanced_right - centroid_right) < 1e-9
+        difference = max(abs(centroid_left - expected[0]), abs(centroid_right - expected[1]))
+
+        loop_time = best_time(lookup_loop_reduce, it2fs, repeats=1)
+        km_time = best_time(it2_kernikmendel_reduce, it2fs, repeats=5)
+        ekm_time = best_time(it2_kernikmendel_reduce, it2fs, repeats=5, algorithm='ekm')
+        print(f'{resolution:>10} {loop_time:>10.5f} {km_time:>10.5f} {ekm_time:>10.5f} '
+              f'{loop_time / km_time:>11.0f} {loop_time / ekm_time:>12.0f} '
+              f'{str(iterations):>14} {str(enhanced_iterations):>15} {difference:>11.2e}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+'''
+Benchmark of the parsing of the textual representation of type-2 fuzzy sets.
+Compares the single pass tokenizer used by from_representation with the
+previous parser, splitting the representation and adding every point
+with add_element
+
+usage: python benchmarks/benchmark_representation_parser.py
+'''
+import numpy as np
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.membership.generate_it2fs import create_gaussian_fixed_sigma
+from timing import best_time
+
+
+def split_parse_general_type2(set_representation):
+    '''the previous GeneralType2FuzzySet.from_representation'''
+    gt2fs = GeneralType2FuzzySet()
+
+    translation_table = dict.fromkeys(map(ord, ' \t\n\r'), None)
+    set_representation = set_representation.translate(translation_table)
+
+    for sec_mf in set_representation.split('+('):
+        translation_table = dict.fromkeys(map(ord, '('), None)
+        sec_mf = sec_mf.translate(translation_table)
+
+        vertical_slice_points_s, pri_dom_val_s = sec_mf.split(')/')
+        primary_domain_val = float(pri_dom_val_s)
+
+        for point_s in vertical_slice_points_s.split('+'):
+            sec_grade_val_s, sec_dom_val_s = point_s.split('/')
+            gt2fs.add_element(primary_domain_val, float(sec_dom_val_s), float(sec_grade_val_s))
+
+    return gt2fs
+
+
+def split_parse_interval_type2(set_representation):
+    '''the previous IntervalType2FuzzySet.from_representation'''
+    primary_domain = []
+    lmf = []
+    hmf = []
+
+    translation_table = dict.fromkeys(map(ord, ' \t\n\r'), None)
+    set_representation = set_representation.translate(translation_table)
+
+    for sec_mf in set_representation.split('+'):
+        vslice_points_s, pri_dom_val_s = sec_mf.split('/')
+
+        translation_table = dict.fromkeys(map(ord, '[]'), None)
+        vslice_points_s = vslice_points_s.translate(translation_table)
+        left_s, right_s = vslice_points_s.split(',')
+
+        primary_domain.append(float(pri_dom_val_s))
+        lmf.append(float(left_s))
+        hmf.append(float(right_s))
+
+    return IntervalType2FuzzySet.from_hmf_lmf(primary_domain, hmf, lmf)
+
+
+def general_type2_representation(primary_size, secondary_size):
+    '''creates the representation of a gaussian general type-2 fuzzy set'''
+    primary_domain = np.linspace(0, 10, primary_size)
+    secondary_domain = np.linspace(0, 1, secondary_size)
+    set_array = np.exp(-((secondary_domain[:, np.newaxis] - 0.5
+                        - 0.3 * np.sin(primary_domain[np.newaxis, :])) ** 2) / 0.02)
+
+    return str(GeneralType2FuzzySet.from_array(primary_domain, secondary_domain, set_array))
+
+
+def interval_type2_representation(primary_size):
+    '''creates the representation of a gaussian interval type-2 fuzzy set'''
+    it2fs = create_gaussian_fixed_sigma(np.linspace(0, 10, primary_size).tolist(), 4, 6)
+
+    # CrispSet writes intervals of equal limits as [v], which the previous parser rejects
+    return ' + '.join(f'[{lower:.5f}, {upper:.5f}] / {primary_domain_val:.5f}'
+                    for primary_domain_val, lower, upper in zip(
+                        it2fs.primary_domain().tolist(),
+                        it2fs.lower_membership_function().tolist(),
+                        it2fs.higher_membership_function().tolist()))
+
+
+def main():
+    print('general type-2 sets')
+    print(f'{"points":>10} {"split (s)":>12} {"tokenizer (s)":>14} {"speedup":>8}')
+    for primary_size, secondary_size in [(101, 51), (301, 101), (1001, 201)]:
+        representation = general_type2_representation(primary_size, secondary_size)
+        split_time = best_time(split_parse_general_type2, representation)
+        tokenizer_time = best_time(GeneralType2FuzzySet.from_representation, representation)
+        print(f'{primary_size * secondary_size:>10} {split_time:>12.4f} '
+              f'{tokenizer_time:>14.4f} {split_time / tokenizer_time:>8.1f}')
+
+    print('interval type-2 sets')
+    print(f'{"elements":>10} {"split (s)":>12} {"tokenizer (s)":>14} {"speedup":>8}')
+    for primary_size in [1001, 10001, 100001]:
+        representation = interval_type2_representation(primary_size)
+        split_time = best_time(split_parse_interval_type2, representation)
+        tokenizer_time = best_time(IntervalType2FuzzySet.from_representation, representation)
+        print(f'{primary_size:>10} {split_time:>12.4f} '
+              f'{tokenizer_time:>14.4f} {split_time / tokenizer_time:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+'''
+Benchmark of the textual serialization of fuzzy sets.
+Compares GeneralType2FuzzySet.__str__, which computes the characters of
+blocks of points as byte arrays, and Type1FuzzySet.__str__, which formats
+all the elements with a single template, with the previous implementations
+formatting every element on its own
+
+usage: python benchmarks/benchmark_serialization.py
+'''
+import numpy as np
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.type1_fuzzyset import Type1FuzzySet
+from timing import best_time
+
+
+def element_str_general_type2(gt2fs):
+    '''the previous GeneralType2FuzzySet.__str__'''
+    represented_slices = []
+    dec_places_formatter = '''%0.{}f'''.format(gt2fs._precision)
+
+    for primary_domain_val in gt2fs.primary_domain():
+        sec_domains = list(gt2fs.vertical_slice(primary_domain_val).domain_elements())
+        doms = list(gt2fs.vertical_slices[primary_domain_val].dom_elements())
+
+        def slice_rep_creation(sec_domains, doms):
+            return dec_places_formatter % (doms) +' / ' + dec_places_formatter % (sec_domains)
+
+        slice_rep = ' + '.join(map(slice_rep_creation, sec_domains, doms))
+        represented_slices.append('(' + slice_rep + ')')
+
+    def slice_end_creation(sec_domains, doms):
+        return doms + ' / ' + dec_places_formatter % (sec_domains)
+
+    return ' + '.join(map(slice_end_creation, gt2fs.primary_domain(), represented_slices))
+
+
+def concatenation_str_type1(t1fs):
+    '''the previous Type1FuzzySet.__str__'''
+    set_representation = ''
+    for idx, val in enumerate(t1fs.elements()):
+        set_representation = set_representation + f'{val} / {idx} + '
+
+    return set_representation
+
+
+def general_type2_set(primary_size, secondary_size):
+    '''creates a gaussian general type-2 fuzzy set'''
+    primary_domain = np.linspace(0, 10, primary_size)
+    secondary_domain = np.linspace(0, 1, secondary_size)
+    set_array = np.exp(-((secondary_domain[:, np.newaxis] - 0.5
+                        - 0.3 * np.sin(primary_domain[np.newaxis, :])) ** 2) / 0.02)
+
+    return GeneralType2FuzzySet.from_array(primary_domain, secondary_domain, set_array)
+
+
+def type1_set(resolution):
+    '''creates a random type-1 fuzzy set'''
+    t1fs = Type1FuzzySet(resolution)
+    t1fs._elements = np.random.default_rng(0).random(resolution)
+    return t1fs
+
+
+def main():
+    print('general type-2 sets')
+    print(f'{"points":>10} {"element (s)":>12} {"blocks (s)":>12} {"speedup":>8}')
+    for primary_size, secondary_size in [(101, 51), (301, 101), (1001, 201)]:
+        gt2fs = general_type2_set(primary_size, secondary_size)
+        assert element_str_general_type2(gt2fs) == str(gt2fs)
+        element_time = best_time(element_str_general_type2, gt2fs)
+        block_time = best_time(str, gt2fs)
+        print(f'{primary_size * secondary_size:>10} {element_time:>12.4f} '
+              f'{block_time:>12.4f} {element_time / block_time:>8.1f}')
+
+    print('type-1 sets')
+    print(f'{"elements":>10} {"concat (s)":>12} {"template (s)":>12} {"speedup":>8}')
+    for resolution in [1000, 10000, 100000]:
+        t1fs = type1_set(resolution)
+        assert concatenation_str_type1(t1fs) == str(t1fs)
+        concatenation_time = best_time(concatenation_str_type1, t1fs)
+        template_time = best_time(str, t1fs)
+        print(f'{resolution:>10} {concatenation_time:>12.4f} '
+              f'{template_time:>12.4f} {concatenation_time / template_time:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
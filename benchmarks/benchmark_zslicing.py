@@ -0,0 +1,65 @@
+'''
+Benchmark of the z-slicing of general type-2 fuzzy sets.
+Compares ZSliceType2FuzzySet.from_general_type2_set, which finds the bounds
+of all the levels at once with GeneralType2FuzzySet.z_slice_bounds, with the
+previous implementation calling GeneralType2FuzzySet.z_slice at every level
+
+usage: python benchmarks/benchmark_zslicing.py
+'''
+import numpy as np
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.zslicetype2fuzzyset import ZSliceType2FuzzySet
+from timing import best_time
+
+NO_SLICES = 100
+
+
+def level_by_level_zslices(gt2fs, no_slices=NO_SLICES):
+    '''the previous ZSliceType2FuzzySet.from_general_type2_set'''
+    zt2fs = ZSliceType2FuzzySet()
+
+    for z_val in np.linspace(0, 1, no_slices+1):
+        z_sliced_set = gt2fs.z_slice(z_val)
+
+        if not z_sliced_set.empty:
+            zt2fs.add_element(z_val, z_sliced_set)
+            zt2fs._empty = False
+    return zt2fs
+
+
+def all_levels_zslices(gt2fs, no_slices=NO_SLICES):
+    '''the vectorized ZSliceType2FuzzySet.from_general_type2_set'''
+    return ZSliceType2FuzzySet.from_general_type2_set(gt2fs, no_slices)
+
+
+def general_type2_set(primary_size, secondary_size):
+    '''creates a gaussian general type-2 fuzzy set'''
+    primary_domain = np.linspace(0, 10, primary_size)
+    secondary_domain = np.linspace(0, 1, secondary_size)
+    set_array = np.round(np.exp(-((secondary_domain[:, np.newaxis] - 0.5
+                        - 0.3 * np.sin(primary_domain[np.newaxis, :])) ** 2) / 0.02), 4)
+
+    return GeneralType2FuzzySet.from_array(primary_domain, secondary_domain, set_array)
+
+
+def main():
+    print(f'{NO_SLICES + 1} z-levels')
+    print(f'{"points":>10} {"levels (s)":>12} {"at once (s)":>12} {"speedup":>8}')
+    for primary_size, secondary_size in [(51, 51), (101, 101), (301, 201)]:
+        gt2fs = general_type2_set(primary_size, secondary_size)
+
+        expected = level_by_level_zslices(gt2fs)
+        zt2fs = all_levels_zslices(gt2fs)
+        assert expected.zslices() == zt2fs.zslices()
+        for z_val in expected.zslices():
+            assert np.array_equal(expected[z_val].lower_membership_function(), zt2fs[z_val].lower_membership_function())
+            assert np.array_equal(expected[z_val].higher_membership_function(), zt2fs[z_val].higher_membership_function())
+
+        level_time = best_time(level_by_level_zslices, gt2fs)
+        all_levels_time = best_time(all_levels_zslices, gt2fs)
+        print(f'{primary_size * secondary_size:>10} {level_time:>12.4f} '
+              f'{all_levels_time:>12.4f} {level_time / all_levels_time:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,14 @@
+'''
+timing helper shared by the benchmarks
+'''
+import time
+
+
+def best_time(func, *arguments, repeats=3, **kwargs):
+    '''returns the best execution time of func(*arguments, **kwargs) in seconds'''
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*arguments, **kwargs)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
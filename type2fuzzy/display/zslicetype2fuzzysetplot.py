@@ -1,5 +1,6 @@
 import numpy as np
 from matplotlib import colors as mcolors
+from type2fuzzy.membership.densezslicetype2fuzzyset import DenseZSliceType2FuzzySet
 
 class ZSliceType2FuzzySetPlot():
 	'''
@@ -17,6 +18,21 @@ class ZSliceType2FuzzySetPlot():
 		self._zslicetype2set = zt2fs
 		self.divs = 5
 
+	def _slices(self):
+		'''
+		Yields the primary domain, lower and upper membership functions of every slice.
+		The rows of the bounds of a dense z-slice set are used directly, matplotlib
+		leaves a gap where a primary domain value is not part of a slice
+		'''
+		if isinstance(self._zslicetype2set, DenseZSliceType2FuzzySet):
+			_, primary_domain, bounds = self._zslicetype2set.to_array()
+			for slice_bounds in bounds:
+				yield primary_domain, slice_bounds[:, 0], slice_bounds[:, 1]
+		else:
+			for slice in self._zslicetype2set.zslices():
+				set = self._zslicetype2set[slice]
+				yield set.primary_domain(), set.lower_membership_function(), set.higher_membership_function()
+
 	def plot(self, curr_ax):
 		'''
 		Plots a general type-2 fuzzy set as an image
@@ -41,12 +57,7 @@ class ZSliceType2FuzzySetPlot():
 		step = int(156 / len(self._zslicetype2set.zslices()))
 
 		count = 1
-		for slice in self._zslicetype2set.zslices():
-			set = self._zslicetype2set[slice]
-			upper_membership_function = set.higher_membership_function()
-			lower_membership_function = set.lower_membership_function()
-
-			primary_domain = set.primary_domain()
+		for primary_domain, lower_membership_function, upper_membership_function in self._slices():
 
 		# x_array_res = len(primary_domain)
 
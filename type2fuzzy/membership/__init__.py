@@ -3,11 +3,17 @@ type2fuzzy.membership
 
 Membership modules including:<br>
 General Type-2 fuzzy Set.<br/>
+Dense General Type-2 fuzzy Set.<br/>
+Sparse General Type-2 fuzzy Set.<br/>
 Interval Type-2 Fuzzy Set.<br/>
 Type-1 Fuzzy Set.<br/>
 Z-Slice Type-2 Fuzzy Set.<br/>
+Dense Z-Slice Type-2 Fuzzy Set.<br/>
+Lazy Z-Slice Type-2 Fuzzy Set.<br/>
 Alpha-Cut Type-1 Fuzzy Set.<br/>
 Crisp Sets.<br/>
+Crisp Set Arrays.<br/>
+Embedded Type-2 Fuzzy Sets.<br/>
 Generation of Interval Type-2 Fuzzy Sets.<br/>
 Generation of General Type-2 Fuzzy Sets.<br/>
 """
@@ -18,16 +24,24 @@ from type2fuzzy.membership.type1_fuzzyset import Type1FuzzySetException
 from type2fuzzy.membership.type1_fuzzyvariable import Type1FuzzyVariable
 from type2fuzzy.membership.type1_fuzzyset_creation import create_triangular_set
 from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.densegeneraltype2fuzzyset import DenseGeneralType2FuzzySet
+from type2fuzzy.membership.sparsegeneraltype2fuzzyset import SparseGeneralType2FuzzySet
 from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
 from type2fuzzy.membership.zslicetype2fuzzyset import ZSliceType2FuzzySet
+from type2fuzzy.membership.densezslicetype2fuzzyset import DenseZSliceType2FuzzySet
+from type2fuzzy.membership.lazyzslicetype2fuzzyset import LazyZSliceType2FuzzySet
 from type2fuzzy.membership.crispset import CrispSet
+from type2fuzzy.membership.crispsetarray import CrispSetArray
 from type2fuzzy.membership.alphacuttype1fuzzyset import AlphaCutType1FuzzySet
+from type2fuzzy.membership.embeddedtype2sets import EmbeddedType2FuzzySets
 from type2fuzzy.membership.generate_gt2mf import generate_gt2set_horizontal
 from type2fuzzy.membership.generate_it2fs import create_gaussian_fixed_sigma
 from type2fuzzy.membership.generate_it2fs import create_gaussian_fixed_mean
 
-__all__ = ['SecondaryMembershipFunction', 'GeneralType2FuzzySet',
+__all__ = ['SecondaryMembershipFunction', 'GeneralType2FuzzySet', 'DenseGeneralType2FuzzySet',
+			'SparseGeneralType2FuzzySet',
 			'Type1FuzzySet', 'Type1FuzzyVariable', 'Type1FuzzySetException', 'create_triangular_set',
-			'IntervalType2FuzzySet', 'IntervalType2FuzzySet', 'ZSliceType2FuzzySet', 
-			'CrispSet', 'AlphaCutType1FuzzySet', 'generate_gt2set_horizontal', 
+			'IntervalType2FuzzySet', 'IntervalType2FuzzySet', 'ZSliceType2FuzzySet', 'DenseZSliceType2FuzzySet',
+			'LazyZSliceType2FuzzySet',
+			'CrispSet', 'CrispSetArray', 'AlphaCutType1FuzzySet', 'EmbeddedType2FuzzySets', 'generate_gt2set_horizontal', 
 			'create_gaussian_fixed_sigma', 'create_gaussian_fixed_mean']
@@ -1,51 +1,130 @@
 import numpy as np
+from type2fuzzy.membership.crispset import CrispSet
+from type2fuzzy.membership.crispsetarray import CrispSetArray
+from type2fuzzy.membership.set_persistence import save_arrays, load_arrays
+
+class AlphaCutType1FuzzySetException(Exception):
+	'''Alpha-Cut Type-1 Fuzzy Set Exception'''
+	def __init__(self, message):
+		super().__init__(message)
 
 class AlphaCutType1FuzzySet:
 
 	def __init__(self):
 		'''
-		datastructure defining an alpha-slice type-1 fuzzy set 
-		is a dictionary having an crisp set for every alpha-cut such as:
-		key: value of alpha-cut
-		value: corresponding crisp set
+		datastructure defining an alpha-slice type-1 fuzzy set
+		is a sorted array of alpha-cut values and a CrispSetArray
+		holding the limits of the crisp set at every alpha-cut
 		'''
-		self._set_definition={}
+		self._cuts = np.empty(0)
+		self._limits = CrispSetArray()
 		self._empty = True
 
 	def __getitem__(self, cut):
-		return self._set_definition[cut]
+		idx = self._cut_index(cut)
+
+		if idx is None:
+			raise AlphaCutType1FuzzySetException(f'alpha-cut value of {cut} not in this set.')
+
+		return self._limits[idx]
+
+	def _cut_index(self, cut):
+		'''
+		Finds the index of an alpha-cut by binary search,
+		returns None if the cut is not in the set
+		'''
+		idx = np.searchsorted(self._cuts, cut)
+
+		if idx == len(self._cuts) or self._cuts[idx] != cut:
+			return None
+
+		return idx
 
 	def alpha_slices(self):
-		return self._set_definition.keys()
+		return self.cuts()
+
+	@classmethod
+	def from_arrays(cls, cuts, left_vals, right_vals):
+		'''
+		Creates an alpha-cut type-1 fuzzy set from the limits at every cut.
+		Cuts having an empty crisp set (NaN limits) are not added
+
+		Arguments:
+		----------
+		cuts -- 1D array, the alpha-cut values
+		left_vals -- 1D array, the left limit at every cut
+		right_vals -- 1D array, the right limit at every cut
+
+		Returns:
+		--------
+		at1fs -- AlphaCutType1FuzzySet
+		'''
+		cuts = np.asarray(cuts, dtype=float)
+		limits = CrispSetArray(left_vals, right_vals)
+
+		if len(cuts) != len(limits):
+			raise AlphaCutType1FuzzySetException('Alpha-cut and limits size mismatch')
+
+		included = ~limits.empty
+		cuts = cuts[included]
+		limits = limits[included]
+
+		if np.any(np.diff(cuts) <= 0):
+			order = np.argsort(cuts, kind='stable')
+			cuts = cuts[order]
+			limits = limits[order]
+			if np.any(np.diff(cuts) == 0):
+				raise AlphaCutType1FuzzySetException('Duplicate alpha-cut value')
+
+		at1fs = cls()
+		at1fs._cuts = cuts
+		at1fs._limits = limits
+		at1fs._empty = len(cuts) == 0
+
+		return at1fs
 
 	@classmethod
 	def from_type1fuzzyset(cls, t1fs, number_of_cuts):
 		'''
-		Converts a Type-1 Fuzzy Set into the union of slices
+		Converts a Type-1 Fuzzy Set into the union of slices.
+		The degrees of membership are sorted once in descending order,
+		so that the elements included in a cut are a prefix of the sorted
+		elements and the limits of every cut are read from the running
+		minimum and maximum of the domain values
 
 		Arguments:
 		----------
 		t1fs -- Type1FuzzySet, the set to convert
 		number_of_cuts -- the number of alpha slices
 		'''
-		
-		at1fs = cls()
-		
-		delta = 1 / number_of_cuts
 		precision = len(str(number_of_cuts))
 
-		limits = None
 		# TODO: go back to other version?
-		#for cut in np.linspace(delta, 1, number_of_cuts):
-		for cut in np.linspace(0, 1, number_of_cuts):
-			
-			cut = round(cut, precision)
-			limits = t1fs.alpha_cut(cut)
-			
-			if not limits.empty:
-				at1fs.add_element(cut, limits)
-		
-		return at1fs
+		#cuts = np.linspace(1 / number_of_cuts, 1, number_of_cuts)
+		cuts = np.unique(np.round(np.linspace(0, 1, number_of_cuts), precision))
+
+		if hasattr(t1fs, 'domain_elements'):
+			domain = np.asarray(t1fs.domain_elements(), dtype=float)
+			doms = np.asarray(t1fs.degree_of_membership(), dtype=float)
+		else:
+			# index based sets are defined on the element indices
+			doms = np.asarray(t1fs.elements(), dtype=float)
+			domain = np.arange(len(doms), dtype=float)
+
+		order = np.argsort(-doms, kind='stable')
+		sorted_doms = doms[order]
+		running_min = np.minimum.accumulate(domain[order])
+		running_max = np.maximum.accumulate(domain[order])
+
+		# number of elements with a degree of membership >= cut, or > 0 for the 0 cut
+		ascending_doms = sorted_doms[::-1]
+		included_count = len(doms) - np.searchsorted(ascending_doms, cuts, side='left')
+		included_count[cuts == 0] = np.count_nonzero(doms > 0)
+
+		non_empty = included_count > 0
+		last_idx = included_count[non_empty] - 1
+
+		return cls.from_arrays(cuts[non_empty], running_min[last_idx], running_max[last_idx])
 
 	@property
 	def empty(self):
@@ -57,30 +136,99 @@ class AlphaCutType1FuzzySet:
 	def add_element(self, alpha_cut, limits):
 		'''
 		'''
-		if not limits.empty:
-			self._set_definition[alpha_cut] = limits
-			self._empty = False
+		if limits.empty:
+			return
+
+		idx = self._cut_index(alpha_cut)
+
+		if idx is not None:
+			left_vals = self._limits.left.copy()
+			right_vals = self._limits.right.copy()
+			left_vals[idx] = limits.left
+			right_vals[idx] = limits.right
+		else:
+			# insert at the position that keeps the cuts sorted
+			idx = np.searchsorted(self._cuts, alpha_cut)
+			self._cuts = np.insert(self._cuts, idx, alpha_cut)
+			left_vals = np.insert(self._limits.left, idx, limits.left)
+			right_vals = np.insert(self._limits.right, idx, limits.right)
+
+		self._limits = CrispSetArray(left_vals, right_vals)
+		self._empty = False
 
 	def cuts(self):
 		'''
 		returns the alpha-cuts that make this set
 		'''
-		return self._set_definition.keys()
+		return self._cuts.tolist()
+
+	def limits(self):
+		'''
+		returns the crisp sets at every alpha-cut as a CrispSetArray
+		'''
+		return self._limits
+
+	def to_array(self):
+		'''
+		returns the alpha-cut values and the left and right limits at
+		every cut as read-only arrays
+		'''
+		cuts = self._cuts.view()
+		cuts.flags.writeable = False
+
+		return cuts, self._limits.left, self._limits.right
+
+	def save_npz(self, set_filename):
+		'''
+		Saves the alpha-cut values and the limits at every cut as raw float
+		arrays in an uncompressed .npz file
+
+		Arguments:
+		----------
+		set_filename -- string, the name of the file, used as given
+
+		Raises:
+		-------
+		SetPersistenceException -- if the file cannot be written
+		'''
+		save_arrays(set_filename, self.__class__.__name__,
+					cuts=self._cuts, left=self._limits.left, right=self._limits.right)
+
+	@classmethod
+	def load_npz(cls, set_filename, mmap_mode=None):
+		'''
+		Loads an alpha-cut type-1 fuzzy set saved by save_npz
+
+		Arguments:
+		----------
+		set_filename -- string, the name of the file
+		mmap_mode -- None, 'r', 'r+' or 'c', memory maps the arrays as in numpy.load
+
+		Returns:
+		--------
+		at1fs -- AlphaCutType1FuzzySet
+
+		Raises:
+		-------
+		SetPersistenceException -- if the file cannot be read or does not hold
+					an alpha-cut type-1 fuzzy set
+		'''
+		return cls.from_arrays(*load_arrays(set_filename, cls.__name__, ('cuts', 'left', 'right'), mmap_mode))
 
 	def __str__(self):
 		'''
 		returns a string representation of the alpha-cut type-1 fuzzy set in the form:
-		
+
 		alpha-cut_value_1: [left_limit_1, right_limit_1]
 		...
 		alpha-cut_value_n: [left_limit_n, right_limit_n]
 
 		'''
 		representation = []
-		for alpha_cut in self._set_definition.keys():
-			representation.append(f'{alpha_cut} : {self._set_definition[alpha_cut]}')
-		
+		for alpha_cut, left, right in zip(self._cuts.tolist(), self._limits.left.tolist(), self._limits.right.tolist()):
+			representation.append(f'{alpha_cut} : {CrispSet(left, right)}')
+
 		return '\n'.join(representation)
 
 	def __repr__(self):
-		return f'{self.__class__.__name__}(str(self))'
\ No newline at end of file
+		return f'{self.__class__.__name__}(str(self))'
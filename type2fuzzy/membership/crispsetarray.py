@@ -0,0 +1,205 @@
+'''Crisp set array implementation'''
+import numpy as np
+from type2fuzzy.membership.crispset import CrispSet
+
+class CrispSetArrayException(Exception):
+    '''Crisp set array exception'''
+
+    def __init__(self, message):
+        super().__init__(message)
+
+class CrispSetArray:
+    '''
+    Implements a batch of N crisp sets (intervals) as a structure of arrays;
+    an array of left limits, an array of right limits and a mask of
+    the empty sets. The limits of an empty set are stored as NaN.
+    '''
+    def __init__(self, left_vals=None, right_vals=None):
+        '''
+        Creates a crisp set array. A NaN in either limit marks an empty set
+
+        Arguments:
+        ----------
+        left_vals -- 1D array, the values of the left limits
+        right_vals -- 1D array, the values of the right limits
+
+        Raises:
+        -------
+        CrispSetArrayException if the two arrays do not have the same size or
+        if a left limit is greater than the corresponding right limit
+        '''
+        left_vals = np.asarray([] if left_vals is None else left_vals, dtype=float)
+        right_vals = np.asarray([] if right_vals is None else right_vals, dtype=float)
+
+        if left_vals.shape != right_vals.shape or left_vals.ndim != 1:
+            raise CrispSetArrayException('ERROR: left and right limits must be 1D arrays of the same size')
+
+        empty = np.isnan(left_vals) | np.isnan(right_vals)
+
+        if np.any(left_vals[~empty] > right_vals[~empty]):
+            raise CrispSetArrayException('ERROR: Incorrect crisp set limits. Left')
+
+        if np.any(empty):
+            left_vals = np.where(empty, np.nan, left_vals)
+            right_vals = np.where(empty, np.nan, right_vals)
+
+        self._left_vals = left_vals
+        self._right_vals = right_vals
+        self._empty = empty
+        self._precision = 5
+
+    @classmethod
+    def from_crispsets(cls, crisp_sets)->'CrispSetArray':
+        '''
+        Creates a crisp set array from a list of crisp sets
+
+        Arguments:
+        ----------
+        crisp_sets -- list of CrispSet
+
+        Returns:
+        --------
+        crisp_set_array -- CrispSetArray
+        '''
+        left_vals = [np.nan if crisp_set.empty else crisp_set.left for crisp_set in crisp_sets]
+        right_vals = [np.nan if crisp_set.empty else crisp_set.right for crisp_set in crisp_sets]
+
+        return cls(left_vals, right_vals)
+
+    def to_crispsets(self)->list:
+        '''
+        Returns the crisp sets in this array as a list of CrispSet
+        '''
+        return [self[idx] for idx in range(len(self))]
+
+    def __len__(self)->int:
+        return len(self._left_vals)
+
+    def __getitem__(self, idx):
+        '''
+        Returns the crisp set at index idx as a CrispSet,
+        or a CrispSetArray if idx is a slice or an index array
+        '''
+        if np.ndim(idx) == 0 and not isinstance(idx, slice):
+            if self._empty[idx]:
+                return CrispSet()
+            return CrispSet(float(self._left_vals[idx]), float(self._right_vals[idx]))
+
+        return CrispSetArray(self._left_vals[idx], self._right_vals[idx])
+
+    @staticmethod
+    def _read_only(array:np.ndarray)->np.ndarray:
+        '''returns a read-only view of array'''
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def empty(self)->np.ndarray:
+        '''
+        Returns a boolean array, True where the set is empty
+        '''
+        return self._read_only(self._empty)
+
+    @property
+    def left(self)->np.ndarray:
+        '''
+        Returns the left limits of the sets, NaN for empty sets
+        '''
+        return self._read_only(self._left_vals)
+
+    @property
+    def right(self)->np.ndarray:
+        '''
+        Returns the right limits of the sets, NaN for empty sets
+        '''
+        return self._read_only(self._right_vals)
+
+    @property
+    def mid(self)->np.ndarray:
+        '''
+        Computes the mid points of the crisp sets
+
+        Returns:
+        --------
+        mid_points -- 1D array, the crisp set mid points
+
+        Raises:
+        -------
+        CrispSetArrayException if any of the sets is empty
+        '''
+        if np.any(self._empty):
+            raise CrispSetArrayException('ERROR: Mid point cannot be found for an empty set.')
+
+        return (self._left_vals + self._right_vals) / 2
+
+    @property
+    def width(self)->np.ndarray:
+        '''
+        Computes the widths of the crisp sets
+
+        Returns:
+        --------
+        widths -- 1D array, the crisp set widths
+
+        Raises:
+        -------
+        CrispSetArrayException if any of the sets is empty
+        '''
+        if np.any(self._empty):
+            raise CrispSetArrayException('ERROR: Width cannot be found for an empty set.')
+
+        return self._right_vals - self._left_vals
+
+    def union(self, crisp_set_array:'CrispSetArray')->'CrispSetArray':
+        '''
+        performs the union operation between the corresponding crisp sets
+        of two crisp set arrays. The union of an empty set with another
+        set is the other set
+
+        Returns:
+        --------
+        crisp_set_array -- CrispSetArray, the resulting crisp sets
+        '''
+        if len(self) != len(crisp_set_array):
+            raise CrispSetArrayException('ERROR: crisp set arrays must have the same size')
+
+        return CrispSetArray(
+            np.fmin(self._left_vals, crisp_set_array.left),
+            np.fmax(self._right_vals, crisp_set_array.right))
+
+    def contains(self, values)->np.ndarray:
+        '''
+        Checks whether each value is included in the corresponding crisp set
+
+        Arguments:
+        ----------
+        values -- float or 1D array, the values to check
+
+        Returns:
+        --------
+        included -- 1D boolean array, False for the empty sets
+        '''
+        # comparisons with the NaN limits of empty sets are False
+        values = np.asarray(values, dtype=float)
+        return (self._left_vals <= values) & (values <= self._right_vals)
+
+    def __str__(self)->str:
+
+        dec_places_formatter = f'%0.{self._precision}f'
+        representation = []
+
+        for left_val, right_val, empty in zip(
+                self._left_vals.tolist(), self._right_vals.tolist(), self._empty.tolist()):
+            if empty:
+                representation.append('[]')
+            elif left_val == right_val:
+                representation.append(f'[{dec_places_formatter % left_val}]')
+            else:
+                representation.append(
+                    f'[{dec_places_formatter % left_val}, {dec_places_formatter % right_val}]')
+
+        return '\n'.join(representation)
+
+    def __repr__(self)->str:
+        return f'{self.__class__.__name__}({len(self)} sets)'
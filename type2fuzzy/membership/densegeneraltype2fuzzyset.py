@@ -0,0 +1,449 @@
+'''
+Dense General Type-2 Fuzzy Set
+contains the following classes:
+- DenseGeneralType2FuzzySet
+- DenseGeneralType2FuzzySetException
+'''
+import numpy as np
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.membership.resampling import RESAMPLING_METHODS, snap_max, interpolate_linear
+from type2fuzzy.membership.set_persistence import save_arrays, load_arrays
+from type2fuzzy.membership.zslicing import grid_z_slice_bounds
+
+
+class DenseGeneralType2FuzzySetException(Exception):
+    ''' Dense General Type-2 Fuzzy Set Exception '''
+    def __init__(self, message):
+        super().__init__(message)
+
+
+class DenseGeneralType2FuzzySet:
+    '''
+    A grid-backed implementation of a general type 2 fuzzy set.
+    As a data structure, the set is represented by
+    a sorted vector of primary domain values,
+    a sorted vector of secondary domain values and
+    a 2D array of secondary grades where the rows map to the values
+    of the secondary domain and the columns map to the values of the
+    primary domain, the same layout returned by
+    GeneralType2FuzzySet.to_array_explicit()
+
+    A secondary grade of 0 means that the (x, u) point is not part
+    of the set.
+    '''
+
+    def __init__(self, primary_domain, secondary_domain, set_array):
+        '''
+        Creates a dense general type-2 fuzzy set. The domains are sorted
+        if required, together with the corresponding rows and columns
+        of set_array
+
+        Arguments:
+        ----------
+        primary_domain -- 1D array containing the values of the primary domain
+        secondary_domain -- 1D array containing the values of the secondary domain
+        set_array -- 2D array containing the secondary grade values, rows map to the
+                    secondary domain, columns map to the primary domain
+
+        Raises:
+        -------
+        DenseGeneralType2FuzzySetException -- if there is a mismatch between the domain
+                    and set_array dimensions, or if the secondary domain or secondary
+                    grades are not in [0, 1]
+        '''
+        primary_domain = np.asarray(primary_domain, dtype=float)
+        secondary_domain = np.asarray(secondary_domain, dtype=float)
+        set_array = np.asarray(set_array, dtype=float)
+
+        if set_array.ndim != 2:
+            raise DenseGeneralType2FuzzySetException('Set array must be two dimensional')
+
+        (secondary_domain_size, primary_domain_size) = set_array.shape
+
+        if secondary_domain_size != len(secondary_domain):
+            raise DenseGeneralType2FuzzySetException('Secondary domain size mismatch')
+
+        if primary_domain_size != len(primary_domain):
+            raise DenseGeneralType2FuzzySetException('Primary domain size mismatch')
+
+        if np.any((secondary_domain < 0) | (secondary_domain > 1)):
+            raise DenseGeneralType2FuzzySetException('Invalid secondary domain value')
+
+        if np.any((set_array < 0) | (set_array > 1)):
+            raise DenseGeneralType2FuzzySetException('Invalid secondary grade value')
+
+        # sort the domains only if required so that sorted input is not copied
+        if np.any(np.diff(primary_domain) <= 0):
+            order = np.argsort(primary_domain, kind='stable')
+            primary_domain = primary_domain[order]
+            set_array = set_array[:, order]
+            if np.any(np.diff(primary_domain) == 0):
+                raise DenseGeneralType2FuzzySetException('Duplicate primary domain value')
+
+        if np.any(np.diff(secondary_domain) <= 0):
+            order = np.argsort(secondary_domain, kind='stable')
+            secondary_domain = secondary_domain[order]
+            set_array = set_array[order, :]
+            if np.any(np.diff(secondary_domain) == 0):
+                raise DenseGeneralType2FuzzySetException('Duplicate secondary domain value')
+
+        self._primary_domain = primary_domain
+        self._secondary_domain = secondary_domain
+        self._set_array = set_array
+
+    def __getitem__(self, primary_domain_val):
+        '''
+        For a given value of the primary domain,
+        return the secondary grades of the vertical slice
+
+        Arguments:
+        ----------
+        primary_domain_val -- value of primary domain
+
+        Returns:
+        --------
+        secondary_grades -- 1D array, secondary grades for each value of the
+                            secondary domain
+        '''
+        return self._set_array[:, self._primary_domain_index(primary_domain_val)]
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}('
+                f'primary_domain={len(self._primary_domain)}, '
+                f'secondary_domain={len(self._secondary_domain)})')
+
+    @classmethod
+    def from_array(cls, primary_domain, secondary_domain, set_array):
+        '''
+        Creates a dense general type-2 fuzzy set from an array representation
+        of the set, having the same arguments as GeneralType2FuzzySet.from_array
+
+        Arguments:
+        ----------
+        primary_domain -- list containing the values of the primary domain
+        secondary_domain -- list containing the values of the secondary domain
+        set_array -- 2D array containing the secondary grade values of the gt2fs
+
+        Returns:
+        --------
+        dgt2fs -- DenseGeneralType2FuzzySet
+        '''
+        return cls(primary_domain, secondary_domain, set_array)
+
+    @classmethod
+    def from_general_type2_set(cls, gt2fs):
+        '''
+        Creates a dense general type-2 fuzzy set from a general type-2 fuzzy set
+
+        Arguments:
+        ----------
+        gt2fs -- GeneralType2FuzzySet, the set to convert
+
+        Returns:
+        --------
+        dgt2fs -- DenseGeneralType2FuzzySet
+        '''
+        primary_domain, secondary_domain, set_array = gt2fs.to_array_explicit()
+        return cls(primary_domain, secondary_domain, set_array)
+
+    def _primary_domain_index(self, primary_domain_val):
+        '''
+        Finds the column of a primary domain value by binary search
+
+        Raises:
+        -------
+        DenseGeneralType2FuzzySetException -- if the value is not in the primary domain
+        '''
+        idx = np.searchsorted(self._primary_domain, primary_domain_val)
+
+        if idx == len(self._primary_domain) or self._primary_domain[idx] != primary_domain_val:
+            raise DenseGeneralType2FuzzySetException(
+                f'Primary domain value of {primary_domain_val} not in this set.')
+
+        return idx
+
+    def _check_same_grid(self, dgt2fs):
+        '''
+        Raises an exception if the two sets are not defined on the same grid
+        '''
+        if not (np.array_equal(self._primary_domain, dgt2fs._primary_domain)
+                and np.array_equal(self._secondary_domain, dgt2fs._secondary_domain)):
+            raise DenseGeneralType2FuzzySetException(
+                'Both sets must be defined on the same primary and secondary domains')
+
+    def primary_domain(self):
+        '''
+        The primary domain of this fuzzy set
+
+        Returns:
+        --------
+        primary_domain -- 1D array containing all the values in the primary domain
+        '''
+        return self._primary_domain
+
+    def secondary_domain(self):
+        '''
+        The secondary domain of this fuzzy set
+
+        Returns:
+        --------
+        secondary_domain -- 1D array containing all the values in the secondary domain
+        '''
+        return self._secondary_domain
+
+    def to_array_explicit(self):
+        '''
+        Returns the grid of this set, in the same form as
+        GeneralType2FuzzySet.to_array_explicit()
+
+        Returns:
+        --------
+        primary_domain -- 1D array containing all the values in the primary domain
+        secondary_domain -- 1D array containing all the values in the secondary domain
+        set_array -- 2D array containing the secondary grade for the corresponding
+                    primary/secondary combination
+        '''
+        return self._primary_domain, self._secondary_domain, self._set_array
+
+    def save_npz(self, set_filename):
+        '''
+        Saves the domains and the grid of secondary grades as raw float
+        arrays in an uncompressed .npz file
+
+        Arguments:
+        ----------
+        set_filename -- string, the name of the file, used as given
+
+        Raises:
+        -------
+        SetPersistenceException -- if the file cannot be written
+        '''
+        save_arrays(set_filename, self.__class__.__name__,
+                    primary_domain=self._primary_domain,
+                    secondary_domain=self._secondary_domain,
+                    set_array=self._set_array)
+
+    @classmethod
+    def load_npz(cls, set_filename, mmap_mode=None):
+        '''
+        Loads a dense general type-2 fuzzy set saved by save_npz.
+        A memory mapped grid is used as it is, without a copy
+
+        Arguments:
+        ----------
+        set_filename -- string, the name of the file
+        mmap_mode -- None, 'r', 'r+' or 'c', memory maps the grid as in numpy.load
+
+        Returns:
+        --------
+        dgt2fs -- DenseGeneralType2FuzzySet
+
+        Raises:
+        -------
+        SetPersistenceException -- if the file cannot be read or does not hold
+                    a dense general type-2 fuzzy set
+        '''
+        return cls(*load_arrays(
+            set_filename, cls.__name__, ('primary_domain', 'secondary_domain', 'set_array'), mmap_mode))
+
+    def resample(self, primary_domain, secondary_domain, method='max'):
+        '''
+        Resamples the set onto new primary and secondary domains
+
+        Arguments:
+        ----------
+        primary_domain -- 1D array containing all the values in the new primary domain
+        secondary_domain -- 1D array containing all the values in the new secondary domain
+        method -- 'max', every point is snapped to the nearest grid point and points
+                    on the same grid point keep the highest secondary grade, or
+                    'linear', the secondary grades are interpolated bilinearly and
+                    are 0 outside the domains of this set
+
+        Returns:
+        --------
+        dgt2fs -- DenseGeneralType2FuzzySet, the resampled set
+
+        Raises:
+        -------
+        DenseGeneralType2FuzzySetException -- if the method is not supported
+        '''
+        if method not in RESAMPLING_METHODS:
+            raise DenseGeneralType2FuzzySetException(f'Unsupported resampling method {method}')
+
+        if method == 'linear':
+            set_array = interpolate_linear(
+                self._primary_domain, self._secondary_domain, self._set_array,
+                primary_domain, secondary_domain)
+        else:
+            set_array = snap_max(
+                primary_domain, secondary_domain,
+                self._primary_domain, self._secondary_domain, self._set_array)
+
+        return DenseGeneralType2FuzzySet(primary_domain, secondary_domain, set_array)
+
+    def vertical_slice(self, primary_domain_val):
+        '''
+        For a given value of the primary domain,
+        returns the secondary grades of the vertical slice
+        as a view on the set grid
+
+        Reference:
+        ----------
+        J. M. Mendel and R. I. B. John, “Type-2 fuzzy sets made simple,” IEEE
+        Trans. Fuzzy Systems, vol. 10, no. 2, pp. 117–127, Apr. 2002.
+
+        Arguments:
+        ----------
+        primary_domain_val -- value of primary domain
+
+        Returns:
+        --------
+        vertical_slice -- 1D array, secondary grades for each value of the
+                            secondary domain
+        '''
+        return self[primary_domain_val]
+
+    def z_slice(self, slice_value):
+        '''
+        Creates the interval type-2 fuzzy set at level slice_value.
+        The bounds of every vertical slice are found at once from the
+        first and last secondary domain values whose grade reaches the level.
+        As in Type1FuzzySet.alpha_cut, a level of 0 includes the
+        non-zero secondary grades only
+
+        Arguments:
+        ----------
+        slice_value -- float, the z-level
+
+        Returns:
+        --------
+        sliced_set -- IntervalType2FuzzySet
+        '''
+        if slice_value == 0:
+            mask = self._set_array > 0
+        else:
+            mask = self._set_array >= slice_value
+
+        included = mask.any(axis=0)
+        mask = mask[:, included]
+
+        lower_idx = mask.argmax(axis=0)
+        upper_idx = len(self._secondary_domain) - 1 - mask[::-1, :].argmax(axis=0)
+
+        return IntervalType2FuzzySet.from_hmf_lmf(
+            self._primary_domain[included],
+            self._secondary_domain[upper_idx],
+            self._secondary_domain[lower_idx])
+
+    def secondary_grade_levels(self):
+        '''
+        Returns the sorted distinct non-zero secondary grades of this set,
+        the levels at which its z-slices change, so that slicing at these
+        levels represents the set exactly
+
+        Returns:
+        --------
+        z_vals -- 1D array, the sorted distinct non-zero secondary grades
+        '''
+        return np.unique(self._set_array[self._set_array > 0])
+
+    def z_slice_bounds(self, z_vals):
+        '''
+        Finds the bounds of the z-slices at all the given levels at once,
+        giving the same intervals as z_slice
+
+        Arguments:
+        ----------
+        z_vals -- 1D array, the z-levels
+
+        Returns:
+        --------
+        primary_domain -- 1D array, the sorted primary domain values
+        bounds -- 3D array of shape (len(z_vals), len(primary_domain), 2), the lower
+                    and upper bounds of every z-slice, NaN where a primary
+                    domain value is not part of a z-slice
+        '''
+        return self._primary_domain, grid_z_slice_bounds(self._secondary_domain, self._set_array, z_vals)
+
+    def union(self, dgt2fs):
+        '''
+        Union of two dense general type-2 fuzzy sets defined on the same grid.
+        Every vertical slice is joined using the maximum t-conorm and
+        minimum t-norm. On a sorted secondary domain the join at u is
+        max(min(f(u), max g(v <= u)), min(g(u), max f(v <= u)))
+        and is computed with cumulative maxima along the secondary axis
+
+        Reference:
+        ----------
+        N. N. Karnik and J. M. Mendel, "Operations on type-2 fuzzy sets,"
+        Fuzzy Sets and Systems, vol. 122, no. 2, pp. 327–348, 2001.
+
+        Arguments:
+        ----------
+        dgt2fs -- DenseGeneralType2FuzzySet, the other set
+
+        Returns:
+        --------
+        resultant_set -- DenseGeneralType2FuzzySet
+        '''
+        self._check_same_grid(dgt2fs)
+
+        set_a = self._set_array
+        set_b = dgt2fs._set_array
+        cum_max_a = np.maximum.accumulate(set_a, axis=0)
+        cum_max_b = np.maximum.accumulate(set_b, axis=0)
+
+        set_array = np.maximum(
+            np.minimum(set_a, cum_max_b),
+            np.minimum(set_b, cum_max_a))
+
+        return DenseGeneralType2FuzzySet(self._primary_domain, self._secondary_domain, set_array)
+
+    def intersection(self, dgt2fs):
+        '''
+        Intersection of two dense general type-2 fuzzy sets defined on the same grid.
+        Every vertical slice is met using the minimum t-norm.
+        On a sorted secondary domain the meet at u is
+        max(min(f(u), max g(v >= u)), min(g(u), max f(v >= u)))
+        and is computed with reversed cumulative maxima along the secondary axis
+
+        Reference:
+        ----------
+        N. N. Karnik and J. M. Mendel, "Operations on type-2 fuzzy sets,"
+        Fuzzy Sets and Systems, vol. 122, no. 2, pp. 327–348, 2001.
+
+        Arguments:
+        ----------
+        dgt2fs -- DenseGeneralType2FuzzySet, the other set
+
+        Returns:
+        --------
+        resultant_set -- DenseGeneralType2FuzzySet
+        '''
+        self._check_same_grid(dgt2fs)
+
+        set_a = self._set_array
+        set_b = dgt2fs._set_array
+        cum_max_a = np.maximum.accumulate(set_a[::-1, :], axis=0)[::-1, :]
+        cum_max_b = np.maximum.accumulate(set_b[::-1, :], axis=0)[::-1, :]
+
+        set_array = np.maximum(
+            np.minimum(set_a, cum_max_b),
+            np.minimum(set_b, cum_max_a))
+
+        return DenseGeneralType2FuzzySet(self._primary_domain, self._secondary_domain, set_array)
+
+    def complement(self):
+        '''
+        Finds the complement of the dense general type 2 fuzzy set.
+        The negation maps every secondary domain value u to 1-u, so the
+        secondary domain and the rows of the grid are reversed
+
+        Returns:
+        --------
+        resultant_set -- DenseGeneralType2FuzzySet
+        '''
+        return DenseGeneralType2FuzzySet(
+            self._primary_domain,
+            1 - self._secondary_domain[::-1],
+            self._set_array[::-1, :])
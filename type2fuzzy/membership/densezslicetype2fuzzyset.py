@@ -0,0 +1,377 @@
+'''
+Dense Z-Slice Type-2 Fuzzy Set
+contains the following classes:
+- DenseZSliceType2FuzzySet
+- DenseZSliceType2FuzzySetException
+'''
+import numpy as np
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.membership.zslicetype2fuzzyset import ZSliceType2FuzzySet
+from type2fuzzy.membership.set_persistence import save_arrays, load_arrays
+from type2fuzzy.membership.zslicing import Z_LEVELS, z_level_bounds
+
+
+class DenseZSliceType2FuzzySetException(Exception):
+    ''' Dense Z-Slice Type-2 Fuzzy Set Exception '''
+    def __init__(self, message):
+        super().__init__(message)
+
+
+class DenseZSliceType2FuzzySet:
+    '''
+    A compact implementation of a z-slice type-2 fuzzy set.
+    As a data structure, the set is represented by
+    a sorted vector of z-levels,
+    a sorted vector of primary domain values and
+    a (n_z, n_x, 2) array holding the lower ([..., 0]) and upper ([..., 1])
+    membership functions of the interval type-2 fuzzy set at every z-level.
+
+    A primary domain value that is not part of the z-slice at a level
+    has NaN bounds at that level.
+    '''
+
+    def __init__(self, zslices, primary_domain, bounds):
+        '''
+        Creates a dense z-slice type-2 fuzzy set
+
+        Arguments:
+        ----------
+        zslices -- 1D array, the sorted z-levels
+        primary_domain -- 1D array, the sorted primary domain values
+        bounds -- 3D array of shape (len(zslices), len(primary_domain), 2), the
+                    lower and upper membership functions at every z-level
+
+        Raises:
+        -------
+        DenseZSliceType2FuzzySetException -- if the dimensions do not match, if
+                    the domains are not sorted or if the bounds are invalid
+        '''
+        zslices = np.asarray(zslices, dtype=float)
+        primary_domain = np.asarray(primary_domain, dtype=float)
+        bounds = np.asarray(bounds, dtype=float)
+
+        if bounds.ndim != 3 or bounds.shape[2] != 2:
+            raise DenseZSliceType2FuzzySetException('Bounds must have a shape of (n_z, n_x, 2)')
+
+        if bounds.shape[0] != len(zslices):
+            raise DenseZSliceType2FuzzySetException('Z-slice size mismatch')
+
+        if bounds.shape[1] != len(primary_domain):
+            raise DenseZSliceType2FuzzySetException('Primary domain size mismatch')
+
+        if np.any(np.diff(zslices) <= 0) or np.any((zslices < 0) | (zslices > 1)):
+            raise DenseZSliceType2FuzzySetException('Z-slices must be sorted, unique and in [0, 1]')
+
+        if np.any(np.diff(primary_domain) <= 0):
+            raise DenseZSliceType2FuzzySetException('Primary domain must be sorted and unique')
+
+        lower = bounds[..., 0]
+        upper = bounds[..., 1]
+
+        if np.any(np.isnan(lower) != np.isnan(upper)):
+            raise DenseZSliceType2FuzzySetException('Lower and upper bounds must be NaN together')
+
+        # comparisons with NaN bounds are False
+        if np.any(lower > upper) or np.any((lower < 0) | (upper > 1)):
+            raise DenseZSliceType2FuzzySetException('Invalid bounds')
+
+        self._zslices = zslices
+        self._primary_domain = primary_domain
+        self._bounds = bounds
+
+    @classmethod
+    def from_zslice_type2_set(cls, zt2fs):
+        '''
+        Creates a dense z-slice type-2 fuzzy set from a z-slice type-2 fuzzy set.
+        The primary domain is the union of the primary domains of all the slices
+
+        Arguments:
+        ----------
+        zt2fs -- ZSliceType2FuzzySet, the set to convert
+
+        Returns:
+        --------
+        dzt2fs -- DenseZSliceType2FuzzySet
+        '''
+        zslices = sorted(zt2fs.zslices())
+        slices = [zt2fs[zslice] for zslice in zslices]
+
+        if slices:
+            primary_domain = np.unique(np.concatenate(
+                [it2fs.primary_domain() for it2fs in slices]))
+        else:
+            primary_domain = np.empty(0)
+
+        bounds = np.full((len(zslices), len(primary_domain), 2), np.nan)
+
+        for z_idx, it2fs in enumerate(slices):
+            x_idx = np.searchsorted(primary_domain, it2fs.primary_domain())
+            bounds[z_idx, x_idx, 0] = it2fs.lower_membership_function()
+            bounds[z_idx, x_idx, 1] = it2fs.higher_membership_function()
+
+        return cls(zslices, primary_domain, bounds)
+
+    @classmethod
+    def from_general_type2_set(cls, gt2fs, no_slices=None, levels='uniform'):
+        '''
+        Creates a dense z-slice type-2 fuzzy set from a general type-2 fuzzy set,
+        slicing at the same levels as ZSliceType2FuzzySet.from_general_type2_set.
+        The bounds tensor of all the levels is found at once by gt2fs.z_slice_bounds
+
+        Arguments:
+        ----------
+        gt2fs -- GeneralType2FuzzySet, DenseGeneralType2FuzzySet or
+                    SparseGeneralType2FuzzySet, the set to slice
+        no_slices -- int, the number of slices, unused by 'exact'
+        levels -- 'uniform', 'exact' or 'adaptive', as in
+                    ZSliceType2FuzzySet.from_general_type2_set
+
+        Returns:
+        --------
+        dzt2fs -- DenseZSliceType2FuzzySet
+
+        Raises:
+        -------
+        DenseZSliceType2FuzzySetException -- if the levels are not supported or
+                    if no_slices is missing
+        '''
+        if levels not in Z_LEVELS:
+            raise DenseZSliceType2FuzzySetException(f'Unsupported z-levels {levels}')
+
+        if no_slices is None and levels != 'exact':
+            raise DenseZSliceType2FuzzySetException(f'The number of slices is required by {levels} z-levels')
+
+        z_vals, primary_domain, bounds = z_level_bounds(gt2fs, no_slices, levels)
+        included = np.any(~np.isnan(bounds[..., 0]), axis=1)
+
+        return cls(z_vals[included], primary_domain, bounds[included])
+
+    def to_zslice_type2_set(self):
+        '''
+        Converts this set to a ZSliceType2FuzzySet
+
+        Returns:
+        --------
+        zt2fs -- ZSliceType2FuzzySet
+        '''
+        zt2fs = ZSliceType2FuzzySet()
+
+        for z_idx, z_val in enumerate(self._zslices.tolist()):
+            it2fs = self._slice(z_idx)
+            if not it2fs.empty:
+                zt2fs.add_element(z_val, it2fs)
+                zt2fs._empty = False
+
+        return zt2fs
+
+    @property
+    def empty(self):
+        '''
+        Returns True if none of the slices contains a primary domain value
+        '''
+        return not np.any(~np.isnan(self._bounds[..., 0]))
+
+    @staticmethod
+    def _read_only(array):
+        '''returns a read-only view of array'''
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def _zslice_index(self, z_slice_val):
+        '''
+        Finds the index of a z-level by binary search
+
+        Raises:
+        -------
+        DenseZSliceType2FuzzySetException -- if the level is not in the set
+        '''
+        idx = np.searchsorted(self._zslices, z_slice_val)
+
+        if idx == len(self._zslices) or self._zslices[idx] != z_slice_val:
+            raise DenseZSliceType2FuzzySetException(
+                f'z-slice value of {z_slice_val} not in this set.')
+
+        return idx
+
+    def _slice(self, z_idx):
+        '''
+        Creates the interval type-2 fuzzy set at the z-level with index z_idx.
+        If every primary domain value is included, the membership functions
+        of the set are views on the bounds array
+        '''
+        lower = self._bounds[z_idx, :, 0]
+        upper = self._bounds[z_idx, :, 1]
+        included = ~np.isnan(lower)
+
+        if np.all(included):
+            return IntervalType2FuzzySet.from_hmf_lmf(self._primary_domain, upper, lower)
+
+        return IntervalType2FuzzySet.from_hmf_lmf(
+            self._primary_domain[included], upper[included], lower[included])
+
+    def __getitem__(self, z_slice_val):
+        '''
+        For a given z-slice value,
+        return the corresponding interval type-2 set
+
+        Arguments:
+        ----------
+        z_slice_val -- value of z-slice
+
+        Returns:
+        --------
+        it2fs - corresponding interval type-2 set
+        '''
+        return self._slice(self._zslice_index(z_slice_val))
+
+    def zslices(self):
+        '''
+        returns the z-levels of this set as a read-only array
+        '''
+        return self._read_only(self._zslices)
+
+    def primary_domain(self):
+        '''
+        returns the primary domain of this set as a read-only array
+        '''
+        return self._read_only(self._primary_domain)
+
+    def to_array(self):
+        '''
+        Returns the tensor representation of this set as read-only arrays
+
+        Returns:
+        --------
+        zslices -- 1D array, the z-levels
+        primary_domain -- 1D array, the primary domain values
+        bounds -- 3D array of shape (n_z, n_x, 2), the lower and upper
+                    membership functions, NaN where a value is not in a slice
+        '''
+        return self.zslices(), self.primary_domain(), self._read_only(self._bounds)
+
+    def save_npz(self, set_filename):
+        '''
+        Saves the z-levels, the primary domain and the bounds tensor as raw
+        float arrays in an uncompressed .npz file
+
+        Arguments:
+        ----------
+        set_filename -- string, the name of the file, used as given
+
+        Raises:
+        -------
+        SetPersistenceException -- if the file cannot be written
+        '''
+        save_arrays(set_filename, self.__class__.__name__,
+                    zslices=self._zslices, primary_domain=self._primary_domain, bounds=self._bounds)
+
+    @classmethod
+    def load_npz(cls, set_filename, mmap_mode=None):
+        '''
+        Loads a dense z-slice type-2 fuzzy set saved by save_npz.
+        A memory mapped bounds tensor is used as it is, without a copy
+
+        Arguments:
+        ----------
+        set_filename -- string, the name of the file
+        mmap_mode -- None, 'r', 'r+' or 'c', memory maps the tensor as in numpy.load
+
+        Returns:
+        --------
+        dzt2fs -- DenseZSliceType2FuzzySet
+
+        Raises:
+        -------
+        SetPersistenceException -- if the file cannot be read or does not hold
+                    a dense z-slice type-2 fuzzy set
+        '''
+        return cls(*load_arrays(
+            set_filename, cls.__name__, ('zslices', 'primary_domain', 'bounds'), mmap_mode))
+
+    def _check_same_grid(self, dzt2fs):
+        '''
+        Raises an exception if the two sets are not defined on the same
+        z-levels and primary domain
+        '''
+        if not (np.array_equal(self._zslices, dzt2fs._zslices)
+                and np.array_equal(self._primary_domain, dzt2fs._primary_domain)):
+            raise DenseZSliceType2FuzzySetException(
+                'Both sets must be defined on the same z-slices and primary domain')
+
+    def union(self, dzt2fs):
+        '''
+        Union of two dense z-slice type-2 fuzzy sets defined on the same
+        z-levels and primary domain. The interval sets at every level are
+        joined using the maximum t-conorm. A value missing from one slice
+        takes the bounds of the other
+
+        Reference:
+        ----------
+        C. Wagner and H. Hagras, "Toward general type-2 fuzzy logic systems
+        based on zSlices," IEEE Trans. Fuzzy Systems, vol. 18, no. 4,
+        pp. 637–660, 2010.
+
+        Arguments:
+        ----------
+        dzt2fs -- DenseZSliceType2FuzzySet, the other set
+
+        Returns:
+        --------
+        resultant_set -- DenseZSliceType2FuzzySet
+        '''
+        self._check_same_grid(dzt2fs)
+
+        return DenseZSliceType2FuzzySet(
+            self._zslices, self._primary_domain, np.fmax(self._bounds, dzt2fs._bounds))
+
+    def intersection(self, dzt2fs):
+        '''
+        Intersection of two dense z-slice type-2 fuzzy sets defined on the same
+        z-levels and primary domain. The interval sets at every level are
+        met using the minimum t-norm. A value missing from either slice
+        is missing from the result
+
+        Reference:
+        ----------
+        C. Wagner and H. Hagras, "Toward general type-2 fuzzy logic systems
+        based on zSlices," IEEE Trans. Fuzzy Systems, vol. 18, no. 4,
+        pp. 637–660, 2010.
+
+        Arguments:
+        ----------
+        dzt2fs -- DenseZSliceType2FuzzySet, the other set
+
+        Returns:
+        --------
+        resultant_set -- DenseZSliceType2FuzzySet
+        '''
+        self._check_same_grid(dzt2fs)
+
+        return DenseZSliceType2FuzzySet(
+            self._zslices, self._primary_domain, np.minimum(self._bounds, dzt2fs._bounds))
+
+    def complement(self):
+        '''
+        Finds the complement of the dense z-slice type-2 fuzzy set.
+        The interval [l, u] at every level becomes [1-u, 1-l]
+
+        Returns:
+        --------
+        resultant_set -- DenseZSliceType2FuzzySet
+        '''
+        return DenseZSliceType2FuzzySet(
+            self._zslices, self._primary_domain, 1 - self._bounds[..., ::-1])
+
+    def __str__(self):
+        representation = []
+
+        for z_idx, z_val in enumerate(self._zslices.tolist()):
+            representation.append(f'slice {z_val}:\n {self._slice(z_idx)}')
+
+        return '\n'.join(representation)
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}('
+                f'zslices={len(self._zslices)}, '
+                f'primary_domain={len(self._primary_domain)})')
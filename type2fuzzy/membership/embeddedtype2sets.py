@@ -0,0 +1,319 @@
+'''
+Embedded Type-2 Fuzzy Sets
+contains the following classes:
+- EmbeddedType2FuzzySets
+- EmbeddedType2FuzzySetsException
+'''
+import heapq
+import math
+import numpy as np
+
+
+class EmbeddedType2FuzzySetsException(Exception):
+    ''' Embedded Type-2 Fuzzy Sets Exception '''
+    def __init__(self, message):
+        super().__init__(message)
+
+
+class EmbeddedType2FuzzySets:
+    '''
+    A lazy sequence of the embedded type-2 fuzzy sets of a general type-2
+    fuzzy set. An embedded set takes one point from every vertical slice,
+    so that the k-th embedded set is found by writing k in the mixed radix
+    of the number of points of every slice, the last slice varying fastest,
+    in the order given by itertools.product over the points of the slices.
+    The points of the vertical slices are stored compressed:
+    primary_domain -- the primary domain value of every vertical slice
+    indptr -- the points of the vertical slice at primary_domain[i]
+                are stored at positions indptr[i]:indptr[i+1]
+    secondary_domain_vals -- the secondary domain value of every point
+    secondary_grades -- the secondary grade of every point
+
+    Reference:
+    ----------
+    J. M. Mendel and R. I. B. John, “Type-2 fuzzy sets made simple,” IEEE
+    Trans. Fuzzy Systems, vol. 10, no. 2, pp. 117–127, Apr. 2002.
+    '''
+
+    def __init__(self, primary_domain, indptr, secondary_domain_vals, secondary_grades):
+        '''
+        Creates the sequence of the embedded sets of the given vertical slices
+
+        Arguments:
+        ----------
+        primary_domain -- 1D array, the primary domain value of every vertical slice
+        indptr -- 1D int array of length len(primary_domain) + 1
+        secondary_domain_vals -- 1D array, the secondary domain value of every point
+        secondary_grades -- 1D array, the secondary grade of every point
+
+        Raises:
+        -------
+        EmbeddedType2FuzzySetsException -- if the sizes do not match
+        '''
+        self._primary_domain = np.asarray(primary_domain, dtype=float)
+        self._indptr = np.asarray(indptr, dtype=np.intp)
+        self._secondary_domain_vals = np.asarray(secondary_domain_vals, dtype=float)
+        self._secondary_grades = np.asarray(secondary_grades, dtype=float)
+
+        if len(self._indptr) != len(self._primary_domain) + 1:
+            raise EmbeddedType2FuzzySetsException('Primary domain size mismatch')
+
+        if (len(self._secondary_domain_vals) != len(self._secondary_grades)
+                or self._indptr[-1] != len(self._secondary_grades)):
+            raise EmbeddedType2FuzzySetsException('Number of points mismatch')
+
+        self._radices = np.diff(self._indptr)
+        # exact, a python int does not overflow
+        self._count = math.prod(self._radices.tolist())
+
+    @classmethod
+    def from_vertical_slices(cls, vertical_slices):
+        '''
+        Creates the sequence from a list of vertical slices
+
+        Arguments:
+        ----------
+        vertical_slices -- list of (primary_domain_val, secondary_domain_vals,
+                        secondary_grades), the points of every vertical slice
+
+        Returns:
+        --------
+        embedded_sets -- EmbeddedType2FuzzySets
+        '''
+        indptr = np.zeros(len(vertical_slices) + 1, dtype=np.intp)
+        indptr[1:] = np.cumsum([len(secondary_grades) for _, _, secondary_grades in vertical_slices], dtype=np.intp)
+
+        return cls([primary_domain_val for primary_domain_val, _, _ in vertical_slices], indptr,
+                    [val for _, secondary_domain_vals, _ in vertical_slices for val in secondary_domain_vals],
+                    [val for _, _, secondary_grades in vertical_slices for val in secondary_grades])
+
+    @property
+    def count(self):
+        '''
+        The number of embedded sets as an exact int, that, unlike len(),
+        is not limited to sys.maxsize
+        '''
+        return self._count
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}('
+                f'primary_domain={len(self._primary_domain)}, '
+                f'count={self._count})')
+
+    def _check_index(self, k):
+        '''returns k as a non negative index, supporting negative indices'''
+        k = int(k)
+        if k < 0:
+            k += self._count
+
+        if not 0 <= k < self._count:
+            raise IndexError(f'embedded set index out of range, there are {self._count} embedded sets')
+
+        return k
+
+    def indices(self, k):
+        '''
+        Finds the point chosen from every vertical slice by the k-th embedded set,
+        by mixed radix decoding of k in O(n) for n vertical slices
+
+        Arguments:
+        ----------
+        k -- int, the index of the embedded set, may be negative
+
+        Returns:
+        --------
+        point_indices -- 1D int array, the index of the chosen point within every slice
+
+        Raises:
+        -------
+        IndexError -- if k is out of range
+        '''
+        k = self._check_index(k)
+
+        point_indices = np.empty(len(self._radices), dtype=np.intp)
+        for slice_idx in range(len(self._radices) - 1, -1, -1):
+            k, point_indices[slice_idx] = divmod(k, int(self._radices[slice_idx]))
+
+        return point_indices
+
+    def __getitem__(self, k):
+        '''
+        Returns the k-th embedded set, in the form returned by
+        GeneralType2FuzzySet.embedded_type2_sets
+        [(sec_grade_1, sec_domain_1, pri_domain_1), ... , (sec_grade_n, sec_domain_n, pri_domain_n)]
+        '''
+        positions = self._indptr[:-1] + self.indices(k)
+
+        return list(zip(self._secondary_grades[positions].tolist(),
+                        self._secondary_domain_vals[positions].tolist(),
+                        self._primary_domain.tolist()))
+
+    def __iter__(self):
+        for secondary_grades, secondary_domain_vals in self.iter_chunks():
+            for grades, domain_vals in zip(secondary_grades.tolist(), secondary_domain_vals.tolist()):
+                yield list(zip(grades, domain_vals, self._primary_domain.tolist()))
+
+    def _chunk_positions(self, start, size):
+        '''
+        Returns the positions of the points of the embedded sets start
+        to start+size-1, as a (size, n) array. The digits of start are
+        decoded once and the offsets are added with a vectorized carry
+        '''
+        carry = np.arange(size, dtype=np.int64)
+        positions = np.empty((size, len(self._radices)), dtype=np.intp)
+
+        start_indices = self.indices(start)
+        for slice_idx in range(len(self._radices) - 1, -1, -1):
+            carry, positions[:, slice_idx] = np.divmod(
+                start_indices[slice_idx] + carry, self._radices[slice_idx])
+
+        return positions + self._indptr[:-1]
+
+    def iter_chunks(self, chunk_size=4096, start=0, stop=None):
+        '''
+        Iterates over the embedded sets start to stop-1 in chunks, so that
+        the space of embedded sets can be sharded without enumerating it
+
+        Arguments:
+        ----------
+        chunk_size -- int, the number of embedded sets in a chunk
+        start -- int, the index of the first embedded set
+        stop -- int, the index after the last embedded set, default count
+
+        Returns:
+        --------
+        generator of (secondary_grades, secondary_domain_vals), 2D arrays of
+        shape (chunk, n), row i holding the points of an embedded set
+        '''
+        stop = self._count if stop is None else min(stop, self._count)
+
+        while start < stop:
+            size = min(chunk_size, stop - start)
+            positions = self._chunk_positions(start, size)
+            yield self._secondary_grades[positions], self._secondary_domain_vals[positions]
+            start += size
+
+    def sample(self, size, rng=None):
+        '''
+        Draws embedded sets uniformly at random, with replacement, by drawing
+        the point of every vertical slice independently
+
+        Arguments:
+        ----------
+        size -- int, the number of embedded sets
+        rng -- numpy.random.Generator, default a new default_rng()
+
+        Returns:
+        --------
+        secondary_grades -- 2D array of shape (size, n)
+        secondary_domain_vals -- 2D array of shape (size, n)
+        '''
+        if self._count == 0:
+            raise EmbeddedType2FuzzySetsException('There are no embedded sets to sample')
+
+        rng = np.random.default_rng() if rng is None else rng
+        positions = self._indptr[:-1] + rng.integers(0, self._radices, size=(size, len(self._radices)))
+
+        return self._secondary_grades[positions], self._secondary_domain_vals[positions]
+
+    def top_k(self, k):
+        '''
+        Finds the k embedded sets with the highest secondary grade, the
+        minimum secondary grade of their points, without enumerating the
+        embedded sets.
+        The points of every slice are sorted by descending secondary grade,
+        so that an embedded set is a vector of ranks. Lowering the point of
+        a slice never raises the secondary grade, and the vectors are
+        explored best first from the vector of the best points with a
+        priority queue. Every vector is reached from a single parent, by
+        lowering slices in ascending order, and every popped vector pushes
+        at most n children, in O(k n log(k n)) for n vertical slices
+
+        Arguments:
+        ----------
+        k -- int, the number of embedded sets
+
+        Returns:
+        --------
+        embedded_sets -- list of at most k embedded sets, by descending secondary
+                        grade, in the form of GeneralType2FuzzySet.embedded_type2_sets.
+                        Embedded sets with equal secondary grades are in no particular order
+
+        Raises:
+        -------
+        EmbeddedType2FuzzySetsException -- if k is negative
+        '''
+        if k < 0:
+            raise EmbeddedType2FuzzySetsException('The number of embedded sets must not be negative')
+
+        if k == 0 or self._count == 0:
+            return []
+
+        slice_count = len(self._radices)
+
+        # a set without vertical slices has a single embedded set, without points
+        if slice_count == 0:
+            return [[]]
+
+        slice_indices = np.repeat(np.arange(slice_count), self._radices)
+
+        # positions of the points of every slice by descending secondary grade,
+        # a row per slice padded with a grade of -1 past the last point
+        order = np.lexsort((-self._secondary_grades, slice_indices))
+        ranks = np.arange(len(order)) - self._indptr[slice_indices]
+        sorted_positions = np.zeros((slice_count, self._radices.max() + 1), dtype=np.intp)
+        sorted_positions[slice_indices, ranks] = order
+        sorted_grades = np.full(sorted_positions.shape, -1.0)
+        sorted_grades[slice_indices, ranks] = self._secondary_grades[order]
+
+        slice_range = np.arange(slice_count)
+        primary_domain = self._primary_domain.tolist()
+
+        embedded_sets = []
+        rank_vectors = []
+        # entries (-secondary grade, tie breaker, index of the parent vector, lowered slice)
+        queue = [(-sorted_grades[:, 0].min(), 0, -1, 0)]
+        pushed = 1
+
+        while queue and len(embedded_sets) < k:
+            _, _, parent, lowered_slice = heapq.heappop(queue)
+
+            if parent < 0:
+                rank_vector = np.zeros(slice_count, dtype=np.intp)
+            else:
+                rank_vector = rank_vectors[parent].copy()
+                rank_vector[lowered_slice] += 1
+            rank_vectors.append(rank_vector)
+
+            positions = sorted_positions[slice_range, rank_vector]
+            embedded_sets.append(list(zip(self._secondary_grades[positions].tolist(),
+                                        self._secondary_domain_vals[positions].tolist(),
+                                        primary_domain)))
+
+            # the minimum grade of the other slices, from prefix and suffix minima
+            grades = sorted_grades[slice_range, rank_vector]
+            others = np.full(slice_count + 1, np.inf)
+            others[1:] = np.minimum.accumulate(grades)
+            suffix = np.full(slice_count + 1, np.inf)
+            suffix[:-1] = np.minimum.accumulate(grades[::-1])[::-1]
+            others = np.minimum(others[:-1], suffix[1:])
+
+            next_grades = sorted_grades[slice_range, rank_vector + 1]
+            child_grades = np.minimum(others, next_grades)
+
+            # children lower the slices from the last lowered one on
+            for slice_idx in np.flatnonzero(next_grades[lowered_slice:] >= 0).tolist():
+                slice_idx += lowered_slice
+                heapq.heappush(queue, (-child_grades[slice_idx], pushed, len(rank_vectors) - 1, slice_idx))
+                pushed += 1
+
+        return embedded_sets
+
+    def primary_domain(self):
+        '''
+        returns the primary domain value of every vertical slice
+        '''
+        return self._primary_domain
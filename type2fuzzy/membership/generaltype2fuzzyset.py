@@ -1,8 +1,17 @@
-import itertools
 import numpy as np
 from type2fuzzy.membership.secondarymf import SecondaryMembershipFunction as smf
 from type2fuzzy.membership.generate_gt2mf import generate_gt2set_horizontal
 from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.membership.densegeneraltype2fuzzyset import DenseGeneralType2FuzzySet
+from type2fuzzy.membership.embeddedtype2sets import EmbeddedType2FuzzySets
+from type2fuzzy.membership.resampling import RESAMPLING_METHODS, snap_max, interpolate_linear
+from type2fuzzy.membership.representation_parser import parse_general_type2_representation
+from type2fuzzy.membership.representation_parser import iter_general_type2_slices, DEFAULT_CHUNK_SIZE
+from type2fuzzy.membership.representation_parser import RepresentationParserException
+from type2fuzzy.membership.representation_writer import general_type2_representation_blocks
+from type2fuzzy.membership.set_persistence import save_arrays, load_arrays
+from type2fuzzy.membership.zslicing import grid_z_slice_bounds
+from type2fuzzy.membership.secondary_operations import max_min_join, max_min_meet
 
 
 class GeneralType2FuzzySetException(Exception):
@@ -27,6 +36,7 @@ class GeneralType2FuzzySet:
         '''
         self.vertical_slices = {}
         self._precision = 4
+        self._array_cache = None
 
     def __getitem__(self, primary_domain_val):
         '''
@@ -83,28 +93,28 @@ class GeneralType2FuzzySet:
         --------
         set_representation -- string representation of gt2fs
         '''
-        represented_slices = []
-        dec_places_formatter = '''%0.{}f'''.format(self._precision)
+        return ''.join(self._representation_blocks(self._precision))
 
-        for primary_domain_val in self.primary_domain():
-            sec_domains = list(self.vertical_slice(primary_domain_val).domain_elements())
-            doms = list(self.vertical_slices[primary_domain_val].dom_elements())
-
-            def slice_rep_creation(sec_domains, doms):
-                return dec_places_formatter % (doms) +' / ' + dec_places_formatter % (sec_domains)
-
-            m = map(slice_rep_creation, sec_domains, doms)
-
-            slice_rep = ' + '.join(m)
-            represented_slices.append('(' + slice_rep + ')')
+    def _representation_blocks(self, num_dec_places):
+        '''
+        Generates the representation of the set in blocks of vertical slices,
+        the characters of the points of a block are computed at once
+        by general_type2_representation_blocks
 
-        def f2(sec_domains, doms):
-            return doms + ' / ' + dec_places_formatter % (sec_domains)
+        Arguments:
+        ----------
+        num_dec_places -- number of decimal places
 
-        m2 = map(f2, self.primary_domain(), represented_slices)
-        set_representation = ' + '.join(m2)
+        Returns:
+        --------
+        generator of strings, joining them gives the representation of the set
+        '''
+        vertical_slices = ((primary_domain_val,
+                            self.vertical_slices[primary_domain_val].domain_elements(),
+                            self.vertical_slices[primary_domain_val].dom_elements())
+                            for primary_domain_val in self.primary_domain())
 
-        return set_representation
+        return general_type2_representation_blocks(vertical_slices, num_dec_places)
 
     def __repr__(self):
         return f'{self.__class__.__name__}({str(self)})'
@@ -114,6 +124,8 @@ class GeneralType2FuzzySet:
         '''
         Creates a general type-2 fuzzy set from a set representation of the form
         '(a1/u1 + a2/u2 + ... + an/un)/x1 + ... +(b1/u1 + b2/u2 + ... + bn/un)/xm'
+        The representation is tokenized in a single pass into coordinate arrays
+        that are passed to from_points
 
         Reference:
         ---------
@@ -132,60 +144,21 @@ class GeneralType2FuzzySet:
 
         Raises:
         -------
-        Exception -- if set_representation is empty, None or invalid
+        Exception -- if set_representation is empty, None or invalid, the message
+                    of an invalid representation includes the byte offset of the error
         '''
         if set_representation is None:
             raise GeneralType2FuzzySetException('Type-2 Set Representation cannot be null')
         if set_representation == '':
             raise GeneralType2FuzzySetException('Type-2 Set Representation cannot be empty')
 
-        gt2fs = cls()
-
         try:
-            # remove spaces, tabs returns,
-            translation_table = dict.fromkeys(map(ord, ' \t\n\r'), None)
-            set_representation = set_representation.translate(translation_table)
-
-            # by splitting by +( we will get the secondary mfs
-            # we would lose the initial ( of each mf except for the
-            # first one - this will be removed lated
-            sec_mfs_s = set_representation.split('+(')
-
-            # so lets go through the membership functions
-            for sec_mf in sec_mfs_s:
-                # remove the leading '('
-                # this will only happen in the first mf
-                translation_table = dict.fromkeys(map(ord, '('), None)
-                sec_mf = sec_mf.translate(translation_table)
-
-                # we now split the secondary membership function from the
-                # primary domain value
-                vertical_slice_points_s, pri_dom_val_s = sec_mf.split(')/')
-
-                # get the primary domain value and its corresponding
-                # index
-                primary_domain_val = float(pri_dom_val_s)
-
-                # split by the '+' so that we will obtain the individual
-                # dom / sec domain points
-                points_s = vertical_slice_points_s.split('+')
-
-                # we then examine each point to add them to the set
-                for point_s in points_s:
-                    # split by / so to obtain the dom and the sec domain value
-                    sec_grade_val_s, sec_dom_val_s = point_s.split('/')
-
-                    # get the secondary domain value and its corresponding
-                    # index
-                    secondary_domain_val = float(sec_dom_val_s)
-
-                    sec_grade = float(sec_grade_val_s)
-                    # add the point to the set
-                    gt2fs.add_element(primary_domain_val, secondary_domain_val, sec_grade)
-        except ValueError as exp:
-            raise GeneralType2FuzzySetException('Invalid set format') from exp
+            primary_domain_vals, secondary_domain_vals, secondary_grades = \
+                parse_general_type2_representation(set_representation)
+        except RepresentationParserException as exp:
+            raise GeneralType2FuzzySetException(f'Invalid set format, {exp}') from exp
 
-        return gt2fs
+        return cls.from_points(primary_domain_vals, secondary_domain_vals, secondary_grades)
 
     @classmethod
     def from_array(cls, primary_domain, secondary_domain, set_array):
@@ -198,7 +171,10 @@ class GeneralType2FuzzySet:
                                     the cols map to the values of the x list
                                     each value is the secondary grade value for
                                     the particular x / u combination
-        
+
+        The values are validated with a single vectorized check and every
+        vertical slice is built in one pass. If the domains are sorted,
+        a copy of set_array is kept as the result of to_array_explicit
 
         Reference:
         ---------
@@ -216,11 +192,21 @@ class GeneralType2FuzzySet:
         Raises:
         -------
         Exception -- if there is a mismatch between the x, u and set_array dimensions
+                    or if a secondary domain value or secondary grade is not in [0, 1]
         '''
-        set_array = np.array(set_array)
+        primary_domain = np.asarray(primary_domain, dtype=float)
+        secondary_domain = np.asarray(secondary_domain, dtype=float)
+
+        try:
+            set_array = np.asarray(set_array, dtype=float)
+        except ValueError as exp:
+            raise GeneralType2FuzzySetException('Set array must be two dimensional') from exp
+
+        if set_array.ndim != 2:
+            raise GeneralType2FuzzySetException('Set array must be two dimensional')
 
         # check that array sizes are correct
-        (secondary_domain_size, primary_domain_size) = np.shape(set_array)
+        (secondary_domain_size, primary_domain_size) = set_array.shape
 
         if secondary_domain_size != len(secondary_domain):
             raise GeneralType2FuzzySetException('Secondary domain size mismatch')
@@ -228,18 +214,118 @@ class GeneralType2FuzzySet:
         if primary_domain_size != len(primary_domain):
             raise GeneralType2FuzzySetException('Primary domain size mismatch')
 
+        cls._check_points(
+            np.broadcast_to(primary_domain, set_array.shape),
+            np.broadcast_to(secondary_domain[:, np.newaxis], set_array.shape),
+            set_array)
+
+        gt2fs = cls()
+
+        secondary_domain_list = secondary_domain.tolist()
+        for pri_dom_val, secondary_grades in zip(primary_domain.tolist(), set_array.T.tolist()):
+            gt2fs._add_slice(pri_dom_val, secondary_domain_list, secondary_grades)
+
+        # the array is already the explicit representation of the set
+        if np.all(np.diff(primary_domain) > 0) and np.all(np.diff(secondary_domain) > 0):
+            gt2fs._array_cache = (primary_domain.tolist(), secondary_domain_list, set_array.copy())
+
+        return gt2fs
+
+    @classmethod
+    def from_points(cls, primary_domain_vals, secondary_domain_vals, secondary_grades):
+        '''
+        Creates a general type-2 fuzzy set from (x, u, secondary grade) triples.
+        The values are validated with a single vectorized check and the
+        points are grouped by primary domain value in one pass.
+        As in add_element, the highest secondary grade is kept for
+        repeated (x, u) points
+
+        Arguments:
+        ----------
+        primary_domain_vals -- 1D array, the primary domain value x of every point
+        secondary_domain_vals -- 1D array, the secondary domain value u of every point
+        secondary_grades -- 1D array, the secondary grade of every point
+
+        Returns:
+        --------
+        gt2fs -- GeneralType2FuzzySet
+
+        Raises:
+        -------
+        GeneralType2FuzzySetException -- if the arrays do not have the same size
+                    or if a secondary domain value or secondary grade is not in [0, 1]
+        '''
+        primary_domain_vals = np.asarray(primary_domain_vals, dtype=float)
+        secondary_domain_vals = np.asarray(secondary_domain_vals, dtype=float)
+        secondary_grades = np.asarray(secondary_grades, dtype=float)
+
+        if not (primary_domain_vals.ndim == secondary_domain_vals.ndim == secondary_grades.ndim == 1):
+            raise GeneralType2FuzzySetException('Points must be given as 1D arrays')
+
+        if not len(primary_domain_vals) == len(secondary_domain_vals) == len(secondary_grades):
+            raise GeneralType2FuzzySetException('Number of points mismatch')
+
+        cls._check_points(primary_domain_vals, secondary_domain_vals, secondary_grades)
+
         gt2fs = cls()
 
-        # load all the elements in the array
-        for pri_dom_val_idx, pri_dom_val in enumerate(primary_domain):
-            for sec_dom_val_idx, sec_dom_val in enumerate(secondary_domain):
-                gt2fs.add_element(
-                    pri_dom_val,
-                    sec_dom_val,
-                    set_array[sec_dom_val_idx][pri_dom_val_idx])
+        # group the points by primary domain value, keeping their order within a group
+        order = np.argsort(primary_domain_vals, kind='stable')
+        primary_domain_vals = primary_domain_vals[order]
+        starts = np.flatnonzero(np.r_[True, primary_domain_vals[1:] != primary_domain_vals[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+
+        secondary_domain_vals = secondary_domain_vals[order].tolist()
+        secondary_grades = secondary_grades[order].tolist()
+
+        for pri_dom_val, start, end in zip(primary_domain_vals[starts].tolist(), starts.tolist(), ends.tolist()):
+            gt2fs._add_slice(pri_dom_val, secondary_domain_vals[start:end], secondary_grades[start:end])
 
         return gt2fs
 
+    @staticmethod
+    def _check_points(primary_domain_vals, secondary_domain_vals, secondary_grades):
+        '''
+        Vectorized version of the checks made by add_element
+
+        Raises:
+        -------
+        GeneralType2FuzzySetException -- if a secondary domain value or
+                    secondary grade is not in [0, 1]
+        '''
+        invalid = (secondary_grades > 1) | (secondary_grades < 0)
+        if np.any(invalid):
+            idx = np.argmax(invalid.ravel())
+            raise GeneralType2FuzzySetException(
+                f'''Invalid secondary grade value {secondary_grades.ravel()[idx]} 
+                at x={primary_domain_vals.ravel()[idx]} and u={secondary_domain_vals.ravel()[idx]}''')
+
+        invalid = (secondary_domain_vals > 1) | (secondary_domain_vals < 0)
+        if np.any(invalid):
+            idx = np.argmax(invalid.ravel())
+            raise GeneralType2FuzzySetException('Invalid secondary domain value {} at x={}'.format(
+                secondary_domain_vals.ravel()[idx], primary_domain_vals.ravel()[idx]))
+
+    def _add_slice(self, primary_domain_val, secondary_domain_vals, secondary_grades):
+        '''
+        Adds already validated points to the vertical slice at primary_domain_val
+
+        Arguments:
+        ----------
+        primary_domain_val -- float, value of the primary domain
+        secondary_domain_vals -- list of float, the secondary domain values
+        secondary_grades -- list of float, the corresponding secondary grades
+        '''
+        self._array_cache = None
+
+        if primary_domain_val in self.vertical_slices:
+            secondary_function = self.vertical_slices[primary_domain_val]
+        else:
+            secondary_function = smf()
+            self.vertical_slices[primary_domain_val] = secondary_function
+
+        secondary_function.add_elements(secondary_domain_vals, secondary_grades)
+
     @classmethod
     def load_file(cls, set_filename):
         '''
@@ -269,16 +355,55 @@ class GeneralType2FuzzySet:
         representation = ''
 
         try:
-            with open(set_filename, 'r', encoding='utf-8') as file:
+            with open(set_filename, 'rb') as file:
                 representation = file.read()
         except IOError as exp:
             raise GeneralType2FuzzySetException(f'Could not read file {set_filename}') from exp
 
-        gt2fs = cls()
-        gt2fs = GeneralType2FuzzySet.from_representation(representation)
+        gt2fs = cls.from_representation(representation)
 
         return gt2fs
 
+    @staticmethod
+    def stream_file(set_filename, chunk_size=DEFAULT_CHUNK_SIZE):
+        '''
+        Reads a general type-2 fuzzy set file having the format of load_file
+        in chunks and yields its vertical slices as they are read, so that
+        consumers processing one vertical slice at a time, such as
+        gt2_partialcentroid_reduce, run in bounded memory.
+        The slices are yielded in the order of the file
+
+        Arguments:
+        ----------
+        set_filename -- string, filename of the set
+        chunk_size -- int, number of bytes read at a time
+
+        Returns:
+        --------
+        generator of (primary_domain_val, secondary_membership_function) pairs
+
+        Raises:
+        -------
+        GeneralType2FuzzySetException -- if the file cannot be read or is invalid,
+                    the message of an invalid file includes the byte offset of the error
+        '''
+        try:
+            with open(set_filename, 'rb') as file:
+                for primary_domain_val, secondary_domain_vals, secondary_grades in \
+                        iter_general_type2_slices(file, chunk_size):
+                    GeneralType2FuzzySet._check_points(
+                        np.full(len(secondary_domain_vals), primary_domain_val),
+                        secondary_domain_vals, secondary_grades)
+
+                    secondary_function = smf()
+                    secondary_function.add_elements(secondary_domain_vals.tolist(), secondary_grades.tolist())
+
+                    yield primary_domain_val, secondary_function
+        except IOError as exp:
+            raise GeneralType2FuzzySetException(f'Could not read file {set_filename}') from exp
+        except RepresentationParserException as exp:
+            raise GeneralType2FuzzySetException(f'Invalid set format, {exp}') from exp
+
     @classmethod
     def from_horizontal_representation(cls, primary_domain, secondary_domain, set_def):
         '''
@@ -331,7 +456,8 @@ class GeneralType2FuzzySet:
         '''
         Writes a formal representation of the general type-2 fuzzy set of the form:
         '(a1/u1 + a2/u2 + ... + an/un)/x1 + ... + (b1/u1 + b2/u2 + ... + bn/un)/xn'
-        in a file
+        in a file. The representation is written in blocks of vertical slices,
+        so that the whole representation is never held in memory
 
         Reference:
         ----------
@@ -349,13 +475,70 @@ class GeneralType2FuzzySet:
         '''
         try:
             with open(set_filename, 'w', encoding='utf-8') as fuzzy_file:
-                fuzzy_file.write(self.__str__())
+                fuzzy_file.writelines(self._representation_blocks(self._precision))
         except IOError as exp:
             raise GeneralType2FuzzySetException(f'Unable to write file {set_filename}') from exp
 
+    def save_npz(self, set_filename):
+        '''
+        Saves the (x, u, secondary grade) points of the set as raw float arrays
+        in an uncompressed .npz file, without the rounding of save_file
+
+        Arguments:
+        ----------
+        set_filename -- string, the name of the file, used as given
+
+        Raises:
+        -------
+        SetPersistenceException -- if the file cannot be written
+        '''
+        primary_domain_vals = []
+        secondary_domain_vals = []
+        secondary_grades = []
+
+        for primary_domain_val in self.primary_domain():
+            vertical_slice = self.vertical_slices[primary_domain_val].elements()
+            primary_domain_vals.extend([primary_domain_val] * len(vertical_slice))
+            secondary_domain_vals.extend(vertical_slice.keys())
+            secondary_grades.extend(vertical_slice.values())
+
+        save_arrays(set_filename, self.__class__.__name__,
+                    primary_domain_vals=np.array(primary_domain_vals, dtype=float),
+                    secondary_domain_vals=np.array(secondary_domain_vals, dtype=float),
+                    secondary_grades=np.array(secondary_grades, dtype=float))
+
+    @classmethod
+    def load_npz(cls, set_filename, mmap_mode=None):
+        '''
+        Loads a general type-2 fuzzy set saved by save_npz
+
+        Arguments:
+        ----------
+        set_filename -- string, the name of the file
+        mmap_mode -- None, 'r', 'r+' or 'c', memory maps the points
+                    of the set as in numpy.load
+
+        Returns:
+        --------
+        gt2fs -- GeneralType2FuzzySet
+
+        Raises:
+        -------
+        SetPersistenceException -- if the file cannot be read or does not hold
+                    a general type-2 fuzzy set
+        '''
+        return cls.from_points(*load_arrays(
+            set_filename, cls.__name__,
+            ('primary_domain_vals', 'secondary_domain_vals', 'secondary_grades'), mmap_mode))
+
     def to_array_explicit(self):
         '''
-        Transforms a General type 2 fuzzy set into a 2D array
+        Transforms a General type 2 fuzzy set into a 2D array.
+        The domains are indexed by dicts of value : index built in a single
+        pass over the elements. The result is cached on the set until
+        add_element or add_membership_function changes it, so the
+        set array is returned as a read-only array. Changes made directly
+        on the secondary membership functions are not tracked
 
         Arguments:
         ----------
@@ -368,69 +551,112 @@ class GeneralType2FuzzySet:
         set_array -- 2D array containing the degree of membership for the corresponding
                     primary/secondary combination
         '''
+        if self._array_cache is None:
+            self._array_cache = self._densify()
+
+        primary_domain, secondary_domain, set_array = self._array_cache
+
+        set_array = set_array.view()
+        set_array.flags.writeable = False
+
+        return list(primary_domain), list(secondary_domain), set_array
+
+    def _densify(self):
+        '''
+        Builds the array representation returned by to_array_explicit in
+        time linear in the number of elements
+        '''
+        slices = {primary_domain_val: self.vertical_slices[primary_domain_val].elements()
+                    for primary_domain_val in self.vertical_slices}
 
         # get all possible value of the secondary domain by a union with all the elements of
         # each vertical slice
-        secondary_domain = []
-        for primary_domain_val in self.vertical_slices:
-            secondary_domain = list(set().union(secondary_domain, list(self[primary_domain_val].domain_elements())))
-
-        secondary_domain.sort()
+        secondary_domain = set()
+        for vertical_slice in slices.values():
+            secondary_domain.update(vertical_slice)
+        secondary_domain = sorted(secondary_domain)
 
         # get all possible value of the primary domain
-        primary_domain =  list(self.vertical_slices.keys())
-        primary_domain.sort()
+        primary_domain = sorted(slices)
 
-        # create an array to hold the dom
-        set_array = np.zeros((len(secondary_domain), len(primary_domain)))
+        secondary_domain_idx = {val: idx for idx, val in enumerate(secondary_domain)}
+        primary_domain_idx = {val: idx for idx, val in enumerate(primary_domain)}
 
-        for primary_domain_val in self.vertical_slices:
-            pri_domain_idx = primary_domain.index(primary_domain_val)
+        rows = []
+        cols = []
+        grades = []
+        for primary_domain_val, vertical_slice in slices.items():
+            pri_domain_idx = primary_domain_idx[primary_domain_val]
 
-            for sec_domain_val in self.vertical_slice(primary_domain_val).elements():
-                sec_domain_idx = secondary_domain.index(sec_domain_val)
+            for sec_domain_val, secondary_grade in vertical_slice.items():
+                rows.append(secondary_domain_idx[sec_domain_val])
+                cols.append(pri_domain_idx)
+                grades.append(secondary_grade)
 
-                set_array[sec_domain_idx, pri_domain_idx] = self.vertical_slice(
-                    primary_domain_val)[sec_domain_val]
+        # create an array to hold the dom
+        set_array = np.zeros((len(secondary_domain), len(primary_domain)))
+        set_array[rows, cols] = grades
 
         return primary_domain, secondary_domain, set_array
 
-    def to_array_implicit(self, primary_domain, secondary_domain):
+    def to_array_implicit(self, primary_domain, secondary_domain, method='max'):
         '''
         Transforms a General type 2 fuzzy set into a 2D array but specifying the primary
         and secondary domain discrete values. The values of the set are thereby approximated 
-        to these specified values
+        to these specified values, either by snapping every element to the nearest
+        grid point, found by binary search, or by bilinear interpolation
 
         Arguments:
         ----------
         primary_domain -- 1D array containing all the values in the primary domain
         secondary_domain -- 1D array containing all the values in the secondary domain
+        method -- 'max', elements snapped to the same grid point keep the highest
+                    secondary grade, or 'linear', the secondary grades are interpolated
+                    and are 0 outside the domains of this set
 
         Returns:
         --------
         set_array -- 2D array containing the degree of membership for the corresponding
                         primary/secondary combination
+
+        Raises:
+        -------
+        GeneralType2FuzzySetException -- if the method is not supported
         '''
+        if method not in RESAMPLING_METHODS:
+            raise GeneralType2FuzzySetException(f'Unsupported resampling method {method}')
 
-        # convert domain lists to numpy arrays
-        primary_domain = np.array(primary_domain)
-        secondary_domain = np.array(secondary_domain)
+        source_primary_domain, source_secondary_domain, source_array = self.to_array_explicit()
+        source_primary_domain = np.asarray(source_primary_domain, dtype=float)
+        source_secondary_domain = np.asarray(source_secondary_domain, dtype=float)
 
-        # create resultant set
-        set_array = np.zeros((len(secondary_domain), len(primary_domain)))
+        if method == 'linear':
+            return interpolate_linear(
+                source_primary_domain, source_secondary_domain, source_array,
+                primary_domain, secondary_domain)
 
-        # for each primary domain element, get closest element form list
-        for primary_domain_val in self.vertical_slices:
-            pri_dom_val_idx = np.argmin(np.abs(primary_domain - primary_domain_val))
+        return snap_max(
+            primary_domain, secondary_domain,
+            source_primary_domain, source_secondary_domain, source_array)
 
-            # for each secondary domain element, get closest element form list
-            for sec_domain_val in self.vertical_slices[primary_domain_val].elements():
-                sec_dom_val_idx = np.argmin(np.abs(secondary_domain-sec_domain_val))
+    def resample(self, primary_domain, secondary_domain, method='max'):
+        '''
+        Resamples the set onto new primary and secondary domains,
+        as in to_array_implicit
 
-                # add set element in array
-                set_array[sec_dom_val_idx, pri_dom_val_idx] = self.vertical_slice(primary_domain_val)[sec_domain_val]
+        Arguments:
+        ----------
+        primary_domain -- 1D array containing all the values in the new primary domain
+        secondary_domain -- 1D array containing all the values in the new secondary domain
+        method -- 'max' or 'linear', see to_array_implicit
 
-        return set_array
+        Returns:
+        --------
+        dgt2fs -- DenseGeneralType2FuzzySet, the resampled set on the new grid
+        '''
+        return DenseGeneralType2FuzzySet(
+            primary_domain, secondary_domain,
+            self.to_array_implicit(primary_domain, secondary_domain, method))
 
     def primary_domain(self):
         '''
@@ -483,6 +709,9 @@ class GeneralType2FuzzySet:
         if secondary_domain_val > 1 or secondary_domain_val < 0:
             raise GeneralType2FuzzySetException('Invalid secondary domain value {} at x={}'.format(secondary_domain_val, primary_domain_val))
 
+        # the array representation no longer matches the set
+        self._array_cache = None
+
         # if the primary domain exists just add the value of the smf
         # if not create a new smf to that primary domain value and
         # add that value
@@ -497,8 +726,8 @@ class GeneralType2FuzzySet:
     def add_membership_function(self, primary_domain_val, membership_function):
         '''
         Adds a membership function to the general type-2 fuzzy set. 
-        uses the add_element() method and uses the checks implemented in
-        that function
+        The checks implemented in add_element are made on the whole
+        membership function at once
         
         Arguments:
         ----------
@@ -509,11 +738,18 @@ class GeneralType2FuzzySet:
         --------
         None
         '''
-        for secondary_domain_val in membership_function.domain_elements():
-            self.add_element(
-                primary_domain_val,
-                secondary_domain_val,
-                membership_function[secondary_domain_val])
+        secondary_domain_vals = membership_function.domain_elements()
+        secondary_grades = membership_function.degree_of_membership()
+
+        if len(secondary_domain_vals) == 0:
+            return
+
+        self._check_points(
+            np.full(len(secondary_domain_vals), primary_domain_val),
+            np.asarray(secondary_domain_vals, dtype=float),
+            np.asarray(secondary_grades, dtype=float))
+
+        self._add_slice(primary_domain_val, secondary_domain_vals, secondary_grades)
 
     def footprint_of_uncertainty(self):
         '''
@@ -544,17 +780,59 @@ class GeneralType2FuzzySet:
 
     def z_slice(self, slice_value):
         '''
+        Returns the z-slice of this set at the given level, the interval
+        type-2 fuzzy set of the alpha-cuts of its vertical slices, built
+        at once from the bounds found by z_slice_bounds
 
+        Arguments:
+        ----------
+        slice_value -- float, the z-level
+
+        Returns:
+        --------
+        sliced_set -- IntervalType2FuzzySet, without the primary domain values
+                    whose vertical slices do not reach the level
         '''
-        sliced_set = IntervalType2FuzzySet()
+        primary_domain, bounds = self.z_slice_bounds([slice_value])
+        included = ~np.isnan(bounds[0, :, 0])
 
-        for primary_domain_val in self.primary_domain():
-            cut = self.vertical_slices[primary_domain_val].alpha_cut(slice_value)
+        return IntervalType2FuzzySet.from_hmf_lmf(
+            primary_domain[included], bounds[0, included, 1], bounds[0, included, 0])
+
+    def secondary_grade_levels(self):
+        '''
+        Returns the sorted distinct non-zero secondary grades of this set,
+        the levels at which its z-slices change, so that slicing at these
+        levels represents the set exactly
+
+        Returns:
+        --------
+        z_vals -- 1D array, the sorted distinct non-zero secondary grades
+        '''
+        _, _, set_array = self.to_array_explicit()
+
+        return np.unique(set_array[set_array > 0])
 
-            if not cut.empty:
-                sliced_set.add_element_from_crispset(primary_domain_val, cut)
+    def z_slice_bounds(self, z_vals):
+        '''
+        Finds the bounds of the z-slices at all the given levels at once from
+        the grid of to_array_explicit, giving the alpha-cuts of the vertical slices
 
-        return sliced_set
+        Arguments:
+        ----------
+        z_vals -- 1D array, the z-levels
+
+        Returns:
+        --------
+        primary_domain -- 1D array, the sorted primary domain values
+        bounds -- 3D array of shape (len(z_vals), len(primary_domain), 2), the lower
+                    and upper bounds of every z-slice, NaN where a primary
+                    domain value is not part of a z-slice
+        '''
+        primary_domain, secondary_domain, set_array = self.to_array_explicit()
+
+        return (np.asarray(primary_domain, dtype=float),
+                grid_z_slice_bounds(secondary_domain, set_array, z_vals))
 
     def primary_membership(self, primary_domain_val):
         '''
@@ -613,7 +891,8 @@ class GeneralType2FuzzySet:
     def embedded_type2_sets_count(self):
         '''
         returns the number of embedded type-2 fuzzy sets that can be 
-        generated from this general type-2 fuzzy set.
+        generated from this general type-2 fuzzy set, the count of
+        embedded_type2_set_sequence, whose points have a secondary grade above 0
         
         Reference:
         ----------
@@ -626,19 +905,17 @@ class GeneralType2FuzzySet:
 
         Returns:
         --------
-        embedded_count -- float, number of et2fs
+        embedded_count -- int, number of et2fs
         '''
-        count = 1
-        for primary_domain_val in self.primary_domain():
-            count = count * self.vertical_slice(primary_domain_val).element_count()
-
-        return count
+        return self.embedded_type2_set_sequence().count
 
     def embedded_type2_sets(self):
         '''
         Lists all the type 2 embedded sets of this gt2fs.
         List will contain tuples in the form
         [(sec_grade_1, sec_domain_1, pri_domain_1), ... , (sec_grade_n, sec_domain_n, pri_domain_n)]
+        The number of embedded sets grows exponentially with the primary domain,
+        embedded_type2_set_sequence gives them without creating the list
 
         Reference:
         ----------
@@ -654,32 +931,65 @@ class GeneralType2FuzzySet:
         results -- list, containing embedded type 2 sets
 
         '''
-        set_array = []
-        primary_domain, secondary_domain, set_array = self.to_array_explicit()
+        return list(self.embedded_type2_set_sequence())
+
+    def embedded_type2_set_sequence(self):
+        '''
+        Returns a lazy sequence of the embedded type-2 fuzzy sets of this gt2fs,
+        in the order of embedded_type2_sets. The sequence has an exact count,
+        gives the k-th embedded set by mixed radix decoding and iterates
+        over the embedded sets in chunks of arrays
+
+        Reference:
+        ----------
+        J. M. Mendel and R. I. B. John, “Type-2 fuzzy sets made simple,” IEEE
+        Trans. Fuzzy Systems, vol. 10, no. 2, pp. 117–127, Apr. 2002.
+
+        Returns:
+        --------
+        embedded_sets -- EmbeddedType2FuzzySets
+        '''
+        vertical_slices = []
+        for primary_domain_val in self.primary_domain():
+            # points with a secondary grade > 0, by ascending secondary domain value
+            points = sorted((secondary_domain_val, secondary_grade) for secondary_domain_val, secondary_grade
+                            in self.vertical_slices[primary_domain_val].elements().items() if secondary_grade > 0)
+            vertical_slices.append((primary_domain_val,
+                                    [secondary_domain_val for secondary_domain_val, _ in points],
+                                    [secondary_grade for _, secondary_grade in points]))
+
+        return EmbeddedType2FuzzySets.from_vertical_slices(vertical_slices)
 
-        # get an index array
-        index_array = np.indices(set_array.shape)[0]
+    def top_k_embedded_sets(self, k):
+        '''
+        Finds the k embedded type-2 fuzzy sets of this gt2fs with the highest
+        secondary grade, the minimum secondary grade of their points. The
+        points of every vertical slice are sorted by grade and the embedded
+        sets are searched best first, in about O(k n log n) for n vertical
+        slices instead of enumerating all the embedded sets
 
-        # create a list with the number of non zero elements in each vertical slice
-        # i.e. the number of non zero element in each column
-        col_gen = [index_array[set_array[:, x] > 0, x] for x in range((set_array.shape)[1])]
+        Reference:
+        ----------
+        J. M. Mendel and R. I. B. John, “Type-2 fuzzy sets made simple,” IEEE
+        Trans. Fuzzy Systems, vol. 10, no. 2, pp. 117–127, Apr. 2002.
 
-        # the number of columns is the number of elements in the domain
-        domain_index = range(0, (set_array.shape)[1])
+        Arguments:
+        ----------
+        k -- int, the number of embedded sets
 
-        results = []
-        # for every combination of the column elements create a type 2 embedded fuzzy set
-        for t in itertools.product(*col_gen):
-            embedded = list(
-                map(
-                    lambda i: (
-                        set_array[t[i]][i],
-                        secondary_domain[t[i]],
-                        primary_domain[i]),
-                    domain_index))
-            results.append(embedded)
+        Returns:
+        --------
+        results -- list of at most k embedded type 2 sets, by descending secondary grade,
+                    in the form of embedded_type2_sets
+
+        Raises:
+        -------
+        GeneralType2FuzzySetException -- if k is negative
+        '''
+        if k < 0:
+            raise GeneralType2FuzzySetException('The number of embedded sets must not be negative')
 
-        return results
+        return self.embedded_type2_set_sequence().top_k(k)
 
     def _format_slice(self, vertical_slice):
         x = list(vertical_slice.elements.keys())
@@ -692,8 +1002,22 @@ class GeneralType2FuzzySet:
         slice_rep = ' + '.join(m)
         return slice_rep
 
+    def _sorted_slice(self, primary_domain_val):
+        '''
+        returns the secondary domain values of the vertical slice at
+        primary_domain_val in ascending order and their secondary grades
+        '''
+        points = sorted(self.vertical_slices[primary_domain_val].elements().items())
+
+        return ([secondary_domain_val for secondary_domain_val, _ in points],
+                [secondary_grade for _, secondary_grade in points])
+
     def union(self, gt2fs):
-        ''' union '''
+        '''
+        union, the vertical slices at the same primary domain value are joined
+        by the running maximum sweep of max_min_join instead of visiting every
+        pair of points
+        '''
 
         resultant_gt2fs = GeneralType2FuzzySet()
 
@@ -710,15 +1034,21 @@ class GeneralType2FuzzySet:
                 resultant_gt2fs.add_membership_function(
                     primary_domain_element, self[primary_domain_element])
             else:
-                resultant_gt2fs.add_membership_function(
-                    primary_domain_element,
-                    self[primary_domain_element].join(gt2fs[primary_domain_element]))
+                secondary_domain_vals, secondary_grades = max_min_join(
+                    *self._sorted_slice(primary_domain_element),
+                    *gt2fs._sorted_slice(primary_domain_element))
+
+                if len(secondary_domain_vals) > 0:
+                    resultant_gt2fs._add_slice(primary_domain_element,
+                                                secondary_domain_vals.tolist(), secondary_grades.tolist())
 
         return resultant_gt2fs
 
     def intersection(self, gt2fs):
         '''
-        intersection  
+        intersection, the vertical slices at the same primary domain value are
+        met by the running maximum sweep of max_min_meet instead of visiting
+        every pair of points
         '''
         resultant_gt2fs = GeneralType2FuzzySet()
 
@@ -737,9 +1067,13 @@ class GeneralType2FuzzySet:
                     primary_domain_element,
                     self[primary_domain_element])
             else:
-                resultant_gt2fs.add_membership_function(
-                    primary_domain_element,
-                    self[primary_domain_element].meet(gt2fs[primary_domain_element]))
+                secondary_domain_vals, secondary_grades = max_min_meet(
+                    *self._sorted_slice(primary_domain_element),
+                    *gt2fs._sorted_slice(primary_domain_element))
+
+                if len(secondary_domain_vals) > 0:
+                    resultant_gt2fs._add_slice(primary_domain_element,
+                                                secondary_domain_vals.tolist(), secondary_grades.tolist())
 
         return resultant_gt2fs
 
@@ -4,7 +4,6 @@ generation of interval type 2 fuzzy sets
 import math
 
 from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
-from type2fuzzy.membership.crispset import CrispSet
 
 class SetGenerationException(Exception):
     ''' SetGenerationException'''
@@ -42,9 +41,9 @@ def create_gaussian_fixed_sigma(primary_domain, m1, m2, sigma=1.0):
     if m1 > m2:
         raise SetGenerationException('ERROR: m1 value must be smaller or equal to m2')
 
-    interval_set = IntervalType2FuzzySet()
+    lmf = []
+    hmf = []
     toggle_peak = False
-    element = None
 
     for x in primary_domain:
 
@@ -57,13 +56,14 @@ def create_gaussian_fixed_sigma(primary_domain, m1, m2, sigma=1.0):
         if u2 == 1:
             toggle_peak = False
 
+        lmf.append(min(u1, u2))
         if toggle_peak:
-            element = CrispSet(min(u1, u2), 1)
+            hmf.append(1)
         else:
-            element = CrispSet(min(u1, u2), max(u1, u2))
+            hmf.append(max(u1, u2))
 
-        # add the element to the it2fs
-        interval_set.add_element_from_crispset(x, element)
+    # create the it2fs in one go from the membership functions
+    interval_set = IntervalType2FuzzySet.from_hmf_lmf(primary_domain, hmf, lmf)
 
     return interval_set
 
@@ -97,7 +97,8 @@ def create_gaussian_fixed_mean(primary_domain, sigma1, sigma2, mean=1.0):
     if sigma1 > sigma2:
         raise SetGenerationException('ERROR: m1 value must be smaller or equal to m2')
 
-    interval_set = IntervalType2FuzzySet()
+    lmf = []
+    hmf = []
     u1 = 0
     u2 = 0
 
@@ -106,7 +107,10 @@ def create_gaussian_fixed_mean(primary_domain, sigma1, sigma2, mean=1.0):
         u1 = math.exp(-0.5*((x-float(mean))/sigma1)**2)
         u2 = math.exp(-0.5*((x-float(mean))/sigma2)**2)
 
-        # add the element to the it2fs
-        interval_set.add_element_from_crispset(x, CrispSet(min(u1, u2), max(u1, u2)))
+        lmf.append(min(u1, u2))
+        hmf.append(max(u1, u2))
+
+    # create the it2fs in one go from the membership functions
+    interval_set = IntervalType2FuzzySet.from_hmf_lmf(primary_domain, hmf, lmf)
 
     return interval_set
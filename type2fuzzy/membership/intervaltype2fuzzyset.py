@@ -4,7 +4,14 @@ contains the following classes:
 - IntervalType2FuzzySet
 - IntervalType2FuzzySetException
 '''
+import numpy as np
 from type2fuzzy.membership.crispset import CrispSet
+from type2fuzzy.membership.crispsetarray import CrispSetArray
+from type2fuzzy.membership.resampling import RESAMPLING_METHODS, nearest_index
+from type2fuzzy.membership.representation_parser import parse_interval_type2_representation
+from type2fuzzy.membership.representation_parser import iter_interval_type2_elements, DEFAULT_CHUNK_SIZE
+from type2fuzzy.membership.representation_parser import RepresentationParserException
+from type2fuzzy.membership.set_persistence import save_arrays, load_arrays
 
 
 class IntervalType2FuzzySetException(Exception):
@@ -13,10 +20,23 @@ class IntervalType2FuzzySetException(Exception):
         super().__init__(message)
 
 class IntervalType2FuzzySet:
-    '''An interval type-2 fuzzy set class'''
+    '''
+    An interval type-2 fuzzy set class
+    As a data structure, the interval type-2 fuzzy set is represented
+    by three contiguous arrays kept sorted by the primary domain:
+    primary_domain -- the primary domain values
+    lower -- the lower membership function at each primary domain value
+    upper -- the upper membership function at each primary domain value
+    Elements added one at a time are appended to a pending list, merged
+    into the arrays by a single sort before the set is next read, so that
+    building a set element by element takes O(n log n)
+    '''
 
     def __init__(self):
-        self._interval_set_elements = {}
+        self._primary_domain = np.empty(0)
+        self._lower = np.empty(0)
+        self._upper = np.empty(0)
+        self._pending = []
         self._empty=True
 
     def __getitem__(self, primary_domain_val:float)->CrispSet:
@@ -32,11 +52,13 @@ class IntervalType2FuzzySet:
         --------
         crisp_set - corresponding crisp set
         '''
-        if primary_domain_val not in self._interval_set_elements:
+        idx = self._primary_domain_index(primary_domain_val)
+
+        if idx is None:
             raise IntervalType2FuzzySetException(
                 f'Primary domain value of {primary_domain_val} not in this set.')
 
-        return self._interval_set_elements[primary_domain_val]
+        return CrispSet(float(self._lower[idx]), float(self._upper[idx]))
 
     @property
     def empty(self):
@@ -67,7 +89,11 @@ class IntervalType2FuzzySet:
 
     @classmethod
     def from_representation(cls, set_representation:str)->'IntervalType2FuzzySet':
-        '''creates an interval type-2 fuzzy set from a string representation'''
+        '''
+        creates an interval type-2 fuzzy set from a string representation,
+        tokenized in a single pass into the arrays passed to from_hmf_lmf.
+        The message of an invalid representation includes the byte offset of the error
+        '''
         if set_representation is None:
             raise IntervalType2FuzzySetException(
                 'Interval Type-2 Set Representation cannot be null')
@@ -75,44 +101,12 @@ class IntervalType2FuzzySet:
             raise IntervalType2FuzzySetException(
                 'Interval Type-2 Set Representation cannot be empty')
 
-        it2fs = cls()
-
         try:
-            # remove spaces, tabs returns,
-            translation_table = dict.fromkeys(map(ord, ' \t\n\r'), None)
-            set_representation = set_representation.translate(translation_table)
-
-            # by splitting by '+' we will get the secondary mfs
-            sec_mfs_s = set_representation.split('+')
-
-            # so lets go through the membership functions
-            for sec_mf in sec_mfs_s:
-
-                # we now split the membership function from the
-                # primary domain value
-                vslice_points_s, pri_dom_val_s = sec_mf.split('/')
+            primary_domain, lmf, hmf = parse_interval_type2_representation(set_representation)
+        except RepresentationParserException as exp:
+            raise IntervalType2FuzzySetException(f'Invalid set format, {exp}') from exp
 
-                # get the primary domain value and its corresponding
-                # index
-                primary_domain_val = float(pri_dom_val_s)
-
-                # the vertical slice points is represented by [left, right]
-                # remove the braces
-                translation_table = dict.fromkeys(map(ord, '[]'), None)
-                vslice_points_s = vslice_points_s.translate(translation_table)
-
-                # split by the '+' so that we will obtain the individual
-                # dom / sec domain points
-                left_s, right_s = vslice_points_s.split(',')
-
-                left = float(left_s)
-                right = float(right_s)
-
-                it2fs.add_element_from_crispset(primary_domain_val, CrispSet(left, right))
-        except ValueError as exp:
-            raise IntervalType2FuzzySetException('Invalid set format') from exp
-
-        return it2fs
+        return cls.from_hmf_lmf(primary_domain, hmf, lmf)
 
     @classmethod
     def load_file(cls, set_filename:str)->'IntervalType2FuzzySet':
@@ -139,26 +133,220 @@ class IntervalType2FuzzySet:
         representation = ''
 
         try:
-            with open(set_filename, 'r', encoding='utf-8') as file:
+            with open(set_filename, 'rb') as file:
                 representation = file.read()
         except IOError as exp:
             raise IntervalType2FuzzySetException(f'Could not read file {set_filename}') from exp
 
-        it2fs = cls()
-        it2fs = IntervalType2FuzzySet.from_representation(representation)
+        it2fs = cls.from_representation(representation)
 
         return it2fs
 
+    def save_npz(self, set_filename:str)->None:
+        '''
+        Saves the primary domain and the lower and upper membership functions
+        as raw float arrays in an uncompressed .npz file, without the rounding
+        of the textual representation
+
+        Arguments:
+        ----------
+        set_filename -- string, the name of the file, used as given
+
+        Raises:
+        -------
+        SetPersistenceException -- if the file cannot be written
+        '''
+        self._merge_pending()
+        save_arrays(set_filename, self.__class__.__name__,
+                    primary_domain=self._primary_domain, lower=self._lower, upper=self._upper)
+
+    @classmethod
+    def load_npz(cls, set_filename:str, mmap_mode=None)->'IntervalType2FuzzySet':
+        '''
+        Loads an interval type-2 fuzzy set saved by save_npz.
+        Memory mapped arrays are used as they are, without a copy
+
+        Arguments:
+        ----------
+        set_filename -- string, the name of the file
+        mmap_mode -- None, 'r', 'r+' or 'c', memory maps the arrays as in numpy.load
+
+        Returns:
+        --------
+        it2fs -- IntervalType2FuzzySet
+
+        Raises:
+        -------
+        SetPersistenceException -- if the file cannot be read or does not hold
+                    an interval type-2 fuzzy set
+        '''
+        primary_domain, lower, upper = load_arrays(
+            set_filename, cls.__name__, ('primary_domain', 'lower', 'upper'), mmap_mode)
+
+        return cls.from_hmf_lmf(primary_domain, upper, lower)
+
+    @staticmethod
+    def stream_file(set_filename:str, chunk_size:int=DEFAULT_CHUNK_SIZE):
+        '''
+        Reads an interval type-2 fuzzy set file having the format of load_file
+        in chunks and yields its elements as they are read, in the order of the file
+
+        Arguments:
+        ----------
+        set_filename -- string, filename of the set
+        chunk_size -- int, number of bytes read at a time
+
+        Returns:
+        --------
+        generator of (primary_domain_val, crisp_set) pairs
+
+        Raises:
+        -------
+        IntervalType2FuzzySetException -- if the file cannot be read or is invalid,
+                    the message of an invalid file includes the byte offset of the error
+        '''
+        try:
+            with open(set_filename, 'rb') as file:
+                for primary_domain_val, lower_val, upper_val in \
+                        iter_interval_type2_elements(file, chunk_size):
+                    yield primary_domain_val, CrispSet(lower_val, upper_val)
+        except IOError as exp:
+            raise IntervalType2FuzzySetException(f'Could not read file {set_filename}') from exp
+        except RepresentationParserException as exp:
+            raise IntervalType2FuzzySetException(f'Invalid set format, {exp}') from exp
+
     @classmethod
     def from_hmf_lmf(cls, primary_domain, hmf, lmf)->'IntervalType2FuzzySet':
-        '''creates an interval type-2 fuzzy set from a hmf and lmf'''
+        '''
+        creates an interval type-2 fuzzy set from a hmf and lmf.
+        The arrays are sorted by the primary domain if required and
+        repeated primary domain values are merged by taking the union
+        of their intervals
+
+        Arguments:
+        ----------
+        primary_domain -- 1D array, the primary domain values
+        hmf -- 1D array, the upper membership function
+        lmf -- 1D array, the lower membership function
+
+        Returns:
+        --------
+        it2fs -- IntervalType2FuzzySet
+
+        Raises:
+        -------
+        IntervalType2FuzzySetException -- if the sizes do not match or if
+                    the lmf is greater than the hmf
+        '''
+        primary_domain = np.asarray(primary_domain, dtype=float)
+        upper = np.asarray(hmf, dtype=float)
+        lower = np.asarray(lmf, dtype=float)
+
+        if not len(primary_domain) == len(upper) == len(lower):
+            raise IntervalType2FuzzySetException('Primary domain and membership function size mismatch')
+
+        if np.any(lower > upper):
+            raise IntervalType2FuzzySetException('Lower membership function greater than upper')
+
+        primary_domain, lower, upper = cls._sorted_union(primary_domain, lower, upper)
+
         it2fs = cls()
-        for idx, primary_domain_element in enumerate(primary_domain):
-            it2fs.add_element_from_crispset(primary_domain_element, CrispSet(lmf[idx], hmf[idx]))
+        it2fs._primary_domain = primary_domain
+        it2fs._lower = lower
+        it2fs._upper = upper
+        it2fs._empty = len(primary_domain) == 0
 
         return it2fs
 
-    def primary_domain(self)->list[float]:
+    @classmethod
+    def from_crispsetarray(cls, primary_domain, crisp_set_array:CrispSetArray)->'IntervalType2FuzzySet':
+        '''
+        creates an interval type-2 fuzzy set from the crisp sets at
+        each primary domain value. As in add_element_from_crispset,
+        empty crisp sets are not added
+
+        Arguments:
+        ----------
+        primary_domain -- 1D array, the primary domain values
+        crisp_set_array -- CrispSetArray, the crisp set at every primary domain value
+
+        Returns:
+        --------
+        it2fs -- IntervalType2FuzzySet
+        '''
+        primary_domain = np.asarray(primary_domain, dtype=float)
+
+        if len(primary_domain) != len(crisp_set_array):
+            raise IntervalType2FuzzySetException('Primary domain and crisp set array size mismatch')
+
+        included = ~crisp_set_array.empty
+
+        return cls.from_hmf_lmf(
+            primary_domain[included],
+            crisp_set_array.right[included],
+            crisp_set_array.left[included])
+
+    @staticmethod
+    def _sorted_union(primary_domain, lower, upper):
+        '''
+        Sorts the arrays by the primary domain if required and merges
+        repeated primary domain values by the union of their intervals
+        '''
+        if np.any(np.diff(primary_domain) <= 0):
+            order = np.argsort(primary_domain, kind='stable')
+            primary_domain = primary_domain[order]
+            upper = upper[order]
+            lower = lower[order]
+
+            # merge repeated primary domain values
+            first = np.ones(len(primary_domain), dtype=bool)
+            first[1:] = primary_domain[1:] != primary_domain[:-1]
+            if not np.all(first):
+                starts = np.flatnonzero(first)
+                primary_domain = primary_domain[starts]
+                upper = np.maximum.reduceat(upper, starts)
+                lower = np.minimum.reduceat(lower, starts)
+
+        return primary_domain, lower, upper
+
+    def _merge_pending(self)->None:
+        '''
+        Merges the elements added since the last read into the arrays.
+        The arrays are replaced rather than modified in place
+        as they may be shared with other sets
+        '''
+        if not self._pending:
+            return
+
+        primary_domain, lower, upper = np.array(self._pending, dtype=float).T
+        self._pending = []
+
+        self._primary_domain, self._lower, self._upper = self._sorted_union(
+            np.concatenate((self._primary_domain, primary_domain)),
+            np.concatenate((self._lower, lower)),
+            np.concatenate((self._upper, upper)))
+
+    @staticmethod
+    def _read_only(array:np.ndarray)->np.ndarray:
+        '''returns a read-only view of array'''
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def _primary_domain_index(self, primary_domain_val:float):
+        '''
+        Finds the index of a primary domain value by binary search,
+        returns None if the value is not in the set
+        '''
+        self._merge_pending()
+        idx = np.searchsorted(self._primary_domain, primary_domain_val)
+
+        if idx == len(self._primary_domain) or self._primary_domain[idx] != primary_domain_val:
+            return None
+
+        return idx
+
+    def primary_domain(self)->np.ndarray:
         '''
         The primary domain of this fuzzy set
 
@@ -168,27 +356,31 @@ class IntervalType2FuzzySet:
 
         Returns:
         --------
-        primary_domain -- list, containing all the values in the primary domain
+        primary_domain -- read-only array, containing all the values in the
+                            primary domain in ascending order
         '''
-        primary_domain = list(self._interval_set_elements.keys())
-        return primary_domain
+        self._merge_pending()
+        return self._read_only(self._primary_domain)
 
     def mid_domain_element(self)->float:
         '''
         returns the middle domain element
         '''
-        return self.primary_domain()[int(len(self.primary_domain())/2)]
+        self._merge_pending()
+        return self._primary_domain[len(self._primary_domain) // 2]
 
     def __str__(self)->str:
         '''
         Creates a string representation of the interval type 2 fuzzy set in the form:
         (lower_1, upper_1)/domain_1 + ... + (lower_n, upper_n)/domain_n
         '''
+        self._merge_pending()
         set_representation_list = []
 
-        for primary_domain_element in self.primary_domain():
+        for primary_domain_element, left, right in zip(
+                self._primary_domain.tolist(), self._lower.tolist(), self._upper.tolist()):
             set_representation_list.append(
-                f'{self._interval_set_elements[primary_domain_element]}/{primary_domain_element}\n')
+                f'{CrispSet(left, right)}/{primary_domain_element}\n')
 
         set_representation = '+'.join(set_representation_list)
 
@@ -216,7 +408,11 @@ class IntervalType2FuzzySet:
 
     def add_element_from_crispset(self, primary_domain_val:float, crisp_set:CrispSet)->None:
         '''
-        adds an element to the set from the given crisp set
+        adds an element to the set from the given crisp set in O(1).
+        The element is merged into the arrays, by the union with the
+        interval of an existing primary domain value, when the set is next
+        read, all the elements added since the last read being merged by a
+        single sort
 
         Arguments:
         ----------
@@ -227,29 +423,77 @@ class IntervalType2FuzzySet:
         if crisp_set.empty:
             return
 
-        if primary_domain_val in self._interval_set_elements:
-            self._interval_set_elements[primary_domain_val].union(crisp_set)
-        else:
-            self._interval_set_elements[primary_domain_val] = crisp_set
+        self._pending.append((primary_domain_val, crisp_set.left, crisp_set.right))
 
         if self._empty:
             self._empty = False
 
 
-    def lower_membership_function(self)->list[float]:
-        '''returns the lower membership function'''
-        umf = []
+    def lower_membership_function(self)->np.ndarray:
+        '''returns the lower membership function as a read-only array'''
+        self._merge_pending()
+        return self._read_only(self._lower)
+
+    def higher_membership_function(self)->np.ndarray:
+        '''returns the higher membership function as a read-only array'''
+        self._merge_pending()
+        return self._read_only(self._upper)
+
+    def intervals(self)->CrispSetArray:
+        '''
+        returns the crisp set at every primary domain value as a CrispSetArray,
+        sharing the membership function arrays of this set
+        '''
+        self._merge_pending()
+        return CrispSetArray(self._lower, self._upper)
+
+    def resample(self, primary_domain, method='max')->'IntervalType2FuzzySet':
+        '''
+        Resamples the set onto a new primary domain
+
+        Arguments:
+        ----------
+        primary_domain -- 1D array, the new primary domain values
+        method -- 'max', every value is snapped to the nearest new value by binary
+                    search and the intervals snapped to the same value are merged
+                    by their union, or 'linear', the membership functions are
+                    interpolated and values outside the primary domain are not included
+
+        Returns:
+        --------
+        it2fs -- IntervalType2FuzzySet, the resampled set
+
+        Raises:
+        -------
+        IntervalType2FuzzySetException -- if the method is not supported
+        '''
+        if method not in RESAMPLING_METHODS:
+            raise IntervalType2FuzzySetException(f'Unsupported resampling method {method}')
+
+        primary_domain = np.asarray(primary_domain, dtype=float)
+        self._merge_pending()
+
+        if self._empty or len(primary_domain) == 0:
+            return IntervalType2FuzzySet()
+
+        if method == 'linear':
+            included = ((primary_domain >= self._primary_domain[0])
+                        & (primary_domain <= self._primary_domain[-1]))
+            primary_domain = primary_domain[included]
 
-        for limits in self._interval_set_elements.values():
-            umf.append(limits.left)
+            return IntervalType2FuzzySet.from_hmf_lmf(
+                primary_domain,
+                np.interp(primary_domain, self._primary_domain, self._upper),
+                np.interp(primary_domain, self._primary_domain, self._lower))
 
-        return umf
+        idx = nearest_index(primary_domain, self._primary_domain)
 
-    def higher_membership_function(self)->list[float]:
-        '''returns the higher membership function'''
-        hmf = []
+        upper = np.full(len(primary_domain), -np.inf)
+        lower = np.full(len(primary_domain), np.inf)
+        np.maximum.at(upper, idx, self._upper)
+        np.minimum.at(lower, idx, self._lower)
 
-        for limits in self._interval_set_elements.values():
-            hmf.append(limits.right)
+        included = np.isfinite(upper)
 
-        return hmf
+        return IntervalType2FuzzySet.from_hmf_lmf(
+            primary_domain[included], upper[included], lower[included])
@@ -0,0 +1,178 @@
+'''
+Lazy Z-Slice Type-2 Fuzzy Set
+contains the following classes:
+- LazyZSliceType2FuzzySet
+- LazyZSliceType2FuzzySetException
+'''
+import bisect
+from collections import OrderedDict
+import numpy as np
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.membership.zslicing import Z_LEVELS, adaptive_z_levels
+
+DEFAULT_CACHE_SIZE = 32
+
+
+class LazyZSliceType2FuzzySetException(Exception):
+    ''' Lazy Z-Slice Type-2 Fuzzy Set Exception '''
+    def __init__(self, message):
+        super().__init__(message)
+
+
+class LazyZSliceType2FuzzySet:
+    '''
+    A z-slice view over a general type-2 fuzzy set, computing the interval
+    type-2 fuzzy set of a z-level on its first access only.
+    The levels are the ones of ZSliceType2FuzzySet.from_general_type2_set,
+    keeping the levels whose z-slices are not empty, in ascending order.
+    A requested level is matched to the nearest level by bisection and
+    the most recently used z-slices are kept in a cache of cache_size slices
+    '''
+
+    def __init__(self, gt2fs, no_slices=None, levels='uniform', cache_size=DEFAULT_CACHE_SIZE):
+        '''
+        Creates a lazy z-slice view over a general type-2 fuzzy set
+
+        Arguments:
+        ----------
+        gt2fs -- GeneralType2FuzzySet, DenseGeneralType2FuzzySet or
+                    SparseGeneralType2FuzzySet, the set to slice
+        no_slices -- int, the number of slices, unused by 'exact'
+        levels -- 'uniform', 'exact' or 'adaptive', as in
+                    ZSliceType2FuzzySet.from_general_type2_set. The adaptive
+                    levels are selected from the bounds of all the exact
+                    levels, found once on creation
+        cache_size -- int, the maximum number of z-slices kept
+
+        Raises:
+        -------
+        LazyZSliceType2FuzzySetException -- if the levels are not supported, if
+                    no_slices is missing or if cache_size is not positive
+        '''
+        if levels not in Z_LEVELS:
+            raise LazyZSliceType2FuzzySetException(f'Unsupported z-levels {levels}')
+
+        if no_slices is None and levels != 'exact':
+            raise LazyZSliceType2FuzzySetException(f'The number of slices is required by {levels} z-levels')
+
+        if cache_size < 1:
+            raise LazyZSliceType2FuzzySetException('The cache size must be positive')
+
+        grade_levels = gt2fs.secondary_grade_levels()
+
+        if levels == 'uniform':
+            z_vals = np.linspace(0, 1, no_slices+1)
+            # the z-slices above the highest secondary grade are empty
+            max_grade = grade_levels[-1] if len(grade_levels) else -1.0
+            z_vals = z_vals[z_vals <= max_grade]
+        elif levels == 'exact':
+            z_vals = grade_levels
+        else:
+            _, bounds = gt2fs.z_slice_bounds(grade_levels)
+            z_vals = grade_levels[adaptive_z_levels(grade_levels, bounds, no_slices+1)]
+
+        self._gt2fs = gt2fs
+        self._z_vals = z_vals.tolist()
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+
+    @property
+    def empty(self):
+        return not self._z_vals
+
+    @property
+    def cache_size(self):
+        '''the maximum number of z-slices kept'''
+        return self._cache_size
+
+    def cached_zslices(self):
+        '''
+        returns the levels of the cached z-slices, from the least to the
+        most recently used
+        '''
+        return list(self._cache)
+
+    def zslices(self):
+        return list(self._z_vals)
+
+    def nearest_zslice(self, z_slice_val):
+        '''
+        Finds the level nearest to z_slice_val by bisection.
+        Ties go to the lower level, as in ZSliceType2FuzzySet.adjust_value
+
+        Arguments:
+        ----------
+        z_slice_val -- float, the requested level
+
+        Returns:
+        --------
+        z_val -- float, the nearest level of this set
+
+        Raises:
+        -------
+        LazyZSliceType2FuzzySetException -- if the set has no levels
+        '''
+        if not self._z_vals:
+            raise LazyZSliceType2FuzzySetException('There are no z-slices in this set')
+
+        idx = bisect.bisect_left(self._z_vals, z_slice_val)
+
+        if idx == len(self._z_vals):
+            return self._z_vals[-1]
+
+        if idx > 0 and z_slice_val - self._z_vals[idx - 1] <= self._z_vals[idx] - z_slice_val:
+            return self._z_vals[idx - 1]
+
+        return self._z_vals[idx]
+
+    def _compute_slice(self, z_val):
+        '''creates the interval type-2 fuzzy set at level z_val'''
+        primary_domain, bounds = self._gt2fs.z_slice_bounds([z_val])
+        included = ~np.isnan(bounds[0, :, 0])
+
+        return IntervalType2FuzzySet.from_hmf_lmf(
+            primary_domain[included], bounds[0, included, 1], bounds[0, included, 0])
+
+    def __getitem__(self, z_slice_val):
+        '''
+        For a given z-slice value, return the interval type-2 fuzzy set of
+        the nearest level, computing it on its first access
+
+        Arguments:
+        ----------
+        z_slice_val -- value of z-slice
+
+        Returns:
+        --------
+        it2fs - corresponding interval type-2 set
+
+        Raises:
+        -------
+        LazyZSliceType2FuzzySetException -- if the set has no levels
+        '''
+        z_val = self.nearest_zslice(z_slice_val)
+
+        if z_val in self._cache:
+            self._cache.move_to_end(z_val)
+            return self._cache[z_val]
+
+        it2fs = self._compute_slice(z_val)
+        self._cache[z_val] = it2fs
+
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+        return it2fs
+
+    def __str__(self):
+        representation = []
+
+        for z_val in self._z_vals:
+            representation.append(f'slice {z_val}:\n {self[z_val]}')
+
+        return '\n'.join(representation)
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}('
+                f'zslices={len(self._z_vals)}, '
+                f'cached={len(self._cache)})')
@@ -0,0 +1,374 @@
+'''
+single pass parsing of the textual representation of type-2 fuzzy sets
+into coordinate arrays
+
+general type-2 fuzzy sets:
+'(a1/u1 + a2/u2 + ... + an/un)/x1 + ... + (b1/u1 + b2/u2 + ... + bn/un)/xm'
+
+interval type-2 fuzzy sets:
+'[l1, h1]/x1 + [l2, h2]/x2 + ... + [ln, hn]/xn'
+
+Reference:
+----------
+J. M. Mendel and R. I. B. John, “Type-2 fuzzy sets made simple,” IEEE
+Trans. Fuzzy Systems, vol. 10, no. 2, pp. 117–127, Apr. 2002.
+'''
+import re
+import numpy as np
+
+_NUMBER = rb'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+
+# a vertical slice of a general type-2 fuzzy set, (points)/x
+_GT2_SLICE = re.compile(rb'\s*\(([^()]*)\)\s*/\s*(' + _NUMBER + rb')\s*')
+_GT2_POINT = re.compile(rb'\s*(' + _NUMBER + rb')\s*/\s*(' + _NUMBER + rb')\s*')
+_GT2_POINTS = re.compile(
+    _GT2_POINT.pattern + rb'(?:\+' + _GT2_POINT.pattern + rb')*')
+
+# an element of an interval type-2 fuzzy set, [l, h]/x or [v]/x
+_IT2_ELEMENT = re.compile(
+    rb'\s*\[\s*(' + _NUMBER + rb')\s*(?:,\s*(' + _NUMBER + rb')\s*)?\]\s*/\s*(' + _NUMBER + rb')\s*')
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# the fast paths accept unsigned decimal numbers, as written by the sets
+_WHITESPACE = b' \t\n\r\f\v'
+_DIGITS = b'0123456789.'
+_GT2_SEPARATORS = bytes.maketrans(b'()+/', b'    ')
+_IT2_SEPARATORS = bytes.maketrans(b'[],+/', b'     ')
+
+
+class RepresentationParserException(Exception):
+    '''
+    Representation parser exception, offset is the byte offset
+    of the malformed input in the utf-8 encoded representation
+    '''
+    def __init__(self, message, offset):
+        super().__init__(f'{message} at byte offset {offset}')
+        self.message = message
+        self.offset = offset
+
+
+def _encode(representation):
+    '''returns the representation as bytes'''
+    if isinstance(representation, str):
+        return representation.encode('utf-8')
+    return bytes(representation)
+
+
+def _error_offset(representation, pos):
+    '''returns the offset of the first non whitespace byte at or after pos'''
+    return len(representation) - len(representation[pos:].lstrip())
+
+
+def _separator(representation, pos):
+    '''
+    Checks that an element ending at pos is followed by a '+' or by the end
+    of the representation and returns the start of the next element,
+    None at the end
+    '''
+    if pos == len(representation):
+        return None
+
+    if representation[pos:pos+1] != b'+':
+        raise RepresentationParserException('Expected +', pos)
+
+    return pos + 1
+
+
+def _points_error_offset(points, start):
+    '''
+    Finds the offset of the malformed point in the points of
+    a vertical slice starting at byte offset start
+    '''
+    pos = 0
+    while True:
+        match = _GT2_POINT.match(points, pos)
+        if match is None:
+            return start + _error_offset(points, pos)
+
+        pos = match.end()
+        if pos == len(points) or points[pos:pos+1] != b'+':
+            return start + pos
+        pos = pos + 1
+
+
+def _fast_parse_general_type2(representation):
+    '''
+    Parses a general type-2 representation made of unsigned decimal numbers
+    without regular expressions. The separators left once the whitespace
+    and the digits are removed must repeat the structure of the slices and
+    every field between them must hold a number.
+    Returns None if the representation does not pass these checks
+    '''
+    compact = representation.translate(None, _WHITESPACE)
+    structure = compact.translate(None, _DIGITS)
+
+    if not structure.endswith(b')/'):
+        return None
+
+    point_counts = [part.count(b'/') for part in structure[:-2].split(b')/+')]
+    expected = b')/+'.join(b'(' + b'/+' * (count - 1) + b'/' for count in point_counts) + b')/'
+    if 0 in point_counts or structure != expected:
+        return None
+
+    try:
+        values = np.array(compact.translate(_GT2_SEPARATORS).split(), dtype=float)
+    except ValueError:
+        return None
+
+    point_counts = np.array(point_counts)
+    if len(values) != 2 * point_counts.sum() + len(point_counts):
+        return None
+
+    # every slice holds grade, u pairs followed by its primary domain value
+    x_positions = np.cumsum(2 * point_counts + 1) - 1
+    is_point = np.ones(len(values), dtype=bool)
+    is_point[x_positions] = False
+    points = values[is_point]
+
+    return values[x_positions], point_counts, points[1::2], points[0::2]
+
+
+def _fast_parse_interval_type2(representation):
+    '''
+    Parses an interval type-2 representation made of [l, h]/x elements with
+    unsigned decimal numbers without regular expressions.
+    Returns None if the representation does not pass these checks
+    '''
+    compact = representation.translate(None, _WHITESPACE)
+    structure = compact.translate(None, _DIGITS)
+
+    element_count = structure.count(b'+') + 1
+    if structure != b'+'.join([b'[,]/'] * element_count):
+        return None
+
+    try:
+        values = np.array(compact.translate(_IT2_SEPARATORS).split(), dtype=float)
+    except ValueError:
+        return None
+
+    if len(values) != 3 * element_count:
+        return None
+
+    return values[2::3], values[0::3], values[1::3]
+
+
+def parse_general_type2_representation(representation):
+    '''
+    Parses the representation of a general type-2 fuzzy set.
+    Representations written by the sets are split on their separators and
+    converted to floats at once. Any other representation is checked slice
+    by slice by regular expressions, locating the malformed input
+
+    Arguments:
+    ----------
+    representation -- string or bytes, the representation of the set
+
+    Returns:
+    --------
+    primary_domain_vals -- 1D array, the primary domain value of every point
+    secondary_domain_vals -- 1D array, the secondary domain value of every point
+    secondary_grades -- 1D array, the secondary grade of every point
+
+    Raises:
+    -------
+    RepresentationParserException -- if the representation is malformed
+    '''
+    primary_domain_vals, point_counts, secondary_domain_vals, secondary_grades = \
+        _parse_general_type2_slices(_encode(representation))
+
+    return np.repeat(primary_domain_vals, point_counts), secondary_domain_vals, secondary_grades
+
+
+def _parse_general_type2_slices(representation):
+    '''
+    Parses the bytes representation of a general type-2 fuzzy set.
+    Returns the primary domain value and the number of points of every
+    vertical slice, followed by the secondary domain values and secondary
+    grades of all the points, in the order of the representation
+    '''
+    parsed = _fast_parse_general_type2(representation)
+    if parsed is not None:
+        return parsed
+
+    point_values = []
+    primary_domain_vals = []
+    point_counts = []
+
+    pos = 0
+    while pos is not None:
+        match = _GT2_SLICE.match(representation, pos)
+        if match is None:
+            raise RepresentationParserException(
+                'Invalid vertical slice', _error_offset(representation, pos))
+
+        slice_points = match.group(1)
+        if _GT2_POINTS.fullmatch(slice_points) is None:
+            raise RepresentationParserException(
+                'Invalid point', _points_error_offset(slice_points, match.start(1)))
+
+        # the numbers are taken from the matches, a '+' may be the sign of an exponent
+        point_values.extend(number for point in _GT2_POINT.finditer(slice_points) for number in point.groups())
+        primary_domain_vals.append(match.group(2))
+        point_counts.append(slice_points.count(b'/'))
+
+        pos = _separator(representation, match.end())
+
+    values = np.array(point_values, dtype=float)
+
+    return (np.array(primary_domain_vals, dtype=float), np.array(point_counts, dtype=int),
+            values[1::2], values[0::2])
+
+
+def parse_interval_type2_representation(representation):
+    '''
+    Parses the representation of an interval type-2 fuzzy set.
+    An element having a single value [v]/x has equal lower and upper
+    membership functions, as written by CrispSet.__str__
+
+    Arguments:
+    ----------
+    representation -- string or bytes, the representation of the set
+
+    Returns:
+    --------
+    primary_domain_vals -- 1D array, the primary domain values
+    lower_vals -- 1D array, the lower membership function
+    upper_vals -- 1D array, the upper membership function
+
+    Raises:
+    -------
+    RepresentationParserException -- if the representation is malformed
+    '''
+    representation = _encode(representation)
+
+    parsed = _fast_parse_interval_type2(representation)
+    if parsed is not None:
+        return parsed
+
+    lower_vals = []
+    upper_vals = []
+    primary_domain_vals = []
+
+    pos = 0
+    while pos is not None:
+        match = _IT2_ELEMENT.match(representation, pos)
+        if match is None:
+            raise RepresentationParserException(
+                'Invalid element', _error_offset(representation, pos))
+
+        left, right, primary_domain_val = match.groups()
+        lower_vals.append(left)
+        upper_vals.append(left if right is None else right)
+        primary_domain_vals.append(primary_domain_val)
+
+        pos = _separator(representation, match.end())
+
+    return (np.array(primary_domain_vals, dtype=float),
+            np.array(lower_vals, dtype=float),
+            np.array(upper_vals, dtype=float))
+
+
+def _complete_elements(file, opening, chunk_size):
+    '''
+    Reads a binary file in chunks of chunk_size bytes and yields
+    (offset, elements) pairs, where elements are the bytes of the complete
+    elements read so far, without the '+' that follows them, and offset is
+    their byte offset in the file. Since an element starts with the opening
+    byte, '(' or '[', the elements before the last opening byte read are
+    complete. The buffer holds at most a chunk and an element
+    '''
+    buffer = b''
+    offset = 0
+
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+
+        buffer += chunk
+        start = buffer.rfind(opening)
+        elements = buffer[:start].rstrip()
+        if start <= 0 or not elements:
+            continue
+
+        if not elements.endswith(b'+'):
+            raise RepresentationParserException('Expected +', offset + start)
+
+        yield offset, elements[:-1]
+
+        offset += start
+        buffer = buffer[start:]
+
+    yield offset, buffer
+
+
+def _offset_errors(offset, parse, elements):
+    '''
+    Calls parse on elements read at byte offset, moving the offset of
+    a parsing error to the offset in the file
+    '''
+    try:
+        return parse(elements)
+    except RepresentationParserException as exp:
+        raise RepresentationParserException(exp.message, offset + exp.offset) from exp
+
+
+def iter_general_type2_slices(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    '''
+    Parses the representation of a general type-2 fuzzy set from a binary
+    file, reading chunk_size bytes at a time and yielding every vertical
+    slice as soon as it has been read, in the order of the file
+
+    Arguments:
+    ----------
+    file -- binary file object, the representation of the set
+    chunk_size -- int, the number of bytes read at a time
+
+    Returns:
+    --------
+    generator of (primary_domain_val, secondary_domain_vals, secondary_grades),
+    the float primary domain value and the 1D arrays of the points of every slice
+
+    Raises:
+    -------
+    RepresentationParserException -- if the representation is malformed,
+                the offset is the byte offset in the file
+    '''
+    for offset, elements in _complete_elements(file, b'(', chunk_size):
+        primary_domain_vals, point_counts, secondary_domain_vals, secondary_grades = \
+            _offset_errors(offset, _parse_general_type2_slices, elements)
+
+        ends = np.cumsum(point_counts)
+        starts = ends - point_counts
+
+        for primary_domain_val, start, end in zip(
+                primary_domain_vals.tolist(), starts.tolist(), ends.tolist()):
+            yield primary_domain_val, secondary_domain_vals[start:end], secondary_grades[start:end]
+
+
+def iter_interval_type2_elements(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    '''
+    Parses the representation of an interval type-2 fuzzy set from a binary
+    file, reading chunk_size bytes at a time and yielding every element
+    as soon as it has been read, in the order of the file
+
+    Arguments:
+    ----------
+    file -- binary file object, the representation of the set
+    chunk_size -- int, the number of bytes read at a time
+
+    Returns:
+    --------
+    generator of (primary_domain_val, lower_val, upper_val) floats
+
+    Raises:
+    -------
+    RepresentationParserException -- if the representation is malformed,
+                the offset is the byte offset in the file
+    '''
+    for offset, elements in _complete_elements(file, b'[', chunk_size):
+        primary_domain_vals, lower_vals, upper_vals = \
+            _offset_errors(offset, parse_interval_type2_representation, elements)
+
+        yield from zip(primary_domain_vals.tolist(), lower_vals.tolist(), upper_vals.tolist())
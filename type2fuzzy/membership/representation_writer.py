@@ -0,0 +1,167 @@
+'''
+vectorized writing of the textual representation of general type-2 fuzzy sets
+
+general type-2 fuzzy sets:
+'(a1/u1 + a2/u2 + ... + an/un)/x1 + ... + (b1/u1 + b2/u2 + ... + bn/un)/xm'
+
+The secondary grades and secondary domain values are in [0, 1], so that
+with a fixed number of decimal places they all have the same width. The
+characters of a block of points are then computed as a 2D array of bytes,
+instead of formatting every value on its own.
+'''
+import itertools
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 1 << 16
+
+# the digits of scaled values are exact for up to 9 decimal places
+_MAX_DEC_PLACES = 9
+
+# distance from a rounding tie below which a value is formatted by %
+_TIE_TOLERANCE = 1e-6
+
+_POINT_SEPARATOR = np.frombuffer(b' / ', dtype=np.uint8)
+_TERM_SEPARATOR = np.frombuffer(b' + ', dtype=np.uint8)
+
+
+def format_unit_values(values, num_dec_places):
+    '''
+    Formats values in [0, 1] with num_dec_places decimal places as the rows
+    of a 2D array of ascii bytes, giving the same characters as
+    '%0.{num_dec_places}f' % value
+
+    Arguments:
+    ----------
+    values -- 1D array, the values to format
+    num_dec_places -- int, the number of decimal places
+
+    Returns:
+    --------
+    characters -- 2D uint8 array of shape (len(values), num_dec_places + 2),
+                None if some value cannot be formatted this way; values outside
+                [0, 1], negative zeros or a number of decimal places not in [1, 9]
+    '''
+    if not 1 <= num_dec_places <= _MAX_DEC_PLACES:
+        return None
+
+    values = np.asarray(values, dtype=float)
+
+    # comparisons with NaN are False, so that NaN values are rejected
+    if not np.all((values >= 0) & (values <= 1) & ~np.signbit(values)):
+        return None
+
+    scale = 10 ** num_dec_places
+    scaled = values * scale
+    scaled_ints = np.rint(scaled).astype(np.int64)
+
+    characters = np.empty((len(values), num_dec_places + 2), dtype=np.uint8)
+    characters[:, 0] = ord('0') + scaled_ints // scale
+    characters[:, 1] = ord('.')
+
+    remainder = scaled_ints % scale
+    for column in range(num_dec_places + 1, 1, -1):
+        characters[:, column] = ord('0') + remainder % 10
+        remainder //= 10
+
+    # scaling can move a value across a rounding tie, these values are formatted by %
+    value_format = f'%0.{num_dec_places}f'
+    for idx in np.flatnonzero(np.abs(np.abs(scaled - np.rint(scaled)) - 0.5) < _TIE_TOLERANCE).tolist():
+        characters[idx] = np.frombuffer((value_format % values[idx]).encode('ascii'), dtype=np.uint8)
+
+    return characters
+
+
+def _format_points(secondary_grades, secondary_domain_vals, num_dec_places):
+    '''
+    Formats the points of consecutive vertical slices as rows of bytes of
+    the form 'a / u + ', returns None if the values cannot be formatted
+    by format_unit_values
+    '''
+    grade_characters = format_unit_values(secondary_grades, num_dec_places)
+    if grade_characters is None:
+        return None
+
+    domain_characters = format_unit_values(secondary_domain_vals, num_dec_places)
+    if domain_characters is None:
+        return None
+
+    return np.hstack((
+        grade_characters,
+        np.broadcast_to(_POINT_SEPARATOR, (len(secondary_grades), 3)),
+        domain_characters,
+        np.broadcast_to(_TERM_SEPARATOR, (len(secondary_grades), 3))))
+
+
+def _format_slice(primary_domain_val, secondary_domain_vals, secondary_grades, value_format):
+    '''formats a vertical slice value by value'''
+    point_format = f'{value_format} / {value_format}'
+
+    return '(' + ' + '.join(point_format % point for point in zip(
+        secondary_grades, secondary_domain_vals)) + ') / ' + value_format % primary_domain_val
+
+
+def _format_block(block, num_dec_places):
+    '''
+    Formats a block of vertical slices, given as a list of
+    (primary_domain_val, secondary_domain_vals, secondary_grades)
+    '''
+    value_format = f'%0.{num_dec_places}f'
+
+    point_counts = [len(secondary_grades) for _, _, secondary_grades in block]
+    points = _format_points(
+        np.fromiter(itertools.chain.from_iterable(grades for _, _, grades in block), dtype=float),
+        np.fromiter(itertools.chain.from_iterable(domain for _, domain, _ in block), dtype=float),
+        num_dec_places)
+
+    if points is None:
+        return ' + '.join(_format_slice(*vertical_slice, value_format) for vertical_slice in block)
+
+    # the points of the whole block, the ' + ' after the last point of every slice is dropped
+    text = points.tobytes().decode('ascii')
+    row_length = points.shape[1]
+
+    represented_slices = []
+    start = 0
+    for (primary_domain_val, _, _), point_count in zip(block, point_counts):
+        end = start + point_count * row_length
+        represented_slices.append(
+            '(' + text[start:max(start, end - 3)] + ') / ' + value_format % primary_domain_val)
+        start = end
+
+    return ' + '.join(represented_slices)
+
+
+def general_type2_representation_blocks(vertical_slices, num_dec_places,
+                                        block_size=DEFAULT_BLOCK_SIZE):
+    '''
+    Generates the representation of a general type-2 fuzzy set in blocks
+    of about block_size points, so that the representation can be written
+    to a file without holding all of it in memory
+
+    Arguments:
+    ----------
+    vertical_slices -- iterable of (primary_domain_val, secondary_domain_vals,
+                    secondary_grades), the vertical slices in the order written
+    num_dec_places -- int, number of decimal places of all the values
+    block_size -- int, number of points formatted at a time
+
+    Returns:
+    --------
+    generator of strings, joining them gives the representation of the set
+    '''
+    block = []
+    block_points = 0
+    separator = ''
+
+    for vertical_slice in vertical_slices:
+        block.append(vertical_slice)
+        block_points += len(vertical_slice[2])
+
+        if block_points >= block_size:
+            yield separator + _format_block(block, num_dec_places)
+            separator = ' + '
+            block = []
+            block_points = 0
+
+    if block:
+        yield separator + _format_block(block, num_dec_places)
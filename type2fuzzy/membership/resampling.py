@@ -0,0 +1,151 @@
+'''
+resampling of fuzzy sets onto new domain grids
+'''
+import numpy as np
+
+RESAMPLING_METHODS = ('max', 'linear')
+
+
+def nearest_index(grid, values):
+    '''
+    Finds the index of the grid value nearest to every value by binary search.
+    Ties go to the lower grid value, as with np.argmin(np.abs(grid - value))
+    on a sorted grid
+
+    Arguments:
+    ----------
+    grid -- 1D array, the grid values, not necessarily sorted
+    values -- 1D array, the values to snap
+
+    Returns:
+    --------
+    indices -- 1D int array, the index in grid of the nearest value
+    '''
+    grid = np.asarray(grid, dtype=float)
+    values = np.asarray(values, dtype=float)
+
+    order = np.argsort(grid, kind='stable')
+    sorted_grid = grid[order]
+
+    right = np.clip(np.searchsorted(sorted_grid, values), 1, len(sorted_grid) - 1)
+    left = right - 1
+
+    if len(sorted_grid) == 1:
+        right = left = np.zeros_like(right)
+
+    nearest = np.where(
+        values - sorted_grid[left] <= sorted_grid[right] - values, left, right)
+
+    return order[nearest]
+
+
+def _group_max(array, target_idx, target_size, axis):
+    '''
+    Aggregates the slices of array along axis having the same target index
+    by the maximum. Targets not receiving any slice are 0
+    '''
+    order = np.argsort(target_idx, kind='stable')
+    sorted_idx = target_idx[order]
+
+    starts = np.flatnonzero(np.r_[True, sorted_idx[1:] != sorted_idx[:-1]])
+    reduced = np.maximum.reduceat(np.take(array, order, axis=axis), starts, axis=axis)
+
+    shape = list(array.shape)
+    shape[axis] = target_size
+    grouped = np.zeros(shape)
+
+    if axis == 0:
+        grouped[sorted_idx[starts], :] = reduced
+    else:
+        grouped[:, sorted_idx[starts]] = reduced
+
+    return grouped
+
+
+def snap_max(primary_domain, secondary_domain, source_primary_domain,
+                source_secondary_domain, source_array):
+    '''
+    Snaps the points of a grid of secondary grades onto the nearest primary
+    and secondary domain values. Points falling on the same grid point are
+    aggregated by the maximum. Since every source row and column is snapped
+    as a whole, the grid is reduced along each axis in turn
+
+    Arguments:
+    ----------
+    primary_domain -- 1D array, the new primary domain
+    secondary_domain -- 1D array, the new secondary domain
+    source_primary_domain -- 1D array, the primary domain of source_array
+    source_secondary_domain -- 1D array, the secondary domain of source_array
+    source_array -- 2D array, rows map to source_secondary_domain,
+                    columns to source_primary_domain
+
+    Returns:
+    --------
+    set_array -- 2D array, rows map to secondary_domain, columns to primary_domain
+    '''
+    if 0 in (len(primary_domain), len(secondary_domain), np.size(source_array)):
+        return np.zeros((len(secondary_domain), len(primary_domain)))
+
+    rows = nearest_index(secondary_domain, source_secondary_domain)
+    cols = nearest_index(primary_domain, source_primary_domain)
+
+    set_array = _group_max(source_array, rows, len(secondary_domain), axis=0)
+
+    return _group_max(set_array, cols, len(primary_domain), axis=1)
+
+
+def _linear_weights(grid, values):
+    '''
+    Returns the indices and weights interpolating sorted grid at values,
+    together with a mask of the values inside the grid range
+    '''
+    right = np.clip(np.searchsorted(grid, values), 1, max(len(grid) - 1, 1))
+    left = right - 1
+
+    if len(grid) == 1:
+        right = left
+        weight = np.zeros(len(values))
+    else:
+        weight = (values - grid[left]) / (grid[right] - grid[left])
+
+    inside = (values >= grid[0]) & (values <= grid[-1])
+
+    return left, right, weight, inside
+
+
+def interpolate_linear(primary_domain, secondary_domain, set_array,
+                        new_primary_domain, new_secondary_domain):
+    '''
+    Bilinear interpolation of a grid of secondary grades onto new domains.
+    Grid points outside the original domains have a secondary grade of 0
+
+    Arguments:
+    ----------
+    primary_domain -- 1D array, the sorted primary domain of set_array
+    secondary_domain -- 1D array, the sorted secondary domain of set_array
+    set_array -- 2D array, rows map to secondary_domain, columns to primary_domain
+    new_primary_domain -- 1D array, the new primary domain
+    new_secondary_domain -- 1D array, the new secondary domain
+
+    Returns:
+    --------
+    set_array -- 2D array, rows map to new_secondary_domain, columns to new_primary_domain
+    '''
+    new_primary_domain = np.asarray(new_primary_domain, dtype=float)
+    new_secondary_domain = np.asarray(new_secondary_domain, dtype=float)
+
+    if len(primary_domain) == 0 or len(secondary_domain) == 0:
+        return np.zeros((len(new_secondary_domain), len(new_primary_domain)))
+
+    x_left, x_right, x_weight, x_inside = _linear_weights(primary_domain, new_primary_domain)
+    u_left, u_right, u_weight, u_inside = _linear_weights(secondary_domain, new_secondary_domain)
+
+    # interpolate along the secondary domain, then along the primary domain
+    u_weight = u_weight[:, np.newaxis]
+    columns = (1 - u_weight) * set_array[u_left, :] + u_weight * set_array[u_right, :]
+    resampled = (1 - x_weight) * columns[:, x_left] + x_weight * columns[:, x_right]
+
+    resampled[~u_inside, :] = 0
+    resampled[:, ~x_inside] = 0
+
+    return resampled
@@ -0,0 +1,116 @@
+'''
+max-min join and meet of membership functions on sorted domains
+
+The join of f and g gives to every t the maximum of min(f(u), g(v)) over
+the pairs with max(u, v) = t. Either u = t and v <= t, or v = t and u <= t,
+so that
+    join(t) = max(min(f(t), max{g(v) : v <= t}), min(g(t), max{f(u) : u <= t}))
+and the inner maxima are running maxima over the sorted domains. The meet,
+over the pairs with min(u, v) = t, uses running maxima from the right.
+
+For convex normal membership functions this is the usual closed form of the
+join and meet, but the sweep holds for any discrete membership functions,
+so that it needs neither a convexity check nor a quadratic fallback.
+
+Reference:
+----------
+N. N. Karnik and J. M. Mendel, "Operations on type-2 fuzzy sets,"
+Fuzzy Sets and Systems, vol. 122, no. 2, pp. 327–348, 2001.
+'''
+import numpy as np
+
+
+def _combine(domain, grades):
+    '''
+    Merges the candidate grades of repeated domain values, keeping the maximum.
+    Returns the sorted distinct domain values and their grades
+    '''
+    order = np.lexsort((grades, domain))
+    domain = domain[order]
+    grades = grades[order]
+
+    # the last of every run of equal domain values has the highest grade
+    last = np.ones(len(domain), dtype=bool)
+    last[:-1] = domain[1:] != domain[:-1]
+
+    return domain[last], grades[last]
+
+
+def max_min_join(domain_a, grades_a, domain_b, grades_b):
+    '''
+    Finds the max-min join of two membership functions in O((n+m) log(n+m))
+
+    Arguments:
+    ----------
+    domain_a -- 1D array, the sorted distinct domain values of the first function
+    grades_a -- 1D array, the degrees of membership of the first function
+    domain_b -- 1D array, the sorted distinct domain values of the second function
+    grades_b -- 1D array, the degrees of membership of the second function
+
+    Returns:
+    --------
+    domain -- 1D array, the sorted domain values max(u, v) of all the pairs
+    grades -- 1D array, the degrees of membership of the join
+    '''
+    domain_a = np.asarray(domain_a, dtype=float)
+    grades_a = np.asarray(grades_a, dtype=float)
+    domain_b = np.asarray(domain_b, dtype=float)
+    grades_b = np.asarray(grades_b, dtype=float)
+
+    if len(domain_a) == 0 or len(domain_b) == 0:
+        return np.empty(0), np.empty(0)
+
+    running_max_a = np.maximum.accumulate(grades_a)
+    running_max_b = np.maximum.accumulate(grades_b)
+
+    # the number of values of the other domain not above every value
+    below_a = np.searchsorted(domain_b, domain_a, side='right')
+    below_b = np.searchsorted(domain_a, domain_b, side='right')
+
+    in_a = below_a > 0
+    in_b = below_b > 0
+
+    return _combine(
+        np.concatenate((domain_a[in_a], domain_b[in_b])),
+        np.concatenate((np.minimum(grades_a[in_a], running_max_b[below_a[in_a] - 1]),
+                        np.minimum(grades_b[in_b], running_max_a[below_b[in_b] - 1]))))
+
+
+def max_min_meet(domain_a, grades_a, domain_b, grades_b):
+    '''
+    Finds the max-min meet of two membership functions in O((n+m) log(n+m))
+
+    Arguments:
+    ----------
+    domain_a -- 1D array, the sorted distinct domain values of the first function
+    grades_a -- 1D array, the degrees of membership of the first function
+    domain_b -- 1D array, the sorted distinct domain values of the second function
+    grades_b -- 1D array, the degrees of membership of the second function
+
+    Returns:
+    --------
+    domain -- 1D array, the sorted domain values min(u, v) of all the pairs
+    grades -- 1D array, the degrees of membership of the meet
+    '''
+    domain_a = np.asarray(domain_a, dtype=float)
+    grades_a = np.asarray(grades_a, dtype=float)
+    domain_b = np.asarray(domain_b, dtype=float)
+    grades_b = np.asarray(grades_b, dtype=float)
+
+    if len(domain_a) == 0 or len(domain_b) == 0:
+        return np.empty(0), np.empty(0)
+
+    running_max_a = np.maximum.accumulate(grades_a[::-1])[::-1]
+    running_max_b = np.maximum.accumulate(grades_b[::-1])[::-1]
+
+    # the first value of the other domain not below every value
+    above_a = np.searchsorted(domain_b, domain_a, side='left')
+    above_b = np.searchsorted(domain_a, domain_b, side='left')
+
+    in_a = above_a < len(domain_b)
+    in_b = above_b < len(domain_a)
+
+    return _combine(
+        np.concatenate((domain_a[in_a], domain_b[in_b])),
+        np.concatenate((np.minimum(grades_a[in_a], running_max_b[above_a[in_a]]),
+                        np.minimum(grades_b[in_b], running_max_a[above_b[in_b]]))))
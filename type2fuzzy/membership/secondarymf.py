@@ -14,3 +14,28 @@ class SecondaryMembershipFunction(Type1FuzzySet):
 
     def __init__(self):
         super().__init__()
+
+    def add_elements(self, secondary_domain_vals, secondary_grades):
+        '''
+        Adds the elements of a whole vertical slice at once. Unlike add_element
+        the secondary grades are not checked, the caller must have validated
+        them. As in add_element, the highest secondary grade is kept for
+        repeated secondary domain values
+
+        Arguments:
+        ----------
+        secondary_domain_vals -- list of float, the secondary domain values
+        secondary_grades -- list of float, the corresponding secondary grades
+        '''
+        elements = self._elements
+
+        if not elements and len(set(secondary_domain_vals)) == len(secondary_domain_vals):
+            elements.update(zip(secondary_domain_vals, secondary_grades))
+        else:
+            for secondary_domain_val, secondary_grade in zip(secondary_domain_vals, secondary_grades):
+                if secondary_domain_val in elements:
+                    secondary_grade = max(elements[secondary_domain_val], secondary_grade)
+                elements[secondary_domain_val] = secondary_grade
+
+        if elements:
+            self._empty = False
@@ -0,0 +1,132 @@
+'''
+binary persistence of fuzzy sets
+
+A set is saved as an uncompressed .npz archive holding the raw float
+arrays of the set, together with a small header made of the name of the
+set class and the version of the format. Since the arrays are stored
+uncompressed, they can be memory mapped when loading, so that large sets
+open without reading the file and only the pages that are touched are read.
+'''
+import struct
+import zipfile
+import numpy as np
+import numpy.lib.format as npy_format
+
+FORMAT_VERSION = 1
+
+MMAP_MODES = ('r', 'r+', 'c')
+
+_HEADER_NAMES = ('set_type', 'format_version')
+
+# size of the fixed part of a zip local file header
+_LOCAL_HEADER_SIZE = 30
+
+
+class SetPersistenceException(Exception):
+    '''Set persistence exception'''
+    def __init__(self, message):
+        super().__init__(message)
+
+
+def save_arrays(filename, set_type, **arrays):
+    '''
+    Saves the arrays of a set in an uncompressed .npz file
+
+    Arguments:
+    ----------
+    filename -- string, the name of the file, used as given
+    set_type -- string, the name of the set class
+    arrays -- the arrays of the set, by name
+
+    Raises:
+    -------
+    SetPersistenceException -- if the file cannot be written
+    '''
+    try:
+        with open(filename, 'wb') as file:
+            np.savez(file, set_type=np.array(set_type),
+                        format_version=np.array(FORMAT_VERSION), **arrays)
+    except IOError as exp:
+        raise SetPersistenceException(f'Unable to write file {filename}') from exp
+
+
+def _memmap_member(filename, file, info, mmap_mode):
+    '''
+    Memory maps the .npy member of an uncompressed .npz file,
+    reading only the zip and .npy headers
+    '''
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise SetPersistenceException(
+            f'{info.filename} is compressed and cannot be memory mapped')
+
+    file.seek(info.header_offset)
+    name_length, extra_length = struct.unpack(
+        '<2H', file.read(_LOCAL_HEADER_SIZE)[_LOCAL_HEADER_SIZE-4:])
+    file.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length)
+
+    version = npy_format.read_magic(file)
+    if version == (1, 0):
+        shape, fortran_order, dtype = npy_format.read_array_header_1_0(file)
+    else:
+        shape, fortran_order, dtype = npy_format.read_array_header_2_0(file)
+
+    if dtype.hasobject:
+        raise SetPersistenceException(f'{info.filename} holds objects')
+
+    # empty arrays cannot be memory mapped
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype)
+
+    return np.memmap(filename, dtype=dtype, mode=mmap_mode, offset=file.tell(),
+                        shape=shape, order='F' if fortran_order else 'C')
+
+
+def load_arrays(filename, set_type, names, mmap_mode=None):
+    '''
+    Loads the arrays of a set saved by save_arrays
+
+    Arguments:
+    ----------
+    filename -- string, the name of the file
+    set_type -- string, the name of the expected set class
+    names -- list of string, the names of the arrays to load
+    mmap_mode -- None to read the arrays in memory, or one of 'r', 'r+'
+                or 'c' to memory map them, as in numpy.load
+
+    Returns:
+    --------
+    arrays -- list of the arrays, in the order of names
+
+    Raises:
+    -------
+    SetPersistenceException -- if the file cannot be read or does not hold
+                the arrays of a set of type set_type in this format version
+    '''
+    if mmap_mode is not None and mmap_mode not in MMAP_MODES:
+        raise SetPersistenceException(f'Invalid mmap mode {mmap_mode}, must be one of {MMAP_MODES}')
+
+    try:
+        with np.load(filename, allow_pickle=False) as npz_file:
+            if not set(_HEADER_NAMES).issubset(npz_file.files):
+                raise SetPersistenceException(f'{filename} is not a fuzzy set file')
+
+            if str(npz_file['set_type']) != set_type:
+                raise SetPersistenceException(
+                    f'{filename} holds a {npz_file["set_type"]} set, expected {set_type}')
+
+            if int(npz_file['format_version']) != FORMAT_VERSION:
+                raise SetPersistenceException(
+                    f'Unsupported format version {npz_file["format_version"]} in {filename}')
+
+            missing = [name for name in names if name not in npz_file.files]
+            if missing:
+                raise SetPersistenceException(f'{filename} is missing {", ".join(missing)}')
+
+            if mmap_mode is None:
+                return [npz_file[name] for name in names]
+
+        with zipfile.ZipFile(filename) as zip_file, open(filename, 'rb') as file:
+            return [_memmap_member(filename, file, zip_file.getinfo(f'{name}.npy'), mmap_mode)
+                    for name in names]
+    except (IOError, ValueError, zipfile.BadZipFile) as exp:
+        raise SetPersistenceException(f'Could not read file {filename}') from exp
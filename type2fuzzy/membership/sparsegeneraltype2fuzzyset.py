@@ -0,0 +1,417 @@
+'''
+Sparse General Type-2 Fuzzy Set
+contains the following classes:
+- SparseGeneralType2FuzzySet
+- SparseGeneralType2FuzzySetException
+'''
+import math
+import numpy as np
+from type2fuzzy.membership.crispset import CrispSet
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.membership.densegeneraltype2fuzzyset import DenseGeneralType2FuzzySet
+from type2fuzzy.membership.embeddedtype2sets import EmbeddedType2FuzzySets
+from type2fuzzy.membership.set_persistence import save_arrays, load_arrays
+from type2fuzzy.membership.zslicing import z_slice_bounds
+
+
+class SparseGeneralType2FuzzySetException(Exception):
+    ''' Sparse General Type-2 Fuzzy Set Exception '''
+    def __init__(self, message):
+        super().__init__(message)
+
+
+class SparseGeneralType2FuzzySet:
+    '''
+    A sparse implementation of a general type 2 fuzzy set, suited to
+    sets having a narrow footprint of uncertainty.
+    Only the points having a secondary grade > 0 are stored,
+    compressed by vertical slice:
+    primary_domain -- sorted vector of primary domain values
+    secondary_domain -- sorted vector of secondary domain values
+    indptr -- the points of the vertical slice at primary_domain[i]
+                are stored at positions indptr[i]:indptr[i+1]
+    indices -- index in secondary_domain of every point,
+                sorted within each vertical slice
+    grades -- secondary grade of every point
+    '''
+
+    def __init__(self, primary_domain, secondary_domain, indptr, indices, grades):
+        '''
+        Creates a sparse general type-2 fuzzy set from its compressed representation
+
+        Arguments:
+        ----------
+        primary_domain -- 1D array, sorted values of the primary domain
+        secondary_domain -- 1D array, sorted values of the secondary domain
+        indptr -- 1D int array of length len(primary_domain) + 1
+        indices -- 1D int array, secondary domain index of every point
+        grades -- 1D array, secondary grade of every point
+
+        Raises:
+        -------
+        SparseGeneralType2FuzzySetException -- if the compressed representation is invalid
+        '''
+        self._primary_domain = np.asarray(primary_domain, dtype=float)
+        self._secondary_domain = np.asarray(secondary_domain, dtype=float)
+        self._indptr = np.asarray(indptr, dtype=np.intp)
+        self._indices = np.asarray(indices, dtype=np.intp)
+        self._grades = np.asarray(grades, dtype=float)
+
+        if len(self._indptr) != len(self._primary_domain) + 1:
+            raise SparseGeneralType2FuzzySetException('Primary domain size mismatch')
+
+        if len(self._indices) != len(self._grades) or self._indptr[-1] != len(self._grades):
+            raise SparseGeneralType2FuzzySetException('Number of points mismatch')
+
+        if np.any(np.diff(self._primary_domain) <= 0):
+            raise SparseGeneralType2FuzzySetException('Primary domain must be sorted and unique')
+
+        if np.any(np.diff(self._secondary_domain) <= 0):
+            raise SparseGeneralType2FuzzySetException('Secondary domain must be sorted and unique')
+
+        if np.any((self._secondary_domain < 0) | (self._secondary_domain > 1)):
+            raise SparseGeneralType2FuzzySetException('Invalid secondary domain value')
+
+        if np.any((self._grades <= 0) | (self._grades > 1)):
+            raise SparseGeneralType2FuzzySetException('Invalid secondary grade value')
+
+        if np.any((self._indices < 0) | (self._indices >= len(self._secondary_domain))):
+            raise SparseGeneralType2FuzzySetException('Invalid secondary domain index')
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}('
+                f'primary_domain={len(self._primary_domain)}, '
+                f'secondary_domain={len(self._secondary_domain)}, '
+                f'points={len(self._grades)})')
+
+    @classmethod
+    def from_dense(cls, dgt2fs):
+        '''
+        Creates a sparse general type-2 fuzzy set from a dense one
+
+        Arguments:
+        ----------
+        dgt2fs -- DenseGeneralType2FuzzySet, the set to convert
+
+        Returns:
+        --------
+        sgt2fs -- SparseGeneralType2FuzzySet
+        '''
+        primary_domain, secondary_domain, set_array = dgt2fs.to_array_explicit()
+
+        # transposing makes np.nonzero return the points sorted by
+        # vertical slice and then by secondary domain
+        slice_array = set_array.T
+        slice_idx, indices = np.nonzero(slice_array)
+
+        indptr = np.zeros(len(primary_domain) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(slice_idx, minlength=len(primary_domain)), out=indptr[1:])
+
+        return cls(primary_domain, secondary_domain, indptr, indices,
+                   slice_array[slice_idx, indices])
+
+    @classmethod
+    def from_array(cls, primary_domain, secondary_domain, set_array):
+        '''
+        Creates a sparse general type-2 fuzzy set from an array representation
+        of the set, having the same arguments as GeneralType2FuzzySet.from_array.
+        Points having a secondary grade of 0 are not stored
+
+        Arguments:
+        ----------
+        primary_domain -- list containing the values of the primary domain
+        secondary_domain -- list containing the values of the secondary domain
+        set_array -- 2D array containing the secondary grade values of the gt2fs
+
+        Returns:
+        --------
+        sgt2fs -- SparseGeneralType2FuzzySet
+        '''
+        return cls.from_dense(
+            DenseGeneralType2FuzzySet(primary_domain, secondary_domain, set_array))
+
+    @classmethod
+    def from_general_type2_set(cls, gt2fs):
+        '''
+        Creates a sparse general type-2 fuzzy set from a general type-2 fuzzy set,
+        without building the dense grid
+
+        Arguments:
+        ----------
+        gt2fs -- GeneralType2FuzzySet, the set to convert
+
+        Returns:
+        --------
+        sgt2fs -- SparseGeneralType2FuzzySet
+        '''
+        primary_domain = sorted(gt2fs.primary_domain())
+
+        slices = [gt2fs[primary_domain_val].elements() for primary_domain_val in primary_domain]
+
+        secondary_domain = set()
+        for vertical_slice in slices:
+            secondary_domain.update(vertical_slice)
+        secondary_domain = sorted(secondary_domain)
+        secondary_domain_idx = {val: idx for idx, val in enumerate(secondary_domain)}
+
+        indptr = [0]
+        indices = []
+        grades = []
+        for vertical_slice in slices:
+            for secondary_domain_val in sorted(vertical_slice):
+                secondary_grade = vertical_slice[secondary_domain_val]
+                if secondary_grade > 0:
+                    indices.append(secondary_domain_idx[secondary_domain_val])
+                    grades.append(secondary_grade)
+            indptr.append(len(grades))
+
+        return cls(primary_domain, secondary_domain, indptr, indices, grades)
+
+    def to_dense(self):
+        '''
+        Converts this set to the dense layout
+
+        Returns:
+        --------
+        dgt2fs -- DenseGeneralType2FuzzySet
+        '''
+        set_array = np.zeros((len(self._secondary_domain), len(self._primary_domain)))
+        set_array[self._indices, self._slice_index()] = self._grades
+
+        return DenseGeneralType2FuzzySet(self._primary_domain, self._secondary_domain, set_array)
+
+    def save_npz(self, set_filename):
+        '''
+        Saves the compressed representation of the set as raw arrays
+        in an uncompressed .npz file
+
+        Arguments:
+        ----------
+        set_filename -- string, the name of the file, used as given
+
+        Raises:
+        -------
+        SetPersistenceException -- if the file cannot be written
+        '''
+        save_arrays(set_filename, self.__class__.__name__,
+                    primary_domain=self._primary_domain,
+                    secondary_domain=self._secondary_domain,
+                    indptr=self._indptr,
+                    indices=self._indices,
+                    grades=self._grades)
+
+    @classmethod
+    def load_npz(cls, set_filename, mmap_mode=None):
+        '''
+        Loads a sparse general type-2 fuzzy set saved by save_npz.
+        Memory mapped arrays are used as they are, without a copy
+
+        Arguments:
+        ----------
+        set_filename -- string, the name of the file
+        mmap_mode -- None, 'r', 'r+' or 'c', memory maps the arrays as in numpy.load
+
+        Returns:
+        --------
+        sgt2fs -- SparseGeneralType2FuzzySet
+
+        Raises:
+        -------
+        SetPersistenceException -- if the file cannot be read or does not hold
+                    a sparse general type-2 fuzzy set
+        '''
+        return cls(*load_arrays(
+            set_filename, cls.__name__,
+            ('primary_domain', 'secondary_domain', 'indptr', 'indices', 'grades'), mmap_mode))
+
+    def _slice_index(self):
+        '''
+        Returns, for every stored point, the index of its vertical slice
+        '''
+        return np.repeat(np.arange(len(self._primary_domain)), np.diff(self._indptr))
+
+    def _primary_domain_index(self, primary_domain_val):
+        '''
+        Finds the vertical slice of a primary domain value by binary search
+
+        Raises:
+        -------
+        SparseGeneralType2FuzzySetException -- if the value is not in the primary domain
+        '''
+        idx = np.searchsorted(self._primary_domain, primary_domain_val)
+
+        if idx == len(self._primary_domain) or self._primary_domain[idx] != primary_domain_val:
+            raise SparseGeneralType2FuzzySetException(
+                f'Primary domain value of {primary_domain_val} not in this set.')
+
+        return idx
+
+    def primary_domain(self):
+        '''
+        The primary domain of this fuzzy set
+
+        Returns:
+        --------
+        primary_domain -- 1D array containing all the values in the primary domain
+        '''
+        return self._primary_domain
+
+    def secondary_domain(self):
+        '''
+        The secondary domain of this fuzzy set
+
+        Returns:
+        --------
+        secondary_domain -- 1D array containing all the values in the secondary domain
+        '''
+        return self._secondary_domain
+
+    def element_count(self):
+        '''
+        Returns the number of stored points, i.e. the points having a secondary grade > 0
+        '''
+        return len(self._grades)
+
+    def vertical_slice(self, primary_domain_val):
+        '''
+        For a given value of the primary domain,
+        returns the points of the vertical slice having a secondary grade > 0
+
+        Arguments:
+        ----------
+        primary_domain_val -- value of primary domain
+
+        Returns:
+        --------
+        secondary_domain_vals -- 1D array, the secondary domain values of the points
+        secondary_grades -- 1D array, the secondary grades of the points
+        '''
+        idx = self._primary_domain_index(primary_domain_val)
+        start, end = self._indptr[idx], self._indptr[idx + 1]
+
+        return self._secondary_domain[self._indices[start:end]], self._grades[start:end]
+
+    def footprint_of_uncertainty(self):
+        '''
+        For all values of x, return the limits of the values of u where
+        the secondary grade > 0. Computed from the first and last point
+        of every vertical slice
+
+        Reference:
+        ----------
+        J. M. Mendel and R. I. B. John, “Type-2 fuzzy sets made simple,” IEEE
+        Trans. Fuzzy Systems, vol. 10, no. 2, pp. 117–127, Apr. 2002.
+
+        Returns:
+        --------
+        footprint -- dict of primary domain element : CrispSet
+        '''
+        non_empty = np.diff(self._indptr) > 0
+
+        lower = self._secondary_domain[self._indices[self._indptr[:-1][non_empty]]]
+        upper = self._secondary_domain[self._indices[self._indptr[1:][non_empty] - 1]]
+
+        fou = {}
+        for primary_domain_val, left, right in zip(
+                self._primary_domain[non_empty].tolist(), lower.tolist(), upper.tolist()):
+            fou[primary_domain_val] = CrispSet(left, right)
+
+        return fou
+
+    def z_slice(self, slice_value):
+        '''
+        Creates the interval type-2 fuzzy set at level slice_value, visiting only
+        the stored points. As in Type1FuzzySet.alpha_cut, a level of 0 includes
+        the non-zero secondary grades only
+
+        Arguments:
+        ----------
+        slice_value -- float, the z-level
+
+        Returns:
+        --------
+        sliced_set -- IntervalType2FuzzySet
+        '''
+        if slice_value == 0:
+            mask = self._grades > 0
+        else:
+            mask = self._grades >= slice_value
+
+        slice_idx = self._slice_index()[mask]
+        indices = self._indices[mask]
+
+        # points are sorted by slice and by secondary domain, so the first
+        # and last point of every slice give the lower and upper bounds
+        boundary = np.ones(len(slice_idx), dtype=bool)
+        boundary[1:] = slice_idx[1:] != slice_idx[:-1]
+        first = np.flatnonzero(boundary)
+        last = np.empty_like(first)
+        last[:-1] = first[1:] - 1
+        last[-1:] = len(slice_idx) - 1
+        included = slice_idx[first]
+
+        return IntervalType2FuzzySet.from_hmf_lmf(
+            self._primary_domain[included],
+            self._secondary_domain[indices[last]],
+            self._secondary_domain[indices[first]])
+
+    def secondary_grade_levels(self):
+        '''
+        Returns the sorted distinct non-zero secondary grades of this set,
+        the levels at which its z-slices change, so that slicing at these
+        levels represents the set exactly
+
+        Returns:
+        --------
+        z_vals -- 1D array, the sorted distinct non-zero secondary grades
+        '''
+        # only the non-zero secondary grades are stored
+        return np.unique(self._grades)
+
+    def z_slice_bounds(self, z_vals):
+        '''
+        Finds the bounds of the z-slices at all the given levels at once,
+        visiting only the stored points and giving the same intervals as z_slice
+
+        Arguments:
+        ----------
+        z_vals -- 1D array, the z-levels
+
+        Returns:
+        --------
+        primary_domain -- 1D array, the sorted primary domain values
+        bounds -- 3D array of shape (len(z_vals), len(primary_domain), 2), the lower
+                    and upper bounds of every z-slice, NaN where a primary
+                    domain value is not part of a z-slice
+        '''
+        return self._primary_domain, z_slice_bounds(
+            self._indptr, self._secondary_domain[self._indices], self._grades, z_vals)
+
+    def embedded_type2_sets_count(self):
+        '''
+        returns the number of embedded type-2 fuzzy sets that can be
+        generated from this general type-2 fuzzy set, computed as an exact
+        integer from the number of points in each vertical slice
+
+        Reference:
+        ----------
+        J. M. Mendel and R. I. B. John, “Type-2 fuzzy sets made simple,” IEEE
+        Trans. Fuzzy Systems, vol. 10, no. 2, pp. 117–127, Apr. 2002.
+
+        Returns:
+        --------
+        embedded_count -- int, number of et2fs
+        '''
+        return math.prod(np.diff(self._indptr).tolist())
+
+    def embedded_type2_set_sequence(self):
+        '''
+        Returns a lazy sequence of the embedded type-2 fuzzy sets of this set,
+        sharing the compressed representation of the vertical slices
+
+        Returns:
+        --------
+        embedded_sets -- EmbeddedType2FuzzySets
+        '''
+        return EmbeddedType2FuzzySets(self._primary_domain, self._indptr,
+                                        self._secondary_domain[self._indices], self._grades)
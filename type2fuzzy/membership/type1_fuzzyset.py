@@ -1,6 +1,8 @@
 '''Type1FuzzySet class implementation'''
 import numpy as np
 import matplotlib.pyplot as plt
+from type2fuzzy.membership.crispset import CrispSet
+from type2fuzzy.membership.secondary_operations import max_min_join, max_min_meet
 
 class Type1FuzzySetException(Exception):
     '''Type-1 Fuzzy Set Exception'''
@@ -14,23 +16,17 @@ class Type1FuzzySet:
     Zadeh, Lotfi Asker. "The concept of a linguistic variable and its 
     application to approximate reasoning—I." Information sciences 8.3 (1975): 199-249.
 
+    The degrees of membership are held in a float array,
+    indexed by the position of the element in the domain.
     '''
     def __init__(self, resolution=100):
-        self._elements = [0 for i in range(resolution)]
+        self._elements = np.zeros(resolution)
         self._empty = True
         self._precision = 3
 
     def __eq__(self, type1fs):
         ''' Compares two Type-1 Fuzzy Sets for equality. '''
-
-        if len(self._elements) != len(type1fs._elements):
-            return False
-
-        for idx, val in enumerate(self._elements):
-            if val != type1fs[idx]:
-                return False
-
-        return True
+        return np.array_equal(self._elements, type1fs._elements)
 
     def __getitem__(self, idx):
         ''' return the degree of membership '''
@@ -38,11 +34,13 @@ class Type1FuzzySet:
 
     def __str__(self):
 
-        set_representation = ''
-        for idx, val in enumerate(self._elements):
-            set_representation = set_representation + f'{val} / {idx} + '
+        # format all the elements at once, interleaving the values and indices
+        values = self._elements.tolist()
+        elements = [None] * (2 * len(values))
+        elements[0::2] = values
+        elements[1::2] = range(len(values))
 
-        return set_representation
+        return ('%s / %d + ' * len(values)) % tuple(elements)
 
     def __repr__(self):
         return f'{self.__class__.__name__}({str(self)})'
@@ -54,7 +52,7 @@ class Type1FuzzySet:
         '''
         return self._empty
 
-    def elements(self) -> list:
+    def elements(self) -> np.ndarray:
         ''' Returns a copy of the elements making up this t1fs '''
         return  self._elements.copy()
 
@@ -79,6 +77,50 @@ class Type1FuzzySet:
     
         self._empty = False
 
+    def set_values(self, values):
+        '''
+        Sets the degree of membership of all the elements of the t1fs at once
+
+        Arguments:
+        ----------
+        values -- 1D array, the degree of membership of every element,
+                    must have one value per element and values between 0 and 1
+
+        Raises:
+        -------
+        Type1FuzzySetException if the number of values does not match the
+        number of elements, or if a value is not between 0 and 1
+        '''
+        values = np.asarray(values, dtype=float)
+
+        if values.shape != self._elements.shape:
+            raise Type1FuzzySetException(
+                f'expected {len(self._elements)} values, got {values.size}')
+
+        if np.any((values < 0) | (values > 1)):
+            raise Type1FuzzySetException(
+                'degree of membership must be between 0 and 1')
+
+        np.copyto(self._elements, values)
+        self._empty = not np.any(values > 0)
+
+    def _from_values(self, values):
+        '''
+        Creates a new t1fs with the same resolution as this one
+        holding the given degrees of membership
+        '''
+        resultant_set = Type1FuzzySet(resolution=self.element_count())
+        resultant_set.set_values(values)
+        return resultant_set
+
+    def _check_same_size(self, other_set):
+        '''
+        Raises an exception if the two sets do not have the same number of elements
+        '''
+        if self.element_count() != other_set.element_count():
+            raise Type1FuzzySetException(
+                'the two sets must have the same number of elements')
+
     # def domain_elements(self):
     #     '''
     #     Return a list of all the domain elements
@@ -103,26 +145,31 @@ class Type1FuzzySet:
 
 
 
-    # def alpha_cut(self, alpha_val):
-    #     '''creates an alpha-cut of the t1fs'''
-    #     # create a filter of the degrees of membership that exceed the cut value
-    #     if alpha_val == 0:
-    #         filter_idx = (np.array(self.degree_of_membership()) > 0).nonzero()[0]
+    def alpha_cut(self, alpha_val):
+        '''
+        creates an alpha-cut of the t1fs
 
-    #     else:
-    #     # create a filter of the degrees of membership that exceed the cut value
-    #         filter_idx = (np.array(self.degree_of_membership()) >= alpha_val).nonzero()[0]
+        Arguments:
+        ----------
+        alpha_val -- float, the cut value, a value of 0 gives the support of the set
 
-    #     # apply the filter on the domain to get the values included in the alpha-cut
-    #     cut = np.array(self.domain_elements())[filter_idx]
+        Returns:
+        --------
+        limits -- CrispSet, the first and last domain index included in the cut,
+                    empty if no element reaches the cut value
+        '''
+        # create a filter of the degrees of membership that exceed the cut value
+        if alpha_val == 0:
+            filter_idx = np.flatnonzero(self._elements > 0)
+        else:
+            filter_idx = np.flatnonzero(self._elements >= alpha_val)
 
-    #     limits = CrispSet()
+        limits = CrispSet()
 
-    #     if len(cut>0):
-    #         limits.left = min(cut)
-    #         limits.right = max(cut)
+        if len(filter_idx) > 0:
+            limits = CrispSet(int(filter_idx[0]), int(filter_idx[-1]))
 
-    #     return limits
+        return limits
 
     def extend(self, func):
         '''extends the t1fs with the function func'''
@@ -135,74 +182,88 @@ class Type1FuzzySet:
 
     # operators
     def join(self, a_set):
-        '''joins two t1fs'''
-        resultant_set = Type1FuzzySet()
+        '''
+        joins two t1fs, the degree of membership of index k being the maximum
+        of min(self[i], a_set[j]) over the pairs with max(i, j) = k, found by
+        a running maximum sweep in linear time instead of visiting every pair
 
-        for domain_element in self.domain_elements():
-            for a_set_domain_element in a_set.domain_elements():
+        Arguments:
+        ----------
+        a_set -- Type1FuzzySet, the other set
 
-                resultant_set.add_element(
-                    max(
-                        domain_element,
-                        a_set_domain_element),
-                    min(
-                        self[domain_element],
-                        a_set[a_set_domain_element]))
+        Returns:
+        --------
+        resultant_set -- Type1FuzzySet, with as many elements as the larger set
+        '''
+        _, values = max_min_join(np.arange(self.element_count()), self._elements,
+                                    np.arange(a_set.element_count()), a_set._elements)
 
+        resultant_set = Type1FuzzySet(resolution=len(values))
+        resultant_set.set_values(values)
         return resultant_set
 
     def meet(self, a_set):
-        '''meets two t1fs'''
-        resultant_set = Type1FuzzySet()
+        '''
+        meets two t1fs, the degree of membership of index k being the maximum
+        of min(self[i], a_set[j]) over the pairs with min(i, j) = k, found by
+        a running maximum sweep in linear time instead of visiting every pair
 
-        for domain_element in self.domain_elements():
-            for a_set_domain_element in a_set.domain_elements():
+        Arguments:
+        ----------
+        a_set -- Type1FuzzySet, the other set
 
-                resultant_set.add_element(
-                    min(
-                        domain_element,
-                        a_set_domain_element),
-                    min(
-                        self[domain_element],
-                        a_set[a_set_domain_element]))
+        Returns:
+        --------
+        resultant_set -- Type1FuzzySet, with as many elements as the smaller set
+        '''
+        _, values = max_min_meet(np.arange(self.element_count()), self._elements,
+                                    np.arange(a_set.element_count()), a_set._elements)
 
+        resultant_set = Type1FuzzySet(resolution=len(values))
+        resultant_set.set_values(values)
         return resultant_set
 
     def negation(self):
-        '''negates the t1fs'''
-        resultant_set = Type1FuzzySet()
+        '''negates the t1fs, the degree of membership of every element becomes 1 - dom'''
+        return self._from_values(1 - self._elements)
 
-        for domain_element in self.domain_elements():
-            resultant_set.add_element(
-                1 - domain_element,
-                self[domain_element])
+    def union(self, other_set):
+        '''unions two t1fs, using the maximum of the degrees of membership'''
+        self._check_same_size(other_set)
+        return self._from_values(np.maximum(self._elements, other_set._elements))
 
-        return resultant_set
-
-    def union(self, other_smf):
-        '''unions two t1fs'''
-        resultant_set = set.intersection(set(self._elements), set(other_smf.elements))
+    def intersection(self, other_set):
+        ''' intersects two t1fs, using the minimum of the degrees of membership'''
+        self._check_same_size(other_set)
+        return self._from_values(np.minimum(self._elements, other_set._elements))
 
-        resultant_smf = {}
-        for  domain_val in resultant_set:
-            resultant_smf[domain_val] = max(
-                self._elements[domain_val],
-                other_smf.elements[domain_val])
+    def scale(self, factor):
+        '''
+        scales the degrees of membership of the t1fs by factor,
+        as in product implication
 
-        return resultant_smf
+        Arguments:
+        ----------
+        factor -- float, scaling factor between 0 and 1
+        '''
+        if factor < 0 or factor > 1:
+            raise Type1FuzzySetException('scaling factor must be between 0 and 1')
 
-    def intersection(self, other_set):
-        ''' intersects two t1fs'''
+        return self._from_values(self._elements * factor)
 
-        if self.element_count() != other_set.element_count():
-            raise Type1FuzzySetException(
-                'the two sets must have the same number of elements')
+    def clip(self, level):
+        '''
+        clips the degrees of membership of the t1fs at level,
+        as in minimum implication
 
-        resultant_set = Type1FuzzySet(resolution=self.element_count())
-        for  idx in range(self.element_count()):
-            resultant_set.add_element(idx, min(self[idx], other_set[idx]))
+        Arguments:
+        ----------
+        level -- float, clipping level between 0 and 1
+        '''
+        if level < 0 or level > 1:
+            raise Type1FuzzySetException('clipping level must be between 0 and 1')
 
-        return resultant_set
+        return self._from_values(np.minimum(self._elements, level))
 
     def plot_set(self, ax=None, col='', name='set'):
         '''plots the t1fs'''
@@ -1,4 +1,12 @@
 import numpy as np
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.membership.set_persistence import save_arrays, load_arrays
+from type2fuzzy.membership.zslicing import Z_LEVELS, z_level_bounds
+
+class ZSliceType2FuzzySetException(Exception):
+	''' Z-Slice Type-2 Fuzzy Set Exception '''
+	def __init__(self, message):
+		super().__init__(message)
 
 class ZSliceType2FuzzySet:
 
@@ -13,17 +21,47 @@ class ZSliceType2FuzzySet:
 		self._empty = True
 
 	@ classmethod
-	def from_general_type2_set(cls, gt2fs, no_slices):
-		
+	def from_general_type2_set(cls, gt2fs, no_slices=None, levels='uniform'):
+		'''
+		Slices a general type-2 fuzzy set. The bounds of all the levels
+		are found at once by gt2fs.z_slice_bounds
+
+		Arguments:
+		----------
+		gt2fs -- GeneralType2FuzzySet, DenseGeneralType2FuzzySet or
+					SparseGeneralType2FuzzySet, the set to slice
+		no_slices -- int, the number of slices, unused by 'exact'
+		levels -- 'uniform', no_slices+1 evenly spaced levels from 0 to 1,
+					'exact', the distinct secondary grades of the set, which
+					represent it exactly, or
+					'adaptive', at most no_slices+1 of the exact levels, inserted
+					where the bounds change most
+
+		Returns:
+		--------
+		zt2fs -- ZSliceType2FuzzySet
+
+		Raises:
+		-------
+		ZSliceType2FuzzySetException -- if the levels are not supported or
+					if no_slices is missing
+		'''
+		if levels not in Z_LEVELS:
+			raise ZSliceType2FuzzySetException(f'Unsupported z-levels {levels}')
+
+		if no_slices is None and levels != 'exact':
+			raise ZSliceType2FuzzySetException(f'The number of slices is required by {levels} z-levels')
+
 		zt2fs = cls()
 
-		z_vals = np.linspace(0, 1, no_slices+1)
+		z_vals, primary_domain, bounds = z_level_bounds(gt2fs, no_slices, levels)
 
-		for z_val in z_vals:
-			z_sliced_set =  gt2fs.z_slice(z_val)
+		for z_val, level_bounds in zip(z_vals, bounds):
+			included = ~np.isnan(level_bounds[:, 0])
 
-			if not z_sliced_set.empty:
-				zt2fs.add_element(z_val, z_sliced_set)# 
+			if np.any(included):
+				zt2fs.add_element(z_val, IntervalType2FuzzySet.from_hmf_lmf(
+					primary_domain[included], level_bounds[included, 1], level_bounds[included, 0]))
 				zt2fs._empty = False
 		return zt2fs
 
@@ -35,6 +73,64 @@ class ZSliceType2FuzzySet:
 		self._z_slice_set_elements[z_slice_val] = z_sliced_set
 
 
+	def save_npz(self, set_filename):
+		'''
+		Saves the set as raw float arrays in an uncompressed .npz file.
+		The interval type-2 fuzzy sets of all the z-slices are concatenated,
+		slice_sizes holding the number of primary domain values of every slice
+
+		Arguments:
+		----------
+		set_filename -- string, the name of the file, used as given
+
+		Raises:
+		-------
+		SetPersistenceException -- if the file cannot be written
+		'''
+		zslices = self.zslices()
+		slices = [self._z_slice_set_elements[z_slice_val] for z_slice_val in zslices]
+
+		save_arrays(set_filename, self.__class__.__name__,
+					zslices=np.array(zslices, dtype=float),
+					slice_sizes=np.array([len(it2fs.primary_domain()) for it2fs in slices], dtype=int),
+					primary_domain=np.concatenate([it2fs.primary_domain() for it2fs in slices] + [np.empty(0)]),
+					lower=np.concatenate([it2fs.lower_membership_function() for it2fs in slices] + [np.empty(0)]),
+					upper=np.concatenate([it2fs.higher_membership_function() for it2fs in slices] + [np.empty(0)]))
+
+	@classmethod
+	def load_npz(cls, set_filename, mmap_mode=None):
+		'''
+		Loads a z-slice type-2 fuzzy set saved by save_npz. The interval
+		type-2 fuzzy sets of the slices are views on the loaded arrays
+
+		Arguments:
+		----------
+		set_filename -- string, the name of the file
+		mmap_mode -- None, 'r', 'r+' or 'c', memory maps the arrays as in numpy.load
+
+		Returns:
+		--------
+		zt2fs -- ZSliceType2FuzzySet
+
+		Raises:
+		-------
+		SetPersistenceException -- if the file cannot be read or does not hold
+					a z-slice type-2 fuzzy set
+		'''
+		zslices, slice_sizes, primary_domain, lower, upper = load_arrays(
+			set_filename, cls.__name__,
+			('zslices', 'slice_sizes', 'primary_domain', 'lower', 'upper'), mmap_mode)
+
+		zt2fs = cls()
+
+		ends = np.cumsum(slice_sizes)
+		for z_slice_val, start, end in zip(zslices.tolist(), (ends - slice_sizes).tolist(), ends.tolist()):
+			zt2fs.add_element(z_slice_val, IntervalType2FuzzySet.from_hmf_lmf(
+				primary_domain[start:end], upper[start:end], lower[start:end]))
+			zt2fs._empty = False
+
+		return zt2fs
+
 	@staticmethod
 	def adjust_value(val, val_array):
 		val_array=np.array(val_array)
@@ -54,12 +150,11 @@ class ZSliceType2FuzzySet:
 		--------
 		it2fs - corresponding interval type-2 set
 		'''
-		if z_slice_val not in self.zslices():
-			raise Exception(f'z-slice value of {z_slice_val} not in this set.')
-
-		z_slice_val = self.adjust_value(z_slice_val, self.zslices())
-
-		return self._z_slice_set_elements[z_slice_val]
+		# a single hash lookup, the value must be one of the z-slices
+		try:
+			return self._z_slice_set_elements[z_slice_val]
+		except KeyError:
+			raise ZSliceType2FuzzySetException(f'z-slice value of {z_slice_val} not in this set.') from None
 
 	def zslices(self):
 		return list(self._z_slice_set_elements.keys())
@@ -0,0 +1,209 @@
+'''
+vectorized z-slicing of general type-2 fuzzy sets
+
+The z-slice of a vertical slice at level z is the interval between the
+first and last secondary domain values whose secondary grade reaches z.
+As in Type1FuzzySet.alpha_cut, a level of 0 includes the non-zero
+secondary grades only.
+
+The bounds of all the vertical slices at all the levels are found at once.
+The secondary grades and the levels are replaced by their ranks among all
+of them, so that comparisons are exact, and the ranks of every vertical
+slice are offset to lie above those of the previous slices. The running
+maximum of the offset ranks is then sorted, so that the first point of a
+slice reaching a level is found by binary search, and the last point by
+the same search on the reversed points.
+
+The z-slices only change at the distinct secondary grades of a set, so that
+slicing at these levels represents the set exactly, and a smaller number
+of them can be selected where the bounds change most.
+'''
+import heapq
+import numpy as np
+
+Z_LEVELS = ('uniform', 'exact', 'adaptive')
+
+
+def z_slice_bounds(indptr, secondary_domain_vals, secondary_grades, z_vals):
+    '''
+    Finds the lower and upper bounds of the z-slices of vertical slices at
+    all the given levels
+
+    Arguments:
+    ----------
+    indptr -- 1D int array, the points of vertical slice i are at
+                positions indptr[i]:indptr[i+1]
+    secondary_domain_vals -- 1D array, the secondary domain value of every point,
+                ascending within every vertical slice
+    secondary_grades -- 1D array, the secondary grade of every point
+    z_vals -- 1D array, the z-levels
+
+    Returns:
+    --------
+    bounds -- 3D array of shape (len(z_vals), len(indptr) - 1, 2), the lower
+                ([..., 0]) and upper ([..., 1]) bounds, NaN where no point of
+                a vertical slice reaches a level
+    '''
+    indptr = np.asarray(indptr, dtype=np.intp)
+    secondary_domain_vals = np.asarray(secondary_domain_vals, dtype=float)
+    secondary_grades = np.asarray(secondary_grades, dtype=float)
+    z_vals = np.asarray(z_vals, dtype=float)
+
+    slice_count = len(indptr) - 1
+    bounds = np.full((len(z_vals), slice_count, 2), np.nan)
+
+    if len(secondary_grades) == 0:
+        return bounds
+
+    values = np.unique(np.concatenate((secondary_grades, z_vals)))
+    grade_ranks = np.searchsorted(values, secondary_grades)
+
+    # a point is in the z-slice if its rank reaches the query rank
+    query_ranks = np.where(z_vals == 0,
+                            np.searchsorted(values, z_vals, side='right'),
+                            np.searchsorted(values, z_vals))
+
+    stride = len(values) + 1
+    slice_idx = np.repeat(np.arange(slice_count), np.diff(indptr))
+    slice_offsets = np.arange(slice_count) * stride
+
+    forward = np.maximum.accumulate(grade_ranks + slice_idx * stride)
+    backward = np.maximum.accumulate(grade_ranks[::-1] + (slice_count - 1 - slice_idx[::-1]) * stride)
+
+    first = np.searchsorted(forward, query_ranks[:, np.newaxis] + slice_offsets)
+    last = len(grade_ranks) - 1 - np.searchsorted(
+        backward, query_ranks[:, np.newaxis] + slice_offsets[::-1])
+
+    # the search ends past a slice when none of its points reaches the level
+    included = first < indptr[1:]
+
+    bounds[included, 0] = secondary_domain_vals[first[included]]
+    bounds[included, 1] = secondary_domain_vals[last[included]]
+
+    return bounds
+
+
+def grid_z_slice_bounds(secondary_domain, set_array, z_vals):
+    '''
+    Finds the lower and upper bounds of the z-slices of a set given on a grid
+    at all the given levels
+
+    Arguments:
+    ----------
+    secondary_domain -- 1D array, the sorted secondary domain values
+    set_array -- 2D array, the secondary grades, a row for every secondary
+                domain value and a column for every primary domain value
+    z_vals -- 1D array, the z-levels
+
+    Returns:
+    --------
+    bounds -- 3D array of shape (len(z_vals), set_array.shape[1], 2), as
+                returned by z_slice_bounds
+    '''
+    secondary_domain = np.asarray(secondary_domain, dtype=float)
+    set_array = np.asarray(set_array, dtype=float)
+
+    secondary_size, primary_size = set_array.shape
+
+    return z_slice_bounds(np.arange(primary_size + 1) * secondary_size,
+                            np.tile(secondary_domain, primary_size),
+                            set_array.T.ravel(), z_vals)
+
+
+def adaptive_z_levels(z_vals, bounds, level_count):
+    '''
+    Selects level_count of the exact z-levels of a set, inserting levels
+    where the bounds change most.
+    A level missing from the selection is represented by the z-slice of the
+    selected level above it, as a point keeps the highest level of the
+    z-slices including it. The z-slices are nested, so that the error is the
+    decrease of the total width of the z-slices, weighted by the range of
+    levels it covers. Starting from the highest level, the range with the
+    highest error is split at the level that reduces its error most, the
+    errors of all the ranges being found in O(1) from prefix sums
+
+    Arguments:
+    ----------
+    z_vals -- 1D array, the exact z-levels, the sorted distinct non-zero secondary grades
+    bounds -- 3D array of shape (len(z_vals), n_x, 2), the bounds at every level
+    level_count -- int, the maximum number of levels to select
+
+    Returns:
+    --------
+    level_indices -- 1D int array, the sorted indices of the selected levels,
+                    fewer than level_count if the selected levels are exact
+    '''
+    z_vals = np.asarray(z_vals, dtype=float)
+    level_total = len(z_vals)
+
+    if level_total <= level_count:
+        return np.arange(level_total)
+
+    if level_count < 1:
+        return np.empty(0, dtype=np.intp)
+
+    widths = np.nansum(bounds[..., 1] - bounds[..., 0], axis=1)
+    weights = np.diff(z_vals, prepend=0.0)
+
+    cumulative_weights = np.concatenate(([0.0], np.cumsum(weights)))
+    cumulative_widths = np.concatenate(([0.0], np.cumsum(weights * widths)))
+
+    def range_error(start, end):
+        '''error of representing the levels start+1 to end-1 by the level end'''
+        return ((cumulative_widths[end] - cumulative_widths[start + 1])
+                - widths[end] * (cumulative_weights[end] - cumulative_weights[start + 1]))
+
+    # the range below the lowest selected level starts at -1
+    level_indices = [level_total - 1]
+    queue = [(-range_error(-1, level_total - 1), -1, level_total - 1)]
+
+    while queue and len(level_indices) < level_count:
+        negative_error, start, end = heapq.heappop(queue)
+
+        if negative_error >= 0:
+            break
+
+        splits = np.arange(start + 1, end)
+        split = int(splits[np.argmin(range_error(start, splits) + range_error(splits, end))])
+        level_indices.append(split)
+
+        heapq.heappush(queue, (-range_error(start, split), start, split))
+        heapq.heappush(queue, (-range_error(split, end), split, end))
+
+    return np.sort(level_indices)
+
+
+def z_level_bounds(gt2fs, no_slices, levels):
+    '''
+    Chooses the z-levels of a general type-2 fuzzy set and finds the bounds
+    of its z-slices at these levels
+
+    Arguments:
+    ----------
+    gt2fs -- GeneralType2FuzzySet, DenseGeneralType2FuzzySet or
+                SparseGeneralType2FuzzySet, the set to slice
+    no_slices -- int, the number of slices, unused by 'exact'
+    levels -- 'uniform', no_slices+1 evenly spaced levels from 0 to 1,
+                'exact', the distinct secondary grades of the set, or
+                'adaptive', at most no_slices+1 of the exact levels selected
+                by adaptive_z_levels
+
+    Returns:
+    --------
+    z_vals -- 1D array, the z-levels
+    primary_domain -- 1D array, the sorted primary domain values
+    bounds -- 3D array of shape (len(z_vals), len(primary_domain), 2)
+    '''
+    if levels == 'uniform':
+        z_vals = np.linspace(0, 1, no_slices+1)
+    else:
+        z_vals = gt2fs.secondary_grade_levels()
+
+    primary_domain, bounds = gt2fs.z_slice_bounds(z_vals)
+
+    if levels == 'adaptive':
+        level_indices = adaptive_z_levels(z_vals, bounds, no_slices+1)
+        z_vals = z_vals[level_indices]
+        bounds = bounds[level_indices]
+
+    return z_vals, primary_domain, bounds
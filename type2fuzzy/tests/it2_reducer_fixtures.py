@@ -0,0 +1,26 @@
+'''
+Shared fixtures of the interval type-2 reducer tests
+'''
+import numpy as np
+
+def exhaustive_centroid(primary_domain, lower_mf, upper_mf):
+	''' the limits of the centroid over every switch point with a non-zero denominator '''
+	lefts = []
+	rights = []
+	for switch_point in range(len(primary_domain) + 1):
+		weights = np.r_[upper_mf[:switch_point], lower_mf[switch_point:]]
+		if np.sum(weights) > 0:
+			lefts.append(np.dot(primary_domain, weights) / np.sum(weights))
+		weights = np.r_[lower_mf[:switch_point], upper_mf[switch_point:]]
+		if np.sum(weights) > 0:
+			rights.append(np.dot(primary_domain, weights) / np.sum(weights))
+	return min(lefts), max(rights)
+
+class GaussianSetFixture:
+	''' a gaussian interval type-2 fuzzy set with random lower and upper membership functions '''
+
+	def setUp(self):
+		rng = np.random.default_rng(0)
+		self.primary_domain = np.linspace(0, 10, 101)
+		self.upper_mf = np.exp(-((self.primary_domain - 4) ** 2) / 8) * (0.5 + 0.5 * rng.random(101))
+		self.lower_mf = self.upper_mf * (0.01 + 0.99 * rng.random(101))
@@ -0,0 +1,50 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.crispset import CrispSet
+from type2fuzzy.membership.type1_fuzzyset import Type1FuzzySet
+from type2fuzzy.membership.alphacuttype1fuzzyset import AlphaCutType1FuzzySet
+
+class TestAlphaCutType1FuzzySet(unittest.TestCase):
+
+	def test_from_type1fuzzyset(self):
+		t1fs = Type1FuzzySet(6)
+		t1fs.set_values([0.0, 0.3, 1.0, 0.6, 0.3, 0.0])
+
+		at1fs = AlphaCutType1FuzzySet.from_type1fuzzyset(t1fs, 11)
+
+		self.assertListEqual(at1fs.cuts(), [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0])
+
+		for cut in at1fs.cuts():
+			expected = t1fs.alpha_cut(cut)
+			self.assertEqual(at1fs[cut].left, expected.left)
+			self.assertEqual(at1fs[cut].right, expected.right)
+
+		with self.assertRaises(Exception) : at1fs[0.15]
+
+	def test_add_element(self):
+		at1fs = AlphaCutType1FuzzySet()
+		self.assertTrue(at1fs.empty)
+
+		at1fs.add_element(0.5, CrispSet(2, 3))
+		at1fs.add_element(0.1, CrispSet(1, 4))
+		at1fs.add_element(0.3, CrispSet())
+		self.assertFalse(at1fs.empty)
+
+		self.assertListEqual(at1fs.cuts(), [0.1, 0.5])
+
+		at1fs.add_element(0.5, CrispSet(2.5, 3))
+		cuts, left, right = at1fs.to_array()
+		np.testing.assert_array_equal(cuts, [0.1, 0.5])
+		np.testing.assert_array_equal(left, [1, 2.5])
+		np.testing.assert_array_equal(right, [4, 3])
+
+	def test_from_arrays(self):
+		at1fs = AlphaCutType1FuzzySet.from_arrays([0.5, 0.1, 0.3], [2, 1, np.nan], [3, 4, np.nan])
+
+		self.assertListEqual(at1fs.cuts(), [0.1, 0.5])
+		self.assertEqual(at1fs[0.5].left, 2)
+
+		with self.assertRaises(Exception) : AlphaCutType1FuzzySet.from_arrays([0.5, 0.5], [2, 1], [3, 4])
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.crispset import CrispSet
+from type2fuzzy.membership.crispsetarray import CrispSetArray
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+
+class TestCrispSetArray(unittest.TestCase):
+
+	def test_crisp_set_array(self):
+		with self.assertRaises(Exception) : CrispSetArray([1, 6], [2, 5])
+		with self.assertRaises(Exception) : CrispSetArray([1, 2], [2])
+
+		crisp_sets = CrispSetArray([1, np.nan, 3], [2, np.nan, 7])
+
+		self.assertEqual(len(crisp_sets), 3)
+		np.testing.assert_array_equal(crisp_sets.empty, [False, True, False])
+
+		self.assertEqual(crisp_sets[0].left, 1)
+		self.assertEqual(crisp_sets[0].right, 2)
+		self.assertTrue(crisp_sets[1].empty)
+
+		# limits cannot be modified
+		with self.assertRaises(Exception) : crisp_sets.left[0] = 0
+
+	def test_from_crispsets(self):
+		crisp_sets = CrispSetArray.from_crispsets([CrispSet(1, 2), CrispSet(), CrispSet(3, 7)])
+
+		np.testing.assert_array_equal(crisp_sets.left, [1, np.nan, 3])
+		np.testing.assert_array_equal(crisp_sets.right, [2, np.nan, 7])
+
+		self.assertEqual(len(crisp_sets.to_crispsets()), 3)
+
+	def test_mid_width(self):
+		crisp_sets = CrispSetArray([1, 3], [2, 7])
+
+		np.testing.assert_array_equal(crisp_sets.mid, [1.5, 5])
+		np.testing.assert_array_equal(crisp_sets.width, [1, 4])
+
+		crisp_sets = CrispSetArray([1, np.nan], [2, np.nan])
+		with self.assertRaises(Exception) : crisp_sets.mid
+		with self.assertRaises(Exception) : crisp_sets.width
+
+	def test_union(self):
+		crisp_sets_a = CrispSetArray([1, np.nan, 3], [2, np.nan, 7])
+		crisp_sets_b = CrispSetArray([0, 4, np.nan], [1.5, 5, np.nan])
+
+		union = crisp_sets_a.union(crisp_sets_b)
+
+		np.testing.assert_array_equal(union.left, [0, 4, 3])
+		np.testing.assert_array_equal(union.right, [2, 5, 7])
+
+		with self.assertRaises(Exception) : crisp_sets_a.union(CrispSetArray([1], [2]))
+
+	def test_contains(self):
+		crisp_sets = CrispSetArray([1, np.nan, 3], [2, np.nan, 7])
+
+		np.testing.assert_array_equal(crisp_sets.contains(1.5), [True, False, False])
+		np.testing.assert_array_equal(crisp_sets.contains([2, 0, 8]), [True, False, False])
+
+	def test_interval_type2_set(self):
+		crisp_sets = CrispSetArray([0.1, np.nan, 0.3], [0.2, np.nan, 0.7])
+		it2fs = IntervalType2FuzzySet.from_crispsetarray([1.0, 2.0, 3.0], crisp_sets)
+
+		np.testing.assert_array_equal(it2fs.primary_domain(), [1.0, 3.0])
+		np.testing.assert_array_equal(it2fs.intervals().left, [0.1, 0.3])
+		np.testing.assert_array_equal(it2fs.intervals().right, [0.2, 0.7])
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.densegeneraltype2fuzzyset import DenseGeneralType2FuzzySet
+
+class TestDenseGeneralType2FuzzySet(unittest.TestCase):
+
+	def setUp(self):
+		self.primary_domain = [1.0, 2.0, 3.0]
+		self.secondary_domain = [0.0, 0.5, 1.0]
+		self.set_array_a = [[0.9, 0.0, 0.0],
+							[0.5, 1.0, 0.0],
+							[0.3, 0.6, 1.0]]
+		self.set_array_b = [[0.2, 0.7, 0.0],
+							[0.8, 0.0, 0.4],
+							[0.0, 0.3, 0.6]]
+
+	def test_from_array(self):
+		dgt2fs = DenseGeneralType2FuzzySet.from_array([3.0, 1.0, 2.0], [0.5, 0.0], [[0.1, 0.2, 0.3],
+																					[0.4, 0.5, 0.6]])
+
+		primary_domain, secondary_domain, set_array = dgt2fs.to_array_explicit()
+
+		np.testing.assert_array_equal(primary_domain, [1.0, 2.0, 3.0])
+		np.testing.assert_array_equal(secondary_domain, [0.0, 0.5])
+		np.testing.assert_array_equal(set_array, [[0.5, 0.6, 0.4], [0.2, 0.3, 0.1]])
+
+		#mismatch tests
+		with self.assertRaises(Exception) : DenseGeneralType2FuzzySet([1, 2], self.secondary_domain, self.set_array_a)
+		with self.assertRaises(Exception) : DenseGeneralType2FuzzySet(self.primary_domain, [0, 1], self.set_array_a)
+		with self.assertRaises(Exception) : DenseGeneralType2FuzzySet(self.primary_domain, [0, 0.5, 1.1], self.set_array_a)
+		with self.assertRaises(Exception) : DenseGeneralType2FuzzySet([1, 1, 2], self.secondary_domain, self.set_array_a)
+
+	def test_vertical_slice(self):
+		dgt2fs = DenseGeneralType2FuzzySet(self.primary_domain, self.secondary_domain, self.set_array_a)
+
+		np.testing.assert_array_equal(dgt2fs.vertical_slice(1.0), [0.9, 0.5, 0.3])
+		np.testing.assert_array_equal(dgt2fs[2.0], [0.0, 1.0, 0.6])
+
+		with self.assertRaises(Exception) : dgt2fs.vertical_slice(2.5)
+
+	def test_z_slice(self):
+		dgt2fs = DenseGeneralType2FuzzySet(self.primary_domain, self.secondary_domain, self.set_array_a)
+
+		it2fs = dgt2fs.z_slice(0.5)
+
+		self.assertListEqual(list(it2fs.primary_domain()), [1.0, 2.0, 3.0])
+		self.assertListEqual(list(it2fs.lower_membership_function()), [0.0, 0.5, 1.0])
+		self.assertListEqual(list(it2fs.higher_membership_function()), [0.5, 1.0, 1.0])
+
+		it2fs = dgt2fs.z_slice(0.95)
+		self.assertListEqual(list(it2fs.primary_domain()), [2.0, 3.0])
+
+	def test_operations_match_general_type2_set(self):
+		gt2fs_a = GeneralType2FuzzySet.from_array(self.primary_domain, self.secondary_domain, self.set_array_a)
+		gt2fs_b = GeneralType2FuzzySet.from_array(self.primary_domain, self.secondary_domain, self.set_array_b)
+		dgt2fs_a = DenseGeneralType2FuzzySet(self.primary_domain, self.secondary_domain, self.set_array_a)
+		dgt2fs_b = DenseGeneralType2FuzzySet(self.primary_domain, self.secondary_domain, self.set_array_b)
+
+		_, _, expected_union = gt2fs_a.union(gt2fs_b).to_array_explicit()
+		_, _, expected_intersection = gt2fs_a.intersection(gt2fs_b).to_array_explicit()
+		_, expected_domain, expected_complement = gt2fs_a.complement().to_array_explicit()
+
+		np.testing.assert_array_almost_equal(dgt2fs_a.union(dgt2fs_b).to_array_explicit()[2], expected_union)
+		np.testing.assert_array_almost_equal(dgt2fs_a.intersection(dgt2fs_b).to_array_explicit()[2], expected_intersection)
+
+		_, complement_domain, complement_array = dgt2fs_a.complement().to_array_explicit()
+		np.testing.assert_array_almost_equal(complement_domain, expected_domain)
+		np.testing.assert_array_almost_equal(complement_array, expected_complement)
+
+	def test_operations_on_different_grids(self):
+		dgt2fs_a = DenseGeneralType2FuzzySet(self.primary_domain, self.secondary_domain, self.set_array_a)
+		dgt2fs_b = DenseGeneralType2FuzzySet([1.0, 2.0, 4.0], self.secondary_domain, self.set_array_b)
+
+		with self.assertRaises(Exception) : dgt2fs_a.union(dgt2fs_b)
+		with self.assertRaises(Exception) : dgt2fs_a.intersection(dgt2fs_b)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.zslicetype2fuzzyset import ZSliceType2FuzzySet
+from type2fuzzy.membership.densezslicetype2fuzzyset import DenseZSliceType2FuzzySet
+from type2fuzzy.type_reduction.zslice_hagras_reducer import zslice_hagras_reduce
+
+class TestDenseZSliceType2FuzzySet(unittest.TestCase):
+
+	def setUp(self):
+		self.primary_domain = [1.0, 2.0, 3.0, 4.0]
+		self.secondary_domain = [0.0, 0.25, 0.5, 0.75, 1.0]
+		self.set_array = [[0.0, 0.0, 0.0, 0.0],
+						[0.2, 0.5, 0.0, 0.0],
+						[1.0, 1.0, 0.5, 0.0],
+						[0.5, 0.7, 0.6, 0.5],
+						[0.0, 0.2, 0.6, 1.0]]
+		self.gt2fs = GeneralType2FuzzySet.from_array(self.primary_domain, self.secondary_domain, self.set_array)
+
+	def test_from_general_type2_set(self):
+		zt2fs = ZSliceType2FuzzySet.from_general_type2_set(self.gt2fs, 4)
+		dzt2fs = DenseZSliceType2FuzzySet.from_general_type2_set(self.gt2fs, 4)
+
+		np.testing.assert_array_equal(dzt2fs.zslices(), zt2fs.zslices())
+
+		for zslice in zt2fs.zslices():
+			expected = zt2fs[zslice]
+			it2fs = dzt2fs[zslice]
+			np.testing.assert_array_equal(it2fs.primary_domain(), expected.primary_domain())
+			np.testing.assert_array_equal(it2fs.lower_membership_function(), expected.lower_membership_function())
+			np.testing.assert_array_equal(it2fs.higher_membership_function(), expected.higher_membership_function())
+
+		with self.assertRaises(Exception) : dzt2fs[0.3]
+
+	def test_from_zslice_type2_set(self):
+		zt2fs = ZSliceType2FuzzySet.from_general_type2_set(self.gt2fs, 4)
+		dzt2fs = DenseZSliceType2FuzzySet.from_zslice_type2_set(zt2fs)
+
+		zslices, primary_domain, bounds = dzt2fs.to_array()
+
+		self.assertEqual(bounds.shape, (len(zslices), len(primary_domain), 2))
+
+		# at level 1 only x=1, x=2 and x=4 are included
+		np.testing.assert_array_equal(bounds[-1, :, 0], [0.5, 0.5, np.nan, 1.0])
+		np.testing.assert_array_equal(bounds[-1, :, 1], [0.5, 0.5, np.nan, 1.0])
+
+		converted = dzt2fs.to_zslice_type2_set()
+		self.assertListEqual(converted.zslices(), list(zslices))
+
+	def test_invalid_bounds(self):
+		with self.assertRaises(Exception) : DenseZSliceType2FuzzySet([0.5], [1.0, 2.0], [[[0.5, 0.2], [0.1, 0.2]]])
+		with self.assertRaises(Exception) : DenseZSliceType2FuzzySet([0.5], [1.0, 2.0], [[[np.nan, 0.2], [0.1, 0.2]]])
+		with self.assertRaises(Exception) : DenseZSliceType2FuzzySet([0.5, 0.2], [1.0], [[[0.1, 0.2]], [[0.1, 0.2]]])
+		with self.assertRaises(Exception) : DenseZSliceType2FuzzySet([0.5], [1.0], [[0.1, 0.2]])
+
+	def test_operations(self):
+		bounds_a = [[[0.2, 0.6], [np.nan, np.nan]], [[0.3, 0.5], [np.nan, np.nan]]]
+		bounds_b = [[[0.1, 0.8], [0.4, 0.5]], [[0.4, 0.4], [np.nan, np.nan]]]
+		dzt2fs_a = DenseZSliceType2FuzzySet([0.5, 1.0], [1.0, 2.0], bounds_a)
+		dzt2fs_b = DenseZSliceType2FuzzySet([0.5, 1.0], [1.0, 2.0], bounds_b)
+
+		_, _, union = dzt2fs_a.union(dzt2fs_b).to_array()
+		np.testing.assert_array_equal(union, [[[0.2, 0.8], [0.4, 0.5]], [[0.4, 0.5], [np.nan, np.nan]]])
+
+		_, _, intersection = dzt2fs_a.intersection(dzt2fs_b).to_array()
+		np.testing.assert_array_equal(intersection, [[[0.1, 0.6], [np.nan, np.nan]], [[0.3, 0.4], [np.nan, np.nan]]])
+
+		_, _, complement = dzt2fs_a.complement().to_array()
+		np.testing.assert_allclose(complement, [[[0.4, 0.8], [np.nan, np.nan]], [[0.5, 0.7], [np.nan, np.nan]]])
+
+		with self.assertRaises(Exception) : dzt2fs_a.union(DenseZSliceType2FuzzySet([0.5], [1.0, 2.0], bounds_a[:1]))
+
+	def test_hagras_reduce(self):
+		zt2fs = ZSliceType2FuzzySet.from_general_type2_set(self.gt2fs, 10)
+		dzt2fs = DenseZSliceType2FuzzySet.from_zslice_type2_set(zt2fs)
+
+		expected = zslice_hagras_reduce(zt2fs)
+		reduced_set = zslice_hagras_reduce(dzt2fs)
+
+		self.assertListEqual(list(reduced_set.cuts()), list(expected.cuts()))
+		for cut in expected.cuts():
+			self.assertEqual(reduced_set[cut].left, expected[cut].left)
+			self.assertEqual(reduced_set[cut].right, expected[cut].right)
+
+	def test_hagras_reduce_information(self):
+		zt2fs = ZSliceType2FuzzySet.from_general_type2_set(self.gt2fs, 10)
+		dzt2fs = DenseZSliceType2FuzzySet.from_zslice_type2_set(zt2fs)
+
+		expected = zslice_hagras_reduce(zt2fs, precision=1, information='full')
+		reduced_set = zslice_hagras_reduce(dzt2fs, precision=1, information='full')
+
+		self.assertListEqual(list(reduced_set.cuts()), list(expected.cuts()))
+		for cut in expected.cuts():
+			self.assertAlmostEqual(reduced_set[cut].left, expected[cut].left)
+			self.assertAlmostEqual(reduced_set[cut].right, expected[cut].right)
+
+		self.assertIsNone(zslice_hagras_reduce(zt2fs, information='some'))
+		self.assertIsNone(zslice_hagras_reduce(dzt2fs, information='some'))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -1,9 +1,10 @@
 import unittest
 import os
 import numpy as np
-from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet, GeneralType2FuzzySetException
 from type2fuzzy.membership.secondarymf import SecondaryMembershipFunction
 from type2fuzzy.membership.crispset import CrispSet
+from type2fuzzy.membership.sparsegeneraltype2fuzzyset import SparseGeneralType2FuzzySet
 
 class TestGeneralType2FuzzySet(unittest.TestCase):
 
@@ -35,6 +36,13 @@ class TestGeneralType2FuzzySet(unittest.TestCase):
 
 		with self.assertRaises(Exception) : GeneralType2FuzzySet.from_representation(invalid_set_representation)
 
+		# numbers in exponent notation
+		gt2fs = GeneralType2FuzzySet.from_representation('(0.5/1e+0)/1.0 + (2.5e-1/1E-01 + 1/2e-1)/2e+0')
+		self.assertDictEqual(gt2fs[1.00].elements(), {1.00:0.50})
+		self.assertDictEqual(gt2fs[2.00].elements(), {0.10:0.25, 0.20:1.00})
+
+		with self.assertRaises(GeneralType2FuzzySetException) : GeneralType2FuzzySet.from_representation('(0.5/1e+)/1.0')
+
 	def test_load_file(self):
 
 		__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
@@ -52,6 +60,19 @@ class TestGeneralType2FuzzySet(unittest.TestCase):
 		self.assertDictEqual(gt2fs[4.00].elements(), {0.00:0.10, 0.20:0.35, 0.40:0.50, 0.60:0.10, 0.80:0.35, 1.00:0.25})
 		self.assertDictEqual(gt2fs[5.00].elements(), {0.00:0.35, 0.20:0.50, 0.40:0.10, 0.60:0.20, 0.80:0.20})
 
+	def test_stream_file(self):
+
+		__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+
+		gt2fs = GeneralType2FuzzySet.load_file(os.path.join(__location__,'test_set.txt'))
+		vertical_slices = list(GeneralType2FuzzySet.stream_file(os.path.join(__location__,'test_set.txt'), chunk_size=16))
+
+		self.assertEqual([primary_domain_val for primary_domain_val, _ in vertical_slices], [1.00, 2.00, 3.00, 4.00, 5.00])
+		for primary_domain_val, secondary_mf in vertical_slices:
+			self.assertDictEqual(secondary_mf.elements(), gt2fs[primary_domain_val].elements())
+
+		with self.assertRaises(Exception) : list(GeneralType2FuzzySet.stream_file(os.path.join(__location__,'abc.txt')))
+
 	def test_load_array(self):
 		
 		#test that it works
@@ -67,6 +88,12 @@ class TestGeneralType2FuzzySet(unittest.TestCase):
 		self.assertDictEqual(gt2fs[2.00].elements(), {0.00:0.00, 0.50:1.00, 0.90:0.6})
 		self.assertDictEqual(gt2fs[3.00].elements(), {0.00:0.00, 0.50:0.00, 0.90:1.00})
 
+		# the set does not share the array of the caller
+		float_array = np.array(set_array)
+		gt2fs = GeneralType2FuzzySet.from_array(primary_domain, secondary_domain, float_array)
+		float_array[0, 0] = 0.1
+		self.assertEqual(gt2fs.to_array_explicit()[2][0, 0], 0.9)
+
 		#mismatch tests
 		primary_domain = [1, 2, 3, 4]
 		with self.assertRaises(Exception) : GeneralType2FuzzySet.from_array(set_array, primary_domain, secondary_domain)
@@ -82,6 +109,20 @@ class TestGeneralType2FuzzySet(unittest.TestCase):
 					[0.3, 0.6, 1.0]]
 		with self.assertRaises(Exception) : GeneralType2FuzzySet.from_array(set_array, primary_domain, secondary_domain)
 
+	def test_from_points(self):
+		gt2fs = GeneralType2FuzzySet.from_points([2.0, 1.0, 2.0, 1.0, 2.0], [0.5, 0.0, 0.9, 0.5, 0.5], [0.6, 0.9, 1.0, 0.5, 0.8])
+
+		self.assertListEqual(gt2fs.primary_domain(), [1.0, 2.0])
+		self.assertDictEqual(gt2fs[1.00].elements(), {0.00:0.90, 0.50:0.50})
+		self.assertDictEqual(gt2fs[2.00].elements(), {0.50:0.80, 0.90:1.00})
+
+		with self.assertRaises(Exception) : GeneralType2FuzzySet.from_points([1.0, 2.0], [0.5, 0.5], [0.5])
+		with self.assertRaises(Exception) : GeneralType2FuzzySet.from_points([1.0, 2.0], [0.5, 1.5], [0.5, 0.5])
+		with self.assertRaises(Exception) : GeneralType2FuzzySet.from_points([1.0, 2.0], [0.5, 0.5], [0.5, -0.5])
+
+		# invalid grades in an array
+		with self.assertRaises(Exception) : GeneralType2FuzzySet.from_array([1.0, 2.0], [0.5], [[0.5, 1.5]])
+
 	def test_to_representation(self):
 
 		# this is tested before
@@ -135,6 +176,17 @@ class TestGeneralType2FuzzySet(unittest.TestCase):
 
 		np.testing.assert_array_equal(expected_set_array, set_array)
 
+		# the cached array is read only and is rebuilt when the set changes
+		with self.assertRaises(Exception) : set_array[0, 0] = 0.5
+
+		gt2fs.add_element(6.0, 0.5, 0.75)
+		primary_domain, secondary_domain, set_array = gt2fs.to_array_explicit()
+
+		self.assertListEqual(primary_domain, [1.00, 2.00, 3.00, 4.00, 5.00, 6.00])
+		self.assertListEqual(secondary_domain, [0.00, 0.20, 0.40, 0.50, 0.60, 0.80, 1.00])
+		self.assertEqual(set_array[3, 5], 0.75)
+		self.assertEqual(np.count_nonzero(set_array[:, 5]), 1)
+
 	def test_to_array_implicit(self):
 		gt2fs = GeneralType2FuzzySet.from_representation('''(0.90 / 0.00 + 0.50 / 0.20 + 0.20 / 0.40 + 0.35 / 0.60 + 0.10 / 0.80              ) / 0.80 
 														+   (0.50 / 0.00 + 0.35 / 0.20 + 0.35 / 0.40 + 0.20 / 0.60 + 0.50 / 0.80              ) / 2.20 
@@ -156,6 +208,23 @@ class TestGeneralType2FuzzySet(unittest.TestCase):
 
 		np.testing.assert_array_equal(expected_set_array, set_array)
 
+	def test_resample(self):
+		gt2fs = GeneralType2FuzzySet.from_array([1.0, 2.0, 3.0], [0.0, 0.5, 1.0], [[0.2, 0.0, 0.4],
+																					[0.6, 1.0, 0.0],
+																					[0.0, 0.4, 0.8]])
+
+		# snapping keeps the highest secondary grade
+		set_array = gt2fs.to_array_implicit([1.0, 3.0], [0.0, 1.0])
+		np.testing.assert_array_equal(set_array, [[1.0, 0.4], [0.4, 0.8]])
+
+		set_array = gt2fs.to_array_implicit([1.5, 3.5], [0.25, 1.0], method='linear')
+		np.testing.assert_array_almost_equal(set_array, [[0.45, 0.0], [0.2, 0.0]])
+
+		dgt2fs = gt2fs.resample([1.0, 2.0, 3.0], [0.0, 0.5, 1.0])
+		np.testing.assert_array_equal(dgt2fs.to_array_explicit()[2], gt2fs.to_array_explicit()[2])
+
+		with self.assertRaises(Exception) : gt2fs.to_array_implicit([1.0], [0.0], method='cubic')
+
 	def test_primary_domain(self):
 		gt2fs = GeneralType2FuzzySet.from_representation('''(0.90 / 0.00 + 0.50 / 0.20 + 0.20 / 0.40 + 0.35 / 0.60 + 0.10 / 0.80              ) / 1.00 
 														+   (0.50 / 0.00 + 0.35 / 0.20 + 0.35 / 0.40 + 0.20 / 0.60 + 0.50 / 0.80              ) / 2.00 
@@ -207,6 +276,11 @@ class TestGeneralType2FuzzySet(unittest.TestCase):
 		self.assertDictEqual(gt2fs[4.00].elements(), {0.00:0.10, 0.20:0.35, 0.40:0.50, 0.60:0.10, 0.80:0.35, 1.00:0.25})
 		self.assertDictEqual(gt2fs[5.00].elements(), {0.00:0.35, 0.20:0.50, 0.40:0.10, 0.60:0.20, 0.80:0.20})
 
+		# merging into an existing slice keeps the highest secondary grades, as add_element does
+		gt2fs.add_membership_function(3.00, smf)
+		self.assertDictEqual(gt2fs[3.00].elements(), {0.00:0.10, 0.20:0.35, 0.40:0.50, 0.60:0.35, 0.80:0.35, 1.00:0.25})
+		self.assertFalse(gt2fs[3.00].empty)
+
 	def test_footprint_of_uncertainty(self):
 		gt2fs = GeneralType2FuzzySet.from_representation('''(0.90 / 0.00 + 0.50 / 0.20 + 0.60 / 0.40 + 0.35 / 0.60 + 0.10 / 0.80              ) / 1.00 
 														+   (0.50 / 0.00 + 0.35 / 0.20 + 0.35 / 0.40 + 0.20 / 0.60 + 0.50 / 0.80              ) / 2.00 
@@ -309,6 +383,12 @@ class TestGeneralType2FuzzySet(unittest.TestCase):
 
 		self.assertEqual(gt2fs.embedded_type2_sets_count(), expected_embedded_set_count)
 
+		# points with a secondary grade of 0 are not part of any embedded set
+		gt2fs = GeneralType2FuzzySet.from_array([1, 2], [0, 0.5, 1], [[0.2, 0], [1, 1], [0, 0.3]])
+		self.assertEqual(gt2fs.embedded_type2_sets_count(), 4)
+		self.assertEqual(gt2fs.embedded_type2_sets_count(), len(gt2fs.embedded_type2_sets()))
+		self.assertEqual(gt2fs.embedded_type2_sets_count(), SparseGeneralType2FuzzySet.from_general_type2_set(gt2fs).embedded_type2_sets_count())
+
 	def test_embedded_type2_sets(self):
 		gt2fs = GeneralType2FuzzySet.from_representation('''(0.90 / 0.00 + 0.50 / 0.20) / 1.00 
 														+   (0.35 / 0.40 + 0.20 / 0.60) / 2.00 
@@ -325,5 +405,82 @@ class TestGeneralType2FuzzySet(unittest.TestCase):
 
 		self.assertListEqual(gt2fs.embedded_type2_sets(), expected_result)
 
+	def test_embedded_type2_set_sequence(self):
+		gt2fs = GeneralType2FuzzySet.from_representation('''(0.90 / 0.00 + 0.50 / 0.20) / 1.00
+														+   (0.35 / 0.40 + 0.20 / 0.60 + 0.10 / 0.80) / 2.00
+														+   (0.15 / 0.80 + 0.25 / 1.00) / 3.00 ''')
+		embedded_sets = gt2fs.embedded_type2_set_sequence()
+		expected_result = gt2fs.embedded_type2_sets()
+
+		self.assertEqual(len(embedded_sets), 2 * 3 * 2)
+		self.assertEqual(embedded_sets.count, 2 * 3 * 2)
+		for k in range(len(expected_result)):
+			self.assertListEqual(embedded_sets[k], expected_result[k])
+		self.assertListEqual(embedded_sets[-1], expected_result[-1])
+		with self.assertRaises(IndexError) : embedded_sets[12]
+
+		# chunks of consecutive embedded sets, starting within the sequence
+		secondary_grades = np.concatenate([grades for grades, _ in embedded_sets.iter_chunks(chunk_size=4, start=3)])
+		np.testing.assert_array_equal(secondary_grades, [[grade for grade, _, _ in embedded_set] for embedded_set in expected_result[3:]])
+
+		# the count is exact beyond the size of an index
+		gt2fs = GeneralType2FuzzySet.from_points(np.repeat(np.arange(100.00), 10), np.tile(np.arange(1, 11) / 10, 100), np.ones(1000))
+		embedded_sets = gt2fs.embedded_type2_set_sequence()
+		self.assertEqual(embedded_sets.count, 10 ** 100)
+		self.assertEqual(embedded_sets[10 ** 99 + 7][-1], (1.00, 0.80, 99.00))
+		self.assertEqual(embedded_sets[10 ** 99 + 7][0], (1.00, 0.20, 0.00))
+
+	def test_top_k_embedded_sets(self):
+		gt2fs = GeneralType2FuzzySet.from_representation('''(0.90 / 0.00 + 0.50 / 0.20) / 1.00
+														+   (0.35 / 0.40 + 0.20 / 0.60 + 0.10 / 0.80) / 2.00
+														+   (0.15 / 0.80 + 0.25 / 1.00) / 3.00 ''')
+		embedded_sets = gt2fs.embedded_type2_sets()
+
+		def secondary_grade(embedded_set):
+			return min(grade for grade, _, _ in embedded_set)
+
+		expected_grades = sorted((secondary_grade(embedded_set) for embedded_set in embedded_sets), reverse=True)
+
+		for k in [0, 1, 5, 12, 20]:
+			top_k = gt2fs.top_k_embedded_sets(k)
+			self.assertEqual(len(top_k), min(k, 12))
+			self.assertListEqual([secondary_grade(embedded_set) for embedded_set in top_k], expected_grades[:k])
+			for embedded_set in top_k:
+				self.assertIn(embedded_set, embedded_sets)
+
+		# the embedded sets are distinct
+		self.assertEqual(len(set(map(tuple, gt2fs.top_k_embedded_sets(12)))), 12)
+
+		self.assertListEqual(gt2fs.top_k_embedded_sets(1), [[(0.9, 0.0, 1.0), (0.35, 0.4, 2.0), (0.25, 1.0, 3.0)]])
+		with self.assertRaises(GeneralType2FuzzySetException) : gt2fs.top_k_embedded_sets(-1)
+
+		# the set without vertical slices has a single embedded set, without points
+		self.assertListEqual(GeneralType2FuzzySet().embedded_type2_sets(), [[]])
+		self.assertListEqual(GeneralType2FuzzySet().top_k_embedded_sets(1), [[]])
+		self.assertListEqual(GeneralType2FuzzySet().top_k_embedded_sets(3), [[]])
+
+		# does not depend on the number of embedded sets
+		rng = np.random.default_rng(0)
+		gt2fs = GeneralType2FuzzySet.from_points(np.repeat(np.arange(100.00), 10), np.tile(np.arange(1, 11) / 10, 100),
+													np.round(rng.random(1000), 4))
+		top_k = gt2fs.top_k_embedded_sets(50)
+		grades = [secondary_grade(embedded_set) for embedded_set in top_k]
+		self.assertListEqual(grades, sorted(grades, reverse=True))
+		self.assertEqual(grades[0], min(max(gt2fs.vertical_slice(x).elements().values()) for x in gt2fs.primary_domain()))
+
+	def test_union_intersection(self):
+		gt2fs_a = GeneralType2FuzzySet.from_representation('''(0.20 / 0.00 + 1.00 / 0.50 + 0.40 / 1.00) / 1.00
+															+ (0.50 / 0.20) / 2.00''')
+		gt2fs_b = GeneralType2FuzzySet.from_representation('''(1.00 / 0.25 + 0.60 / 0.50) / 1.00
+															+ (0.70 / 0.40) / 3.00''')
+
+		union = gt2fs_a.union(gt2fs_b)
+		self.assertDictEqual(union[1.00].elements(), {0.25: 0.20, 0.50: 1.00, 1.00: 0.40})
+		self.assertDictEqual(union[2.00].elements(), {0.20: 0.50})
+		self.assertDictEqual(union[3.00].elements(), {0.40: 0.70})
+
+		intersection = gt2fs_a.intersection(gt2fs_b)
+		self.assertDictEqual(intersection[1.00].elements(), {0.00: 0.20, 0.25: 1.00, 0.50: 0.60})
+
 if __name__ == '__main__':
 	unittest.main()
\ No newline at end of file
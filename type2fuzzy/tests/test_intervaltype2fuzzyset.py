@@ -32,3 +32,62 @@ class TestIntervalType2FuzzySet(unittest.TestCase):
 
 		self.assertEqual(it2fs[5.00].left, 0.00)
 		self.assertEqual(it2fs[5.00].right, 0.80)
+
+	def test_sorted_primary_domain(self):
+
+		it2fs = IntervalType2FuzzySet()
+		it2fs.add_element_from_values(3.00, 0.10, 0.50)
+		it2fs.add_element_from_values(1.00, 0.20, 0.30)
+		it2fs.add_element_from_values(2.00, 0.00, 1.00)
+
+		# union with an existing element
+		it2fs.add_element_from_values(1.00, 0.10, 0.25)
+
+		np.testing.assert_array_equal(it2fs.primary_domain(), [1.00, 2.00, 3.00])
+		np.testing.assert_array_equal(it2fs.lower_membership_function(), [0.10, 0.00, 0.10])
+		np.testing.assert_array_equal(it2fs.higher_membership_function(), [0.30, 1.00, 0.50])
+
+		self.assertEqual(it2fs[1.00].left, 0.10)
+		self.assertEqual(it2fs[1.00].right, 0.30)
+		self.assertEqual(it2fs.mid_domain_element(), 2.00)
+
+		with self.assertRaises(Exception) : it2fs[1.50]
+
+		# views on the set cannot be modified
+		with self.assertRaises(Exception) : it2fs.lower_membership_function()[0] = 1
+
+		# elements added after the set was read are merged on the next read
+		it2fs.add_element_from_values(0.50, 0.20, 0.40)
+		it2fs.add_element_from_values(3.00, 0.05, 0.60)
+		np.testing.assert_array_equal(it2fs.primary_domain(), [0.50, 1.00, 2.00, 3.00])
+		np.testing.assert_array_equal(it2fs.lower_membership_function(), [0.20, 0.10, 0.00, 0.05])
+		np.testing.assert_array_equal(it2fs.higher_membership_function(), [0.40, 0.30, 1.00, 0.60])
+
+	def test_from_hmf_lmf(self):
+
+		it2fs = IntervalType2FuzzySet.from_hmf_lmf([2.00, 1.00, 2.00], [0.60, 0.40, 0.90], [0.20, 0.10, 0.30])
+
+		np.testing.assert_array_equal(it2fs.primary_domain(), [1.00, 2.00])
+		np.testing.assert_array_equal(it2fs.lower_membership_function(), [0.10, 0.20])
+		np.testing.assert_array_equal(it2fs.higher_membership_function(), [0.40, 0.90])
+
+		with self.assertRaises(Exception) : IntervalType2FuzzySet.from_hmf_lmf([1.00, 2.00], [0.10, 0.20], [0.30, 0.10])
+		with self.assertRaises(Exception) : IntervalType2FuzzySet.from_hmf_lmf([1.00, 2.00], [0.10], [0.00, 0.10])
+
+	def test_resample(self):
+
+		it2fs = IntervalType2FuzzySet.from_hmf_lmf([1.00, 2.00, 3.00, 4.00], [0.40, 0.80, 1.00, 0.60], [0.20, 0.40, 0.60, 0.20])
+
+		resampled = it2fs.resample([1.00, 3.00, 5.00])
+
+		np.testing.assert_array_equal(resampled.primary_domain(), [1.00, 3.00])
+		np.testing.assert_array_equal(resampled.lower_membership_function(), [0.20, 0.20])
+		np.testing.assert_array_equal(resampled.higher_membership_function(), [0.80, 1.00])
+
+		resampled = it2fs.resample([0.50, 1.50, 3.50], method='linear')
+
+		np.testing.assert_array_equal(resampled.primary_domain(), [1.50, 3.50])
+		np.testing.assert_array_almost_equal(resampled.lower_membership_function(), [0.30, 0.40])
+		np.testing.assert_array_almost_equal(resampled.higher_membership_function(), [0.60, 0.80])
+
+		with self.assertRaises(Exception) : it2fs.resample([1.00], method='cubic')
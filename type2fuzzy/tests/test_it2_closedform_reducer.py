@@ -0,0 +1,84 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.membership.generate_it2fs import create_gaussian_fixed_sigma, create_gaussian_fixed_mean
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_kernikmendel_reduce
+from type2fuzzy.type_reduction.it2_closedform_reducer import it2_nietan_reduce, it2_bmm_reduce
+from type2fuzzy.type_reduction.it2_closedform_reducer import it2_nietan_reduce_batch, it2_bmm_reduce_batch
+from type2fuzzy.tests.it2_reducer_fixtures import GaussianSetFixture
+
+class TestIT2ClosedFormReducer(GaussianSetFixture, unittest.TestCase):
+
+	def setUp(self):
+		super().setUp()
+		self.it2fs = IntervalType2FuzzySet.from_hmf_lmf(self.primary_domain, self.upper_mf, self.lower_mf)
+
+	def test_nietan(self):
+		weights = self.lower_mf + self.upper_mf
+		expected = np.dot(self.primary_domain, weights) / np.sum(weights)
+
+		centroid = it2_nietan_reduce(self.it2fs, precision=5)
+		self.assertEqual(centroid.left, round(expected, 5))
+		self.assertEqual(centroid.right, round(expected, 5))
+
+		centroid = it2_nietan_reduce(self.it2fs, information='full')
+		self.assertAlmostEqual(centroid.left, expected, places=10)
+
+	def test_bmm(self):
+		lower_centroid = np.dot(self.primary_domain, self.lower_mf) / np.sum(self.lower_mf)
+		upper_centroid = np.dot(self.primary_domain, self.upper_mf) / np.sum(self.upper_mf)
+
+		centroid = it2_bmm_reduce(self.it2fs, precision=5)
+		self.assertEqual(centroid.left, round((lower_centroid + upper_centroid) / 2, 5))
+
+		centroid = it2_bmm_reduce(self.it2fs, information='full', alpha=0.25, beta=0.75)
+		self.assertAlmostEqual(centroid.right, 0.25 * lower_centroid + 0.75 * upper_centroid, places=10)
+
+	def test_batch(self):
+		it2fss = [self.it2fs,
+					IntervalType2FuzzySet(),
+					create_gaussian_fixed_sigma(np.linspace(0, 10, 51).tolist(), 4, 6),
+					create_gaussian_fixed_mean(np.linspace(0, 10, 31).tolist(), 1, 2, mean=3)]
+
+		for reduce_function, reduce_batch_function in [(it2_nietan_reduce, it2_nietan_reduce_batch),
+														(it2_bmm_reduce, it2_bmm_reduce_batch)]:
+			centroids = reduce_batch_function(it2fss, precision=10)
+
+			self.assertEqual(len(centroids), len(it2fss))
+			self.assertTrue(centroids.empty[1])
+			for idx in [0, 2, 3]:
+				expected = reduce_function(it2fss[idx], information='full')
+				self.assertAlmostEqual(centroids.left[idx], expected.left, places=8)
+				self.assertAlmostEqual(centroids.right[idx], expected.right, places=8)
+
+		self.assertEqual(len(it2_nietan_reduce_batch([])), 0)
+
+	def test_zero_membership_function(self):
+		# both APIs give an empty centroid for a set whose centroid cannot be found
+		it2fss = [IntervalType2FuzzySet(),
+					IntervalType2FuzzySet.from_hmf_lmf([1.0, 2.0, 3.0], [0.2, 1.0, 0.5], [0.0, 0.0, 0.0]),
+					IntervalType2FuzzySet.from_hmf_lmf([1.0, 2.0, 3.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0])]
+		expected_empty = {it2_nietan_reduce: [True, False, True], it2_bmm_reduce: [True, True, True]}
+
+		for reduce_function, reduce_batch_function in [(it2_nietan_reduce, it2_nietan_reduce_batch),
+														(it2_bmm_reduce, it2_bmm_reduce_batch)]:
+			centroids = reduce_batch_function(it2fss)
+			for idx, it2fs in enumerate(it2fss):
+				centroid = reduce_function(it2fs)
+				self.assertEqual(centroid.empty, expected_empty[reduce_function][idx])
+				self.assertEqual(centroids.empty[idx], centroid.empty)
+				if not centroid.empty:
+					self.assertEqual(centroids.left[idx], centroid.left)
+
+	def test_symmetric_sets(self):
+		# both methods are exact for the mid point of the centroid of symmetric sets
+		for it2fs in [create_gaussian_fixed_sigma(np.linspace(0, 10, 101).tolist(), 4, 6),
+						create_gaussian_fixed_mean(np.linspace(0, 10, 101).tolist(), 1, 2, mean=5)]:
+			expected = it2_kernikmendel_reduce(it2fs, information='full')
+			expected = (expected.left + expected.right) / 2
+
+			self.assertAlmostEqual(it2_nietan_reduce(it2fs, information='full').left, expected, places=8)
+			self.assertAlmostEqual(it2_bmm_reduce(it2fs, information='full').left, expected, places=8)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.type_reduction.it2_exhaustive_reducer import it2_exhaustive_reduce
+from type2fuzzy.type_reduction.it2_exhaustive_reducer import it2_exhaustive_centroid
+from type2fuzzy.tests.it2_reducer_fixtures import exhaustive_centroid, GaussianSetFixture
+
+class TestIT2ExhaustiveReducer(GaussianSetFixture, unittest.TestCase):
+
+	def test_centroid(self):
+		for lower_mf in [self.lower_mf, np.zeros(len(self.primary_domain))]:
+			expected_left, expected_right = exhaustive_centroid(self.primary_domain, lower_mf, self.upper_mf)
+
+			centroid_left, centroid_right, switch_points = it2_exhaustive_centroid(
+				self.primary_domain, lower_mf, self.upper_mf)
+			self.assertAlmostEqual(centroid_left, expected_left, places=10)
+			self.assertAlmostEqual(centroid_right, expected_right, places=10)
+
+			# the limits of the returned switch points
+			weights = np.r_[self.upper_mf[:switch_points[0]], lower_mf[switch_points[0]:]]
+			self.assertAlmostEqual(centroid_left, np.dot(self.primary_domain, weights) / np.sum(weights), places=10)
+			weights = np.r_[lower_mf[:switch_points[1]], self.upper_mf[switch_points[1]:]]
+			self.assertAlmostEqual(centroid_right, np.dot(self.primary_domain, weights) / np.sum(weights), places=10)
+
+	def test_single_element(self):
+		self.assertEqual(it2_exhaustive_centroid([2.0], [0.5], [1.0])[:2], (2.0, 2.0))
+		self.assertEqual(it2_exhaustive_centroid([2.0], [0.0], [1.0])[:2], (2.0, 2.0))
+
+	def test_reduce(self):
+		it2fs = IntervalType2FuzzySet.from_hmf_lmf(self.primary_domain, self.upper_mf, self.lower_mf)
+		expected_left, expected_right = exhaustive_centroid(self.primary_domain, self.lower_mf, self.upper_mf)
+
+		centroid = it2_exhaustive_reduce(it2fs, precision=5)
+		self.assertEqual(centroid.left, round(expected_left, 5))
+		self.assertEqual(centroid.right, round(expected_right, 5))
+
+		centroid = it2_exhaustive_reduce(it2fs, information='full')
+		self.assertAlmostEqual(centroid.left, expected_left, places=10)
+		self.assertAlmostEqual(centroid.right, expected_right, places=10)
+
+if __name__ == '__main__':
+	unittest.main()
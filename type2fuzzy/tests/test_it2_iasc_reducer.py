@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.type_reduction.it2_iasc_reducer import it2_iasc_reduce, it2_eiasc_reduce
+from type2fuzzy.type_reduction.it2_iasc_reducer import it2_iasc_centroid, it2_eiasc_centroid
+from type2fuzzy.tests.it2_reducer_fixtures import exhaustive_centroid, GaussianSetFixture
+
+class TestIT2IASCReducer(GaussianSetFixture, unittest.TestCase):
+
+	def setUp(self):
+		super().setUp()
+		# domain values without uncertainty must not stop the iterations
+		self.lower_mf[::7] = self.upper_mf[::7]
+
+	def test_centroid(self):
+		for lower_mf, upper_mf in [(self.lower_mf, self.upper_mf), (self.lower_mf[::-1], self.upper_mf[::-1])]:
+			expected_left, expected_right = exhaustive_centroid(self.primary_domain, lower_mf, upper_mf)
+
+			for centroid_function in [it2_iasc_centroid, it2_eiasc_centroid]:
+				centroid_left, centroid_right, iterations = centroid_function(self.primary_domain, lower_mf, upper_mf)
+				self.assertAlmostEqual(centroid_left, expected_left, places=10)
+				self.assertAlmostEqual(centroid_right, expected_right, places=10)
+				self.assertTrue(1 <= iterations[0] <= len(self.primary_domain))
+				self.assertTrue(1 <= iterations[1] <= len(self.primary_domain))
+
+	def test_zero_lower_membership_function(self):
+		lower_mf = np.zeros(len(self.primary_domain))
+		expected_left, expected_right = exhaustive_centroid(self.primary_domain, lower_mf, self.upper_mf)
+
+		for centroid_function in [it2_iasc_centroid, it2_eiasc_centroid]:
+			centroid_left, centroid_right, _ = centroid_function(self.primary_domain, lower_mf, self.upper_mf)
+			self.assertAlmostEqual(centroid_left, expected_left, places=10)
+			self.assertAlmostEqual(centroid_right, expected_right, places=10)
+
+	def test_reduce(self):
+		it2fs = IntervalType2FuzzySet.from_hmf_lmf(self.primary_domain, self.upper_mf, self.lower_mf)
+		expected_left, expected_right = exhaustive_centroid(self.primary_domain, self.lower_mf, self.upper_mf)
+
+		for reduce_function in [it2_iasc_reduce, it2_eiasc_reduce]:
+			centroid = reduce_function(it2fs, precision=5)
+			self.assertEqual(centroid.left, round(expected_left, 5))
+			self.assertEqual(centroid.right, round(expected_right, 5))
+
+			centroid = reduce_function(it2fs, information='full')
+			self.assertAlmostEqual(centroid.left, expected_left, places=10)
+			self.assertAlmostEqual(centroid.right, expected_right, places=10)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_kernikmendel_reduce
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_kernikmendel_centroid
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_enhanced_kernikmendel_centroid
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import _it2_kernikmendel_reduce_batch
+from type2fuzzy.tests.it2_reducer_fixtures import exhaustive_centroid, GaussianSetFixture
+
+class TestIT2KarnikMendelReducer(GaussianSetFixture, unittest.TestCase):
+
+	def test_exact_centroid(self):
+		centroid_left, centroid_right, iterations = it2_kernikmendel_centroid(
+			self.primary_domain, self.lower_mf, self.upper_mf)
+		expected_left, expected_right = exhaustive_centroid(self.primary_domain, self.lower_mf, self.upper_mf)
+
+		self.assertAlmostEqual(centroid_left, expected_left, places=10)
+		self.assertAlmostEqual(centroid_right, expected_right, places=10)
+		self.assertTrue(1 <= iterations[0] <= len(self.primary_domain))
+		self.assertTrue(1 <= iterations[1] <= len(self.primary_domain))
+
+	def test_enhanced_centroid(self):
+		for lower_mf, upper_mf in [(self.lower_mf, self.upper_mf), (self.lower_mf[::-1], self.upper_mf[::-1])]:
+			centroid_left, centroid_right, iterations = it2_enhanced_kernikmendel_centroid(
+				self.primary_domain, lower_mf, upper_mf)
+			expected_left, expected_right = exhaustive_centroid(self.primary_domain, lower_mf, upper_mf)
+
+			self.assertAlmostEqual(centroid_left, expected_left, places=10)
+			self.assertAlmostEqual(centroid_right, expected_right, places=10)
+			self.assertTrue(1 <= iterations[0] <= len(self.primary_domain))
+			self.assertTrue(1 <= iterations[1] <= len(self.primary_domain))
+
+		# a single domain value
+		self.assertEqual(it2_enhanced_kernikmendel_centroid([2.0], [0.5], [1.0])[:2], (2.0, 2.0))
+
+	def test_reduce(self):
+		it2fs = IntervalType2FuzzySet.from_hmf_lmf(self.primary_domain, self.upper_mf, self.lower_mf)
+		expected_left, expected_right = exhaustive_centroid(self.primary_domain, self.lower_mf, self.upper_mf)
+
+		centroid = it2_kernikmendel_reduce(it2fs, precision=5)
+		self.assertEqual(centroid.left, round(expected_left, 5))
+		self.assertEqual(centroid.right, round(expected_right, 5))
+
+		centroid = it2_kernikmendel_reduce(it2fs, information='full')
+		self.assertAlmostEqual(centroid.left, expected_left, places=10)
+		self.assertAlmostEqual(centroid.right, expected_right, places=10)
+
+		centroid = it2_kernikmendel_reduce(it2fs, precision=5, algorithm='ekm')
+		self.assertEqual(centroid.left, round(expected_left, 5))
+		self.assertEqual(centroid.right, round(expected_right, 5))
+
+		centroid = it2_kernikmendel_reduce(it2fs, information='full', algorithm='ekm')
+		self.assertAlmostEqual(centroid.left, expected_left, places=10)
+		self.assertAlmostEqual(centroid.right, expected_right, places=10)
+
+		with self.assertRaises(ValueError):
+			it2_kernikmendel_reduce(it2fs, algorithm='iasc')
+
+	def test_batch(self):
+		lower_mfs = np.vstack((self.lower_mf, self.lower_mf[::-1]))
+		upper_mfs = np.vstack((self.upper_mf, self.upper_mf[::-1]))
+		# the last values are not part of the second set
+		lower_mfs[1, 90:] = np.nan
+		upper_mfs[1, 90:] = np.nan
+
+		for algorithm in ['km', 'ekm']:
+			centroid_left, centroid_right = _it2_kernikmendel_reduce_batch(
+				self.primary_domain, lower_mfs, upper_mfs, algorithm)
+
+			for row in range(2):
+				included = ~np.isnan(lower_mfs[row])
+				expected = it2_kernikmendel_centroid(self.primary_domain[included], lower_mfs[row, included], upper_mfs[row, included])
+				self.assertAlmostEqual(centroid_left[row], expected[0], places=10)
+				self.assertAlmostEqual(centroid_right[row], expected[1], places=10)
+
+	def test_zero_lower_mf(self):
+		# switch points without any weighted domain value do not improve the limits
+		primary_domain = np.array([3.5, 7.0, 9.5, 11.5, 15.0])
+		upper_mfs = np.array([[0.0, 0.0, 0.7, 0.45, 0.8], [0.22, 0.95, 0.0, 0.0, 0.0]])
+		expected = [(9.5, 15.0), (3.5, 7.0)]
+
+		for row in range(2):
+			for centroid_function in [it2_kernikmendel_centroid, it2_enhanced_kernikmendel_centroid]:
+				centroid_left, centroid_right, _ = centroid_function(primary_domain, np.zeros(5), upper_mfs[row])
+				self.assertAlmostEqual(centroid_left, expected[row][0], places=10)
+				self.assertAlmostEqual(centroid_right, expected[row][1], places=10)
+
+		for algorithm in ['km', 'ekm']:
+			centroid_left, centroid_right = _it2_kernikmendel_reduce_batch(
+				primary_domain, np.zeros((2, 5)), upper_mfs, algorithm)
+			np.testing.assert_allclose(centroid_left, [9.5, 3.5])
+			np.testing.assert_allclose(centroid_right, [15.0, 7.0])
+
+		it2fs = IntervalType2FuzzySet.from_hmf_lmf([0.6, 4.4], [0.22, 0.95], [0.0, 0.0])
+		for algorithm in ['km', 'ekm']:
+			centroid = it2_kernikmendel_reduce(it2fs, precision=5, algorithm=algorithm)
+			self.assertEqual((centroid.left, centroid.right), (0.6, 4.4))
+
+if __name__ == '__main__':
+	unittest.main()
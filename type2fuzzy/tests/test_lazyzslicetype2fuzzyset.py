@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.zslicetype2fuzzyset import ZSliceType2FuzzySet
+from type2fuzzy.membership.lazyzslicetype2fuzzyset import LazyZSliceType2FuzzySet
+from type2fuzzy.type_reduction.zslice_hagras_reducer import zslice_hagras_reduce
+
+class TestLazyZSliceType2FuzzySet(unittest.TestCase):
+
+	def setUp(self):
+		self.primary_domain = [1.0, 2.0, 3.0, 4.0]
+		self.secondary_domain = [0.0, 0.25, 0.5, 0.75, 1.0]
+		self.set_array = [[0.0, 0.0, 0.0, 0.0],
+						[0.2, 0.5, 0.0, 0.0],
+						[0.9, 0.8, 0.5, 0.0],
+						[0.5, 0.7, 0.6, 0.5],
+						[0.0, 0.2, 0.6, 0.9]]
+		self.gt2fs = GeneralType2FuzzySet.from_array(self.primary_domain, self.secondary_domain, self.set_array)
+
+	def test_same_as_zslice_set(self):
+		for levels in ['uniform', 'exact', 'adaptive']:
+			zt2fs = ZSliceType2FuzzySet.from_general_type2_set(self.gt2fs, 4, levels=levels)
+			lazy_zt2fs = LazyZSliceType2FuzzySet(self.gt2fs, 4, levels=levels)
+
+			self.assertListEqual(lazy_zt2fs.zslices(), zt2fs.zslices())
+			for z_val in zt2fs.zslices():
+				np.testing.assert_array_equal(lazy_zt2fs[z_val].primary_domain(), zt2fs[z_val].primary_domain())
+				np.testing.assert_array_equal(lazy_zt2fs[z_val].lower_membership_function(), zt2fs[z_val].lower_membership_function())
+				np.testing.assert_array_equal(lazy_zt2fs[z_val].higher_membership_function(), zt2fs[z_val].higher_membership_function())
+
+		# the levels above the highest secondary grade are empty
+		self.assertAlmostEqual(LazyZSliceType2FuzzySet(self.gt2fs, 10).zslices()[-1], 0.9)
+
+		expected = zslice_hagras_reduce(ZSliceType2FuzzySet.from_general_type2_set(self.gt2fs, 10))
+		reduced_set = zslice_hagras_reduce(LazyZSliceType2FuzzySet(self.gt2fs, 10))
+		self.assertListEqual(list(reduced_set.cuts()), list(expected.cuts()))
+
+	def test_nearest_zslice(self):
+		lazy_zt2fs = LazyZSliceType2FuzzySet(self.gt2fs, 4)
+
+		self.assertListEqual(lazy_zt2fs.zslices(), [0.0, 0.25, 0.5, 0.75])
+		self.assertEqual(lazy_zt2fs.nearest_zslice(0.3), 0.25)
+		self.assertEqual(lazy_zt2fs.nearest_zslice(0.375), 0.25)
+		self.assertEqual(lazy_zt2fs.nearest_zslice(0.4), 0.5)
+		self.assertEqual(lazy_zt2fs.nearest_zslice(-1.0), 0.0)
+		self.assertEqual(lazy_zt2fs.nearest_zslice(1.0), 0.75)
+
+		with self.assertRaises(Exception) : LazyZSliceType2FuzzySet(GeneralType2FuzzySet(), 4)[0.5]
+
+	def test_cache(self):
+		lazy_zt2fs = LazyZSliceType2FuzzySet(self.gt2fs, 4, cache_size=2)
+		self.assertListEqual(lazy_zt2fs.cached_zslices(), [])
+
+		it2fs = lazy_zt2fs[0.5]
+		self.assertIs(lazy_zt2fs[0.49], it2fs)
+
+		lazy_zt2fs[0.25]
+		lazy_zt2fs[0.5]
+		lazy_zt2fs[0.0]
+		# the least recently used slice is dropped
+		self.assertListEqual(lazy_zt2fs.cached_zslices(), [0.5, 0.0])
+
+		with self.assertRaises(Exception) : LazyZSliceType2FuzzySet(self.gt2fs, 4, cache_size=0)
+		with self.assertRaises(Exception) : LazyZSliceType2FuzzySet(self.gt2fs)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import io
+import numpy as np
+from type2fuzzy.membership.representation_parser import parse_general_type2_representation
+from type2fuzzy.membership.representation_parser import parse_interval_type2_representation
+from type2fuzzy.membership.representation_parser import iter_general_type2_slices
+from type2fuzzy.membership.representation_parser import iter_interval_type2_elements
+from type2fuzzy.membership.representation_parser import RepresentationParserException
+
+class TestRepresentationParser(unittest.TestCase):
+
+	def test_parse_general_type2_representation(self):
+		x, u, grades = parse_general_type2_representation('''(0.90 / 0.00 + 0.50 / 0.20) / 1.00
+															+ (0.35 / 0.60) / 2.50''')
+		np.testing.assert_array_equal(x, [1.00, 1.00, 2.50])
+		np.testing.assert_array_equal(u, [0.00, 0.20, 0.60])
+		np.testing.assert_array_equal(grades, [0.90, 0.50, 0.35])
+
+		# signed and exponent notation is handled by the checked path
+		x, u, grades = parse_general_type2_representation(b'(1e-1 / 0.00 + 0.50 / +0.20) / -1.00')
+		np.testing.assert_array_equal(x, [-1.00, -1.00])
+		np.testing.assert_array_equal(u, [0.00, 0.20])
+		np.testing.assert_array_equal(grades, [0.10, 0.50])
+
+		# the sign of an exponent is not a separator of the points
+		x, u, grades = parse_general_type2_representation(b'(5e-1 / 1e+0 + 2.5E+1 / 2e-01) / 1e+02 + (1e+0 / 3) / 2')
+		np.testing.assert_array_equal(x, [100.0, 100.0, 2.0])
+		np.testing.assert_array_equal(u, [1.0, 0.2, 3.0])
+		np.testing.assert_array_equal(grades, [0.5, 25.0, 1.0])
+
+		with self.assertRaises(RepresentationParserException) as context:
+			parse_general_type2_representation('(0.90 / 0.00 + 0.50 0.20) / 1.00')
+		self.assertEqual(context.exception.offset, 15)
+
+		with self.assertRaises(RepresentationParserException) as context:
+			parse_general_type2_representation('(0.90 / 0.00) / 1.00 + (0.50 / 0.20 / 2.00')
+		self.assertEqual(context.exception.offset, 23)
+
+		with self.assertRaises(RepresentationParserException) as context:
+			parse_general_type2_representation('(0.90 / 0.00) / 1.00 +')
+		self.assertEqual(context.exception.offset, 22)
+
+	def test_parse_interval_type2_representation(self):
+		x, lower, upper = parse_interval_type2_representation('[0.10, 0.20]/1.00 + [0.50]/2.00')
+		np.testing.assert_array_equal(x, [1.00, 2.00])
+		np.testing.assert_array_equal(lower, [0.10, 0.50])
+		np.testing.assert_array_equal(upper, [0.20, 0.50])
+
+		with self.assertRaises(RepresentationParserException) as context:
+			parse_interval_type2_representation('[0.10, 0.20]/1.00 + [0.50/2.00')
+		self.assertEqual(context.exception.offset, 20)
+
+	def test_iter_general_type2_slices(self):
+		representation = b'(0.90 / 0.00 + 0.50 / 0.20) / 1.00 + (0.35 / 0.60) / 2.50 + (1.00 / 0.10) / 2.00'
+
+		# slices spanning several chunks are yielded once complete
+		for chunk_size in [1, 7, 1000]:
+			slices = list(iter_general_type2_slices(io.BytesIO(representation), chunk_size))
+			self.assertEqual([primary_domain_val for primary_domain_val, _, _ in slices], [1.00, 2.50, 2.00])
+			np.testing.assert_array_equal(slices[0][1], [0.00, 0.20])
+			np.testing.assert_array_equal(slices[0][2], [0.90, 0.50])
+
+			slices = list(iter_general_type2_slices(io.BytesIO(b'(0.5 / 1e+0 + 1e-1 / 2e+0) / 1e+0'), chunk_size))
+			self.assertEqual([primary_domain_val for primary_domain_val, _, _ in slices], [1.00])
+			np.testing.assert_array_equal(slices[0][1], [1.00, 2.00])
+			np.testing.assert_array_equal(slices[0][2], [0.50, 0.10])
+
+			# offsets of errors are offsets in the file
+			with self.assertRaises(RepresentationParserException) as context:
+				list(iter_general_type2_slices(io.BytesIO(representation.replace(b'+ (0.35', b'(0.35')), chunk_size))
+			self.assertEqual(context.exception.offset, 35)
+
+			with self.assertRaises(RepresentationParserException) as context:
+				list(iter_general_type2_slices(io.BytesIO(representation.replace(b'1.00 / 0.10', b'1.00 0.10')), chunk_size))
+			self.assertEqual(context.exception.offset, 61)
+
+	def test_iter_interval_type2_elements(self):
+		representation = b'[0.10, 0.20]/1.00 + [0.50]/2.00 + [0.30, 0.40]/3.00'
+
+		for chunk_size in [1, 5, 1000]:
+			elements = list(iter_interval_type2_elements(io.BytesIO(representation), chunk_size))
+			self.assertEqual(elements, [(1.00, 0.10, 0.20), (2.00, 0.50, 0.50), (3.00, 0.30, 0.40)])
+
+if __name__ == '__main__':
+	unittest.main()
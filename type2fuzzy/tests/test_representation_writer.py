@@ -0,0 +1,34 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.representation_writer import format_unit_values
+from type2fuzzy.membership.representation_writer import general_type2_representation_blocks
+
+class TestRepresentationWriter(unittest.TestCase):
+
+	def test_format_unit_values(self):
+		# includes values on rounding ties
+		values = np.r_[np.random.default_rng(0).random(1000), np.arange(0, 2001) / 2000]
+
+		for num_dec_places in [1, 4, 9]:
+			characters = format_unit_values(values, num_dec_places)
+			self.assertEqual([row.tobytes().decode('ascii') for row in characters],
+								[f'%0.{num_dec_places}f' % value for value in values.tolist()])
+
+		self.assertIsNone(format_unit_values([0.50, 1.50], 4))
+		self.assertIsNone(format_unit_values([-0.00], 4))
+		self.assertIsNone(format_unit_values([0.50], 0))
+
+	def test_general_type2_representation_blocks(self):
+		vertical_slices = [(1.00, [0.00, 0.50], [0.90, 0.30]), (2.00, [], []), (3.50, [0.20], [1.00])]
+		representation = '(0.9000 / 0.0000 + 0.3000 / 0.5000) / 1.0000 + () / 2.0000 + (1.0000 / 0.2000) / 3.5000'
+
+		for block_size in [1, 2, 100]:
+			blocks = list(general_type2_representation_blocks(vertical_slices, 4, block_size))
+			self.assertEqual(''.join(blocks), representation)
+
+		# values out of [0, 1] are formatted one by one
+		blocks = general_type2_representation_blocks([(1.00, [0.50], [-0.00])], 2)
+		self.assertEqual(''.join(blocks), '(-0.00 / 0.50) / 1.00')
+
+if __name__ == '__main__':
+	unittest.main()
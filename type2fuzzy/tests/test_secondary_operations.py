@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.secondary_operations import max_min_join, max_min_meet
+
+class TestSecondaryOperations(unittest.TestCase):
+
+	@staticmethod
+	def pairwise(domain_a, grades_a, domain_b, grades_b, operator):
+		''' the join or meet visiting every pair of points '''
+		result = {}
+		for u, f in zip(domain_a, grades_a):
+			for v, g in zip(domain_b, grades_b):
+				t = operator(u, v)
+				result[t] = max(result.get(t, 0.0), min(f, g))
+		return result
+
+	def test_against_pairs(self):
+		rng = np.random.default_rng(0)
+
+		# convex and non convex membership functions, with zero grades
+		for _ in range(200):
+			domain_a = np.sort(rng.choice(np.arange(20) / 20, rng.integers(0, 8), replace=False))
+			domain_b = np.sort(rng.choice(np.arange(20) / 20, rng.integers(0, 8), replace=False))
+			grades_a = rng.choice([0.0, 0.3, 0.5, 1.0], len(domain_a))
+			grades_b = rng.choice([0.0, 0.3, 0.5, 1.0], len(domain_b))
+
+			for function, operator in [(max_min_join, max), (max_min_meet, min)]:
+				domain, grades = function(domain_a, grades_a, domain_b, grades_b)
+				self.assertDictEqual(dict(zip(domain.tolist(), grades.tolist())),
+									self.pairwise(domain_a.tolist(), grades_a.tolist(), domain_b.tolist(), grades_b.tolist(), operator))
+
+	def test_join_meet(self):
+		domain, grades = max_min_join([0.0, 0.5, 1.0], [0.2, 1.0, 0.4], [0.25, 0.5], [1.0, 0.6])
+		np.testing.assert_array_equal(domain, [0.25, 0.5, 1.0])
+		np.testing.assert_array_equal(grades, [0.2, 1.0, 0.4])
+
+		domain, grades = max_min_meet([0.0, 0.5, 1.0], [0.2, 1.0, 0.4], [0.25, 0.5], [1.0, 0.6])
+		np.testing.assert_array_equal(domain, [0.0, 0.25, 0.5])
+		np.testing.assert_array_equal(grades, [0.2, 1.0, 0.6])
+
+		domain, grades = max_min_join([], [], [0.5], [1.0])
+		self.assertEqual(len(domain), 0)
+
+if __name__ == '__main__':
+	unittest.main()
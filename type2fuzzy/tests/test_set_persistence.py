@@ -0,0 +1,68 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
+from type2fuzzy.membership.zslicetype2fuzzyset import ZSliceType2FuzzySet
+from type2fuzzy.membership.alphacuttype1fuzzyset import AlphaCutType1FuzzySet
+from type2fuzzy.membership.set_persistence import SetPersistenceException
+
+class TestSetPersistence(unittest.TestCase):
+
+	def setUp(self):
+		self._directory = tempfile.TemporaryDirectory()
+		self._filename = os.path.join(self._directory.name, 'set.npz')
+
+	def tearDown(self):
+		self._directory.cleanup()
+
+	def test_general_type2_set(self):
+		gt2fs = GeneralType2FuzzySet.from_representation('''(0.90 / 0.00 + 0.50 / 0.20) / 1.00
+															+ (1 / 0.3333333333) / 2.00''')
+		gt2fs.save_npz(self._filename)
+
+		for mmap_mode in [None, 'r']:
+			loaded_set = GeneralType2FuzzySet.load_npz(self._filename, mmap_mode=mmap_mode)
+			self.assertEqual(loaded_set.primary_domain(), [1.00, 2.00])
+			self.assertDictEqual(loaded_set[1.00].elements(), {0.00:0.90, 0.20:0.50})
+			# no rounding
+			self.assertDictEqual(loaded_set[2.00].elements(), {0.3333333333:1.00})
+
+	def test_interval_type2_set(self):
+		it2fs = IntervalType2FuzzySet.from_hmf_lmf([1.00, 2.00, 3.00], [0.50, 1/3, 0.90], [0.10, 0.20, 0.30])
+		it2fs.save_npz(self._filename)
+
+		for mmap_mode in [None, 'r', 'c']:
+			loaded_set = IntervalType2FuzzySet.load_npz(self._filename, mmap_mode=mmap_mode)
+			np.testing.assert_array_equal(loaded_set.primary_domain(), [1.00, 2.00, 3.00])
+			np.testing.assert_array_equal(loaded_set.higher_membership_function(), [0.50, 1/3, 0.90])
+			np.testing.assert_array_equal(loaded_set.lower_membership_function(), [0.10, 0.20, 0.30])
+
+		# the header is checked
+		with self.assertRaises(SetPersistenceException) : AlphaCutType1FuzzySet.load_npz(self._filename)
+		with self.assertRaises(SetPersistenceException) : IntervalType2FuzzySet.load_npz(self._filename, mmap_mode='w+')
+		with self.assertRaises(SetPersistenceException) : IntervalType2FuzzySet.load_npz(os.path.join(self._directory.name, 'abc.npz'))
+
+	def test_zslice_type2_set(self):
+		zt2fs = ZSliceType2FuzzySet()
+		zt2fs.add_element(0.25, IntervalType2FuzzySet.from_hmf_lmf([1.00, 2.00], [0.50, 0.90], [0.10, 0.20]))
+		zt2fs.add_element(0.75, IntervalType2FuzzySet.from_hmf_lmf([2.00], [0.60], [0.40]))
+		zt2fs.save_npz(self._filename)
+
+		loaded_set = ZSliceType2FuzzySet.load_npz(self._filename, mmap_mode='r')
+		self.assertEqual(loaded_set.zslices(), [0.25, 0.75])
+		np.testing.assert_array_equal(loaded_set[0.25].primary_domain(), [1.00, 2.00])
+		np.testing.assert_array_equal(loaded_set[0.75].lower_membership_function(), [0.40])
+
+	def test_alphacut_type1_set(self):
+		at1fs = AlphaCutType1FuzzySet.from_arrays([0.00, 0.50, 1.00], [1.00, 2.00, 3.00], [5.00, 4.00, 3.00])
+		at1fs.save_npz(self._filename)
+
+		loaded_set = AlphaCutType1FuzzySet.load_npz(self._filename)
+		self.assertEqual(loaded_set.cuts(), [0.00, 0.50, 1.00])
+		self.assertEqual(loaded_set[0.50].left, 2.00)
+		self.assertEqual(loaded_set[0.50].right, 4.00)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.densegeneraltype2fuzzyset import DenseGeneralType2FuzzySet
+from type2fuzzy.membership.sparsegeneraltype2fuzzyset import SparseGeneralType2FuzzySet
+
+class TestSparseGeneralType2FuzzySet(unittest.TestCase):
+
+	def setUp(self):
+		self.primary_domain = [1.0, 2.0, 3.0, 4.0]
+		self.secondary_domain = [0.0, 0.5, 1.0]
+		self.set_array =[[0.9, 0.0, 0.0, 0.0],
+						[0.5, 1.0, 0.0, 0.0],
+						[0.0, 0.6, 1.0, 0.0]]
+
+	def test_from_array(self):
+		sgt2fs = SparseGeneralType2FuzzySet.from_array(self.primary_domain, self.secondary_domain, self.set_array)
+
+		self.assertEqual(sgt2fs.element_count(), 5)
+
+		secondary_domain_vals, secondary_grades = sgt2fs.vertical_slice(2.0)
+		np.testing.assert_array_equal(secondary_domain_vals, [0.5, 1.0])
+		np.testing.assert_array_equal(secondary_grades, [1.0, 0.6])
+
+		secondary_domain_vals, secondary_grades = sgt2fs.vertical_slice(4.0)
+		self.assertEqual(len(secondary_domain_vals), 0)
+
+		with self.assertRaises(Exception) : sgt2fs.vertical_slice(2.5)
+
+	def test_dense_conversion(self):
+		dgt2fs = DenseGeneralType2FuzzySet(self.primary_domain, self.secondary_domain, self.set_array)
+
+		sgt2fs = SparseGeneralType2FuzzySet.from_dense(dgt2fs)
+		primary_domain, secondary_domain, set_array = sgt2fs.to_dense().to_array_explicit()
+
+		np.testing.assert_array_equal(primary_domain, self.primary_domain)
+		np.testing.assert_array_equal(secondary_domain, self.secondary_domain)
+		np.testing.assert_array_equal(set_array, self.set_array)
+
+	def test_from_general_type2_set(self):
+		gt2fs = GeneralType2FuzzySet.from_representation('''(0.90 / 0.00 + 0.50 / 0.20) / 1.00 
+														+   (0.35 / 0.40 + 0.20 / 0.60) / 2.00 
+														+   (0.15 / 0.80 + 0.25 / 1.00) / 3.00 ''')
+
+		sgt2fs = SparseGeneralType2FuzzySet.from_general_type2_set(gt2fs)
+		_, _, expected_set_array = gt2fs.to_array_explicit()
+
+		np.testing.assert_array_equal(sgt2fs.to_dense().to_array_explicit()[2], expected_set_array)
+
+	def test_footprint_of_uncertainty(self):
+		sgt2fs = SparseGeneralType2FuzzySet.from_array(self.primary_domain, self.secondary_domain, self.set_array)
+
+		fou = sgt2fs.footprint_of_uncertainty()
+
+		self.assertListEqual(list(fou.keys()), [1.0, 2.0, 3.0])
+		self.assertEqual(fou[1.0].left, 0.0)
+		self.assertEqual(fou[1.0].right, 0.5)
+		self.assertEqual(fou[2.0].left, 0.5)
+		self.assertEqual(fou[2.0].right, 1.0)
+		self.assertEqual(fou[3.0].left, 1.0)
+		self.assertEqual(fou[3.0].right, 1.0)
+
+	def test_z_slice(self):
+		sgt2fs = SparseGeneralType2FuzzySet.from_array(self.primary_domain, self.secondary_domain, self.set_array)
+
+		it2fs = sgt2fs.z_slice(0.6)
+
+		self.assertListEqual(list(it2fs.primary_domain()), [1.0, 2.0, 3.0])
+		self.assertListEqual(list(it2fs.lower_membership_function()), [0.0, 0.5, 1.0])
+		self.assertListEqual(list(it2fs.higher_membership_function()), [0.0, 1.0, 1.0])
+
+		self.assertTrue(sgt2fs.z_slice(1.1).empty)
+
+	def test_embedded_type2_sets_count(self):
+		sgt2fs = SparseGeneralType2FuzzySet.from_array(self.primary_domain[:3], self.secondary_domain,
+														np.array(self.set_array)[:, :3])
+
+		self.assertEqual(sgt2fs.embedded_type2_sets_count(), 2 * 2 * 1)
+
+		# the count is an exact integer, even when it exceeds the float range
+		primary_domain = np.arange(400)
+		set_array = np.full((10, 400), 0.5)
+		sgt2fs = SparseGeneralType2FuzzySet.from_array(primary_domain, np.linspace(0, 1, 10), set_array)
+
+		self.assertEqual(sgt2fs.embedded_type2_sets_count(), 10 ** 400)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.type1_fuzzyset import Type1FuzzySet
+
+
+class TestIndexedType1FuzzySet(unittest.TestCase):
+
+	def setUp(self):
+		self.set_a = Type1FuzzySet(resolution=5)
+		self.set_a.set_values([0.0, 0.5, 1.0, 0.5, 0.0])
+
+		self.set_b = Type1FuzzySet(resolution=5)
+		self.set_b.set_values([1.0, 0.75, 0.25, 0.0, 0.0])
+
+	def test_set_values(self):
+		t1fs = Type1FuzzySet(resolution=3)
+		self.assertTrue(t1fs.empty)
+
+		t1fs.set_values(np.array([0.1, 0.2, 0.3]))
+		self.assertFalse(t1fs.empty)
+		self.assertEqual(t1fs[1], 0.2)
+
+		with self.assertRaises(Exception) : t1fs.set_values([0.1, 0.2])
+		with self.assertRaises(Exception) : t1fs.set_values([0.1, 0.2, 1.2])
+		with self.assertRaises(Exception) : t1fs.set_values([0.1, -0.2, 0.3])
+
+	def test_add_element(self):
+		t1fs = Type1FuzzySet(resolution=3)
+		t1fs.add_element(2, 0.4)
+
+		np.testing.assert_array_equal(t1fs.elements(), [0.0, 0.0, 0.4])
+
+		with self.assertRaises(Exception) : t1fs.add_element(3, 0.4)
+		with self.assertRaises(Exception) : t1fs.add_element(1, 1.4)
+
+	def test_union_intersection(self):
+		np.testing.assert_array_equal(self.set_a.union(self.set_b).elements(), [1.0, 0.75, 1.0, 0.5, 0.0])
+		np.testing.assert_array_equal(self.set_a.intersection(self.set_b).elements(), [0.0, 0.5, 0.25, 0.0, 0.0])
+
+		with self.assertRaises(Exception) : self.set_a.union(Type1FuzzySet(resolution=4))
+		with self.assertRaises(Exception) : self.set_a.intersection(Type1FuzzySet(resolution=4))
+
+	def test_negation(self):
+		np.testing.assert_array_equal(self.set_a.negation().elements(), [1.0, 0.5, 0.0, 0.5, 1.0])
+
+	def test_scale_clip(self):
+		np.testing.assert_array_equal(self.set_a.scale(0.5).elements(), [0.0, 0.25, 0.5, 0.25, 0.0])
+		np.testing.assert_array_equal(self.set_a.clip(0.5).elements(), [0.0, 0.5, 0.5, 0.5, 0.0])
+
+		with self.assertRaises(Exception) : self.set_a.scale(1.5)
+		with self.assertRaises(Exception) : self.set_a.clip(-0.5)
+
+	def test_alpha_cut(self):
+		cut = self.set_a.alpha_cut(0.5)
+		self.assertEqual(cut.left, 1)
+		self.assertEqual(cut.right, 3)
+
+		cut = self.set_a.alpha_cut(0)
+		self.assertEqual(cut.left, 1)
+		self.assertEqual(cut.right, 3)
+
+		self.assertTrue(self.set_a.alpha_cut(1.1).empty)
+
+	def test_join_meet(self):
+		np.testing.assert_array_equal(self.set_a.join(self.set_b).elements(), [0.0, 0.5, 1.0, 0.5, 0.0])
+		np.testing.assert_array_equal(self.set_a.meet(self.set_b).elements(), [1.0, 0.75, 0.25, 0.0, 0.0])
+
+		# sets of different sizes
+		set_c = Type1FuzzySet(resolution=4)
+		set_c.set_values([0.1, 1.0, 0.2, 0.0])
+		set_d = Type1FuzzySet(resolution=3)
+		set_d.set_values([0.5, 0.3, 0.9])
+
+		np.testing.assert_array_equal(set_c.join(set_d).elements(), [0.1, 0.5, 0.9, 0.0])
+		np.testing.assert_array_equal(set_c.meet(set_d).elements(), [0.5, 0.9, 0.2])
+
+	def test_equality(self):
+		t1fs = Type1FuzzySet(resolution=5)
+		t1fs.set_values(self.set_a.elements())
+
+		self.assertTrue(t1fs == self.set_a)
+		self.assertFalse(self.set_b == self.set_a)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import numpy as np
+from type2fuzzy.membership.generaltype2fuzzyset import GeneralType2FuzzySet
+from type2fuzzy.membership.sparsegeneraltype2fuzzyset import SparseGeneralType2FuzzySet
+from type2fuzzy.membership.zslicetype2fuzzyset import ZSliceType2FuzzySet
+from type2fuzzy.membership.densezslicetype2fuzzyset import DenseZSliceType2FuzzySet
+from type2fuzzy.membership.zslicing import z_slice_bounds, grid_z_slice_bounds, adaptive_z_levels
+
+class TestZSlicing(unittest.TestCase):
+
+	def setUp(self):
+		self.primary_domain = [1.0, 2.0, 3.0, 4.0]
+		self.secondary_domain = [0.0, 0.25, 0.5, 0.75, 1.0]
+		self.set_array = [[0.0, 0.0, 0.0, 0.0],
+						[0.2, 0.5, 0.0, 0.0],
+						[1.0, 1.0, 0.5, 0.0],
+						[0.5, 0.7, 0.6, 0.5],
+						[0.0, 0.2, 0.6, 1.0]]
+
+	def test_grid_z_slice_bounds(self):
+		bounds = grid_z_slice_bounds(self.secondary_domain, self.set_array, [0.0, 0.5, 0.7, 1.0])
+
+		self.assertEqual(bounds.shape, (4, 4, 2))
+		# a level of 0 includes the non-zero grades, other levels the grades reaching them
+		np.testing.assert_array_equal(bounds[0], [[0.25, 0.75], [0.25, 1.0], [0.5, 1.0], [0.75, 1.0]])
+		np.testing.assert_array_equal(bounds[1], [[0.5, 0.75], [0.25, 0.75], [0.5, 1.0], [0.75, 1.0]])
+		np.testing.assert_array_equal(bounds[2], [[0.5, 0.5], [0.5, 0.75], [np.nan, np.nan], [1.0, 1.0]])
+		np.testing.assert_array_equal(bounds[3], [[0.5, 0.5], [0.5, 0.5], [np.nan, np.nan], [1.0, 1.0]])
+
+	def test_z_slice_bounds(self):
+		# the second vertical slice has no points
+		bounds = z_slice_bounds([0, 2, 2, 5], [0.1, 0.2, 0.3, 0.4, 0.5], [0.4, 0.8, 0.3, 1.0, 0.3], [0.0, 0.8])
+
+		np.testing.assert_array_equal(bounds[0], [[0.1, 0.2], [np.nan, np.nan], [0.3, 0.5]])
+		np.testing.assert_array_equal(bounds[1], [[0.2, 0.2], [np.nan, np.nan], [0.4, 0.4]])
+
+		self.assertTrue(np.all(np.isnan(z_slice_bounds([0, 0], [], [], [0.5]))))
+
+	def test_same_as_alpha_cuts(self):
+		gt2fs = GeneralType2FuzzySet.from_array(self.primary_domain, self.secondary_domain, self.set_array)
+		sgt2fs = SparseGeneralType2FuzzySet.from_general_type2_set(gt2fs)
+		z_vals = np.linspace(0, 1, 11)
+
+		for fuzzy_set in [gt2fs, sgt2fs]:
+			primary_domain, bounds = fuzzy_set.z_slice_bounds(z_vals)
+			np.testing.assert_array_equal(primary_domain, self.primary_domain)
+
+			for z_idx, z_val in enumerate(z_vals):
+				for x_idx, primary_domain_val in enumerate(self.primary_domain):
+					cut = gt2fs[primary_domain_val].alpha_cut(z_val)
+					if cut.empty:
+						self.assertTrue(np.all(np.isnan(bounds[z_idx, x_idx])))
+					else:
+						np.testing.assert_array_equal(bounds[z_idx, x_idx], [cut.left, cut.right])
+
+	def test_z_slice(self):
+		gt2fs = GeneralType2FuzzySet.from_representation('''(0.20 / 0.00 + 1.00 / 0.50 + 0.40 / 1.00) / 1.00
+															+ (0.50 / 0.20) / 2.00 + (0.30 / 0.10 + 0.90 / 0.30) / 3.00''')
+
+		for slice_value in [0, 0.3, 0.5, 1.0]:
+			sliced_set = gt2fs.z_slice(slice_value)
+			for primary_domain_val in gt2fs.primary_domain():
+				cut = gt2fs[primary_domain_val].alpha_cut(slice_value)
+				if cut.empty:
+					with self.assertRaises(Exception) : sliced_set[primary_domain_val]
+				else:
+					self.assertEqual(sliced_set[primary_domain_val].left, cut.left)
+					self.assertEqual(sliced_set[primary_domain_val].right, cut.right)
+
+		np.testing.assert_array_equal(gt2fs.z_slice(0.5).primary_domain(), [1.00, 2.00, 3.00])
+		np.testing.assert_array_equal(gt2fs.z_slice(1.0).primary_domain(), [1.00])
+		self.assertTrue(GeneralType2FuzzySet().z_slice(0).empty)
+
+	def test_exact_levels(self):
+		gt2fs = GeneralType2FuzzySet.from_array(self.primary_domain, self.secondary_domain, self.set_array)
+		zt2fs = ZSliceType2FuzzySet.from_general_type2_set(gt2fs, levels='exact')
+
+		self.assertListEqual(zt2fs.zslices(), [0.2, 0.5, 0.6, 0.7, 1.0])
+		for z_val in zt2fs.zslices():
+			expected = gt2fs.z_slice(z_val)
+			np.testing.assert_array_equal(zt2fs[z_val].lower_membership_function(), expected.lower_membership_function())
+			np.testing.assert_array_equal(zt2fs[z_val].higher_membership_function(), expected.higher_membership_function())
+
+		sgt2fs = SparseGeneralType2FuzzySet.from_general_type2_set(gt2fs)
+		dzt2fs = DenseZSliceType2FuzzySet.from_general_type2_set(sgt2fs, levels='exact')
+		np.testing.assert_array_equal(dzt2fs.zslices(), zt2fs.zslices())
+
+		with self.assertRaises(Exception) : ZSliceType2FuzzySet.from_general_type2_set(gt2fs, 4, levels='random')
+		with self.assertRaises(Exception) : ZSliceType2FuzzySet.from_general_type2_set(gt2fs, levels='adaptive')
+		with self.assertRaises(Exception) : DenseZSliceType2FuzzySet.from_general_type2_set(gt2fs)
+
+	def test_adaptive_levels(self):
+		gt2fs = GeneralType2FuzzySet.from_array(self.primary_domain, self.secondary_domain, self.set_array)
+
+		# the highest level is always selected, then the level reducing the error most
+		zt2fs = ZSliceType2FuzzySet.from_general_type2_set(gt2fs, 1, levels='adaptive')
+		self.assertListEqual(zt2fs.zslices(), [0.5, 1.0])
+
+		# enough slices give the exact levels
+		zt2fs = ZSliceType2FuzzySet.from_general_type2_set(gt2fs, 10, levels='adaptive')
+		self.assertListEqual(zt2fs.zslices(), [0.2, 0.5, 0.6, 0.7, 1.0])
+
+		# no level is added once the selected levels are exact
+		z_vals = np.array([0.25, 0.5, 0.75, 1.0])
+		bounds = np.array([[[0.2, 0.8]], [[0.2, 0.8]], [[0.4, 0.6]], [[0.4, 0.6]]])
+		np.testing.assert_array_equal(adaptive_z_levels(z_vals, bounds, 3), [1, 3])
+		np.testing.assert_array_equal(adaptive_z_levels(z_vals, bounds, 1), [3])
+
+if __name__ == '__main__':
+	unittest.main()
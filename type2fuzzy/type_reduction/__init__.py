@@ -4,6 +4,9 @@ type2fuzzy.type_reduction
 Type-2 Fuzzy Set Type reducers<br/>
 Mendel-John.<br/>
 Karnik-Mendel.<br/>
+IASC and EIASC.<br/>
+Exhaustive switch point.<br/>
+Nie-Tan and Begian-Melek-Mendel.<br/>
 Hagras.<br/>
 Partial Centroid.<br/>
 '''
@@ -11,7 +14,13 @@ Partial Centroid.<br/>
 from type2fuzzy.type_reduction.gt2_mendeljohn_reducer import gt2_mendeljohn_reduce
 from type2fuzzy.type_reduction.gt2_partialcentroid_reducer import gt2_partialcentroid_reduce
 from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_kernikmendel_reduce
+from type2fuzzy.type_reduction.it2_iasc_reducer import it2_iasc_reduce, it2_eiasc_reduce
+from type2fuzzy.type_reduction.it2_exhaustive_reducer import it2_exhaustive_reduce
+from type2fuzzy.type_reduction.it2_closedform_reducer import it2_nietan_reduce, it2_bmm_reduce
+from type2fuzzy.type_reduction.it2_closedform_reducer import it2_nietan_reduce_batch, it2_bmm_reduce_batch
 from type2fuzzy.type_reduction.zslice_hagras_reducer import zslice_hagras_reduce
 
 __all__ = ['gt2_mendeljohn_reduce', 'gt2_partialcentroid_reduce',
-				'it2_kernikmendel_reduce', 'zslice_hagras_reduce']
+				'it2_kernikmendel_reduce', 'it2_iasc_reduce', 'it2_eiasc_reduce',
+				'it2_exhaustive_reduce', 'it2_nietan_reduce', 'it2_bmm_reduce',
+				'it2_nietan_reduce_batch', 'it2_bmm_reduce_batch', 'zslice_hagras_reduce']
@@ -12,7 +12,9 @@ def gt2_partialcentroid_reduce(gt2fs, precision=5, information='none'):
 
     Arguments:
     ----------
-    gt2fs -- the general type 2 fuzzy set
+    gt2fs -- the general type 2 fuzzy set, or an iterable of
+        (primary_domain_val, secondary membership function) pairs such as
+        GeneralType2FuzzySet.stream_file, processed one vertical slice at a time
     precision -- the precision applied when computing N/D and F
     information -- the amount of information given to the user;
         none - no information
@@ -24,6 +26,16 @@ def gt2_partialcentroid_reduce(gt2fs, precision=5, information='none'):
 
     return reduced_set
 
+def _vertical_slices(gt2fs):
+    '''
+    returns the (primary_domain_val, secondary membership function) pairs
+    of a general type-2 fuzzy set, other iterables are returned as they are
+    '''
+    if isinstance(gt2fs, GeneralType2FuzzySet):
+        return ((primary_domain, gt2fs[primary_domain]) for primary_domain in gt2fs.primary_domain())
+
+    return gt2fs
+
 def _gt2_partialcentroid_noinfo(gt2fs, precision=5):
     # previous partial centroid, C(k-1)
     # initialized so that values of n=1 can be included
@@ -35,8 +47,7 @@ def _gt2_partialcentroid_noinfo(gt2fs, precision=5):
     newDom = 0
 
     # get each vertical slice
-    for primary_domain in gt2fs.primary_domain():
-        vertical_slice = gt2fs[primary_domain]
+    for primary_domain, vertical_slice in _vertical_slices(gt2fs):
 
         # get each point in the vertical slice
         for secondary_domain, dom in vertical_slice.elements().items():
@@ -0,0 +1,208 @@
+'''
+Closed-form approximate type reduction of interval type-2 fuzzy sets
+
+The Nie-Tan and Begian-Melek-Mendel reducers replace the iterative
+search for the switch points of the centroid by a single weighted average
+of the lower and upper membership functions, in O(n) with no iterations.
+Nie-Tan takes the centroid of the average of the two membership functions,
+    y = sum x (L + U) / sum (L + U)
+and Begian-Melek-Mendel a weighted average of their centroids,
+    y = alpha sum x L / sum L + beta sum x U / sum U
+Both give a single value, an approximation of the mid point of the
+centroid found by it2_kernikmendel_reduce. The reducers return it as a
+CrispSet whose limits are equal, so that they can replace the interval
+reducers where only the defuzzified value is used. A set whose centroid
+cannot be found, because a weighted membership function is 0, reduces to
+an empty CrispSet, as in the batch reducers.
+
+Reference:
+----------
+M. Nie and W. W. Tan, "Towards an efficient type-reduction method for
+interval type-2 fuzzy logic systems," Proc. IEEE Int. Conf. Fuzzy Systems,
+pp. 1425–1432, 2008.
+
+M. Begian, W. Melek and J. M. Mendel, "Stability analysis of type-2 fuzzy
+systems," Proc. IEEE Int. Conf. Fuzzy Systems, pp. 947–953, 2008.
+'''
+import logging
+import numpy as np
+from type2fuzzy.membership.crispset import CrispSet
+from type2fuzzy.membership.crispsetarray import CrispSetArray
+
+
+def it2_nietan_reduce(it2fs, precision=5, information='none'):
+    '''
+    Reduces an interval type-2 fuzzy set by the Nie-Tan method
+
+    Arguments:
+    ----------
+    it2fs -- IntervalType2FuzzySet, the set to reduce
+    precision -- int, the number of decimal places of the value when
+                information is 'none'
+    information -- 'none' or 'full', the amount of information logged
+
+    Returns:
+    --------
+    centroid -- CrispSet, with both limits at the approximate centroid, empty
+                if the membership functions are 0
+    '''
+    primary_domain = np.asarray(it2fs.primary_domain(), dtype=float)
+    weights = np.asarray(it2fs.lower_membership_function(), dtype=float) + it2fs.higher_membership_function()
+
+    return _closed_form_centroid(
+        [(np.dot(primary_domain, weights), np.sum(weights), 1.0)], precision, information)
+
+
+def it2_bmm_reduce(it2fs, precision=5, information='none', alpha=0.5, beta=0.5):
+    '''
+    Reduces an interval type-2 fuzzy set by the Begian-Melek-Mendel method
+
+    Arguments:
+    ----------
+    it2fs -- IntervalType2FuzzySet, the set to reduce
+    precision -- int, the number of decimal places of the value when
+                information is 'none'
+    information -- 'none' or 'full', the amount of information logged
+    alpha -- float, the weight of the centroid of the lower membership function
+    beta -- float, the weight of the centroid of the upper membership function
+
+    Returns:
+    --------
+    centroid -- CrispSet, with both limits at the approximate centroid, empty
+                if a membership function is 0
+    '''
+    primary_domain = np.asarray(it2fs.primary_domain(), dtype=float)
+    lower_mf = np.asarray(it2fs.lower_membership_function(), dtype=float)
+    upper_mf = np.asarray(it2fs.higher_membership_function(), dtype=float)
+
+    return _closed_form_centroid(
+        [(np.dot(primary_domain, lower_mf), np.sum(lower_mf), alpha),
+            (np.dot(primary_domain, upper_mf), np.sum(upper_mf), beta)],
+        precision, information)
+
+
+def it2_nietan_reduce_batch(it2fss, precision=5):
+    '''
+    Reduces a batch of interval type-2 fuzzy sets by the Nie-Tan method,
+    the sums of all the sets being found at once
+
+    Arguments:
+    ----------
+    it2fss -- list of IntervalType2FuzzySet, the sets to reduce, that may
+                have different primary domains
+    precision -- int, the number of decimal places of the values
+
+    Returns:
+    --------
+    centroids -- CrispSetArray, with both limits at the approximate centroid
+                of every set, empty for the sets whose membership functions are 0
+    '''
+    primary_domain, lower_mf, upper_mf, starts = _concatenate_sets(it2fss)
+    weights = lower_mf + upper_mf
+
+    return _closed_form_centroid_batch(
+        [(_segment_sums(primary_domain * weights, starts), _segment_sums(weights, starts), 1.0)],
+        len(it2fss), precision)
+
+
+def it2_bmm_reduce_batch(it2fss, precision=5, alpha=0.5, beta=0.5):
+    '''
+    Reduces a batch of interval type-2 fuzzy sets by the Begian-Melek-Mendel
+    method, the sums of all the sets being found at once
+
+    Arguments:
+    ----------
+    it2fss -- list of IntervalType2FuzzySet, the sets to reduce, that may
+                have different primary domains
+    precision -- int, the number of decimal places of the values
+    alpha -- float, the weight of the centroids of the lower membership functions
+    beta -- float, the weight of the centroids of the upper membership functions
+
+    Returns:
+    --------
+    centroids -- CrispSetArray, with both limits at the approximate centroid
+                of every set, empty for the sets with a membership function of 0
+    '''
+    primary_domain, lower_mf, upper_mf, starts = _concatenate_sets(it2fss)
+
+    return _closed_form_centroid_batch(
+        [(_segment_sums(primary_domain * lower_mf, starts), _segment_sums(lower_mf, starts), alpha),
+            (_segment_sums(primary_domain * upper_mf, starts), _segment_sums(upper_mf, starts), beta)],
+        len(it2fss), precision)
+
+
+def _closed_form_centroid(weighted_sums, precision, information):
+    '''
+    Returns the CrispSet of the weighted average of the centroids given by
+    the (numerator, denominator, weight) triples of weighted_sums, empty if
+    a denominator is 0
+    '''
+    if any(denominator == 0 for _, denominator, _ in weighted_sums):
+        logging.log(logging.ERROR, 'error in calculating the centroid, denominator is 0')
+        return CrispSet()
+
+    centroid = float(sum(weight * numerator / denominator for numerator, denominator, weight in weighted_sums))
+
+    if information == 'full':
+        for numerator, denominator, weight in weighted_sums:
+            logging.log(
+                logging.DEBUG,
+                'numerator: %s, denominator: %s, weight: %s',
+                numerator,
+                denominator,
+                weight)
+        logging.log(logging.DEBUG, 'centroid: %s', centroid)
+
+        return CrispSet(centroid, centroid)
+
+    centroid = round(centroid, precision)
+    return CrispSet(centroid, centroid)
+
+
+def _closed_form_centroid_batch(weighted_sums, set_count, precision):
+    '''
+    Returns the CrispSetArray of the weighted averages of the centroids given
+    by the (numerators, denominators, weight) triples of weighted_sums,
+    a set with a zero denominator being empty
+    '''
+    centroids = np.zeros(set_count)
+    defined = np.ones(set_count, dtype=bool)
+
+    for numerators, denominators, weight in weighted_sums:
+        defined &= denominators != 0
+        centroids += weight * numerators / np.where(defined, denominators, 1)
+
+    centroids = np.where(defined, np.round(centroids, precision), np.nan)
+    return CrispSetArray(centroids, centroids)
+
+
+def _concatenate_sets(it2fss):
+    '''
+    Returns the primary domains and membership functions of all the sets
+    concatenated, and the position of the first domain value of every set
+    '''
+    primary_domains = [it2fs.primary_domain() for it2fs in it2fss]
+    starts = np.zeros(len(it2fss), dtype=np.intp)
+    starts[1:] = np.cumsum([len(primary_domain) for primary_domain in primary_domains[:-1]])
+
+    def concatenate(arrays):
+        return np.concatenate(arrays).astype(float, copy=False) if arrays else np.empty(0)
+
+    return (concatenate(primary_domains),
+            concatenate([it2fs.lower_membership_function() for it2fs in it2fss]),
+            concatenate([it2fs.higher_membership_function() for it2fs in it2fss]),
+            starts)
+
+
+def _segment_sums(values, starts):
+    '''
+    Returns the sums of the segments of values starting at starts, each
+    segment ending at the start of the next one, an empty segment summing to 0
+    '''
+    sums = np.zeros(len(starts))
+    nonempty = np.diff(np.append(starts, len(values))) > 0
+
+    if np.any(nonempty):
+        sums[nonempty] = np.add.reduceat(values, starts[nonempty])
+
+    return sums
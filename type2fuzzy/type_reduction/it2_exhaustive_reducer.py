@@ -0,0 +1,113 @@
+'''
+Exhaustive switch point centroid of interval type-2 fuzzy sets
+
+With the first k domain values weighted by the upper membership function
+and the others by the lower one, the left limit of the centroid is
+    (sum x L + sum_{i<k} x_i (U_i - L_i)) / (sum L + sum_{i<k} (U_i - L_i))
+and the right limit swaps the two functions, adding the terms of U - L
+of the domain values from k on. The limits of all the n+1 switch points
+are found at once from prefix and suffix sums of x (U - L) and U - L, and
+the centroid is their minimum and maximum, in O(n) with no iterations,
+so that the run time does not depend on the set.
+The suffix sums are accumulated from the right instead of being
+subtracted from the totals, all the sums adding non-negative terms, so
+that a denominator is exactly 0 only when no domain value is weighted.
+
+Reference:
+----------
+N. N. Karnik and J. M. Mendel, "Centroid of a type-2 fuzzy set,"
+Information Sciences, vol. 132, pp. 195–220, 2001.
+'''
+import logging
+import numpy as np
+from type2fuzzy.membership.crispset import CrispSet
+
+
+def it2_exhaustive_reduce(it2fs, precision=5, information='none'):
+    '''
+    Reduces an interval type-2 fuzzy set to the interval of its centroid
+    by evaluating all the switch points
+
+    Arguments:
+    ----------
+    it2fs -- IntervalType2FuzzySet, the set to reduce
+    precision -- int, the number of decimal places of the centroid when
+                information is 'none'
+    information -- 'none' or 'full', the amount of information logged
+
+    Returns:
+    --------
+    centroid -- CrispSet
+    '''
+    reduced_set = None
+
+    centroid_left, centroid_right, switch_points = it2_exhaustive_centroid(
+        it2fs.primary_domain(), it2fs.lower_membership_function(), it2fs.higher_membership_function())
+
+    if information == 'none':
+        reduced_set = CrispSet(round(centroid_left, precision), round(centroid_right, precision))
+    elif information == 'full':
+        logging.log(logging.DEBUG, 'left switch point: %s, centroid left: %s', switch_points[0], centroid_left)
+        logging.log(logging.DEBUG, 'right switch point: %s, centroid right: %s', switch_points[1], centroid_right)
+        reduced_set = CrispSet(centroid_left, centroid_right)
+
+    return reduced_set
+
+
+def it2_exhaustive_centroid(primary_domain, lower_mf, upper_mf):
+    '''
+    Finds the centroid of an interval type-2 fuzzy set from the limits of
+    all its switch points
+
+    Arguments:
+    ----------
+    primary_domain -- 1D array, the sorted primary domain values
+    lower_mf -- 1D array, the lower membership function
+    upper_mf -- 1D array, the upper membership function
+
+    Returns:
+    --------
+    centroid_left -- float, the left limit of the centroid
+    centroid_right -- float, the right limit of the centroid
+    switch_points -- (int, int), the number of domain values weighted by the
+                upper membership function for the left limit, and by the
+                lower one for the right limit
+    '''
+    primary_domain = np.asarray(primary_domain, dtype=float)
+    lower_mf = np.asarray(lower_mf, dtype=float)
+    upper_mf = np.asarray(upper_mf, dtype=float)
+    domain_size = len(primary_domain)
+
+    # the terms x (U - L) and U - L, from the left and from the right, after
+    # a leading 0, accumulated in place so that element k of the rows holds
+    # the sum over the first k domain values, or over the last k
+    sums = np.empty((4, domain_size + 1))
+    sums[:, 0] = 0.0
+    np.subtract(upper_mf, lower_mf, out=sums[1, 1:])
+    np.multiply(primary_domain, sums[1, 1:], out=sums[0, 1:])
+    sums[2:, 1:] = sums[:2, :0:-1]
+    np.cumsum(sums, axis=1, out=sums)
+
+    sums[0::2] += np.dot(primary_domain, lower_mf)
+    sums[1::2] += np.sum(lower_mf)
+
+    centroids = []
+    switch_points = []
+    # the right limit of switch point k adds the last domain_size - k values
+    for numerators, denominators, best, missing in [
+            (sums[0], sums[1], np.argmin, np.inf),
+            (sums[2, ::-1], sums[3, ::-1], np.argmax, -np.inf)]:
+        # switch points without any weighted domain value are never chosen
+        limits = np.full(domain_size + 1, missing)
+        np.divide(numerators, denominators, out=limits, where=denominators > 0)
+        switch_point = int(best(limits))
+
+        if limits[switch_point] == missing:
+            logging.log(logging.ERROR, 'error in calculating the centroid, upper membership function is 0')
+            mid_domain_element = float(primary_domain[domain_size // 2]) if domain_size else 0.0
+            return mid_domain_element, mid_domain_element, (0, 0)
+
+        centroids.append(float(limits[switch_point]))
+        switch_points.append(switch_point)
+
+    return centroids[0], centroids[1], tuple(switch_points)
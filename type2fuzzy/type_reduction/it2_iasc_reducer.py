@@ -0,0 +1,272 @@
+'''
+Iterative algorithms with stop condition (IASC and EIASC) for the centroid
+of interval type-2 fuzzy sets
+
+With the first k domain values weighted by the upper membership function
+and the others by the lower one, the left limit of the centroid decreases
+with k while the next domain value is below it, and increases afterwards.
+Both algorithms start from the lower membership function and move the
+domain values to the upper one one at a time, updating the numerator and
+denominator in O(1), until the limit stops improving. They need no sorting
+of the switch points and no search, so that on small domains they are
+faster than Karnik-Mendel, whose iterations each cost O(n).
+
+IASC finds the right limit by moving the domain values from the upper to
+the lower membership function from the left, and stops when the limit no
+longer improves. EIASC finds the right limit from the right end, like the
+left limit, and stops as soon as the next domain value is on the wrong
+side of the limit, an additional division being saved.
+
+Reference:
+----------
+K. Duran, H. Bernal and M. Melgarejo, "Improved iterative algorithm for
+computing the generalized centroid of an interval type-2 fuzzy set,"
+Proc. NAFIPS, pp. 1–5, 2008.
+
+D. Wu and M. Nie, "Comparison and practical implementation of
+type-reduction algorithms for type-2 fuzzy sets and systems,"
+Proc. IEEE Int. Conf. Fuzzy Systems, pp. 2131–2138, 2011.
+'''
+import logging
+import numpy as np
+from type2fuzzy.membership.crispset import CrispSet
+
+
+def it2_iasc_reduce(it2fs, precision=5, information='none'):
+    '''
+    Reduces an interval type-2 fuzzy set to the interval of its centroid
+    by the iterative algorithm with stop condition
+
+    Arguments:
+    ----------
+    it2fs -- IntervalType2FuzzySet, the set to reduce
+    precision -- int, the number of decimal places of the centroid when
+                information is 'none'
+    information -- 'none' or 'full', the amount of information logged
+
+    Returns:
+    --------
+    centroid -- CrispSet
+    '''
+    return _it2_stop_condition_reduce(it2_iasc_centroid, it2fs, precision, information)
+
+
+def it2_eiasc_reduce(it2fs, precision=5, information='none'):
+    '''
+    Reduces an interval type-2 fuzzy set to the interval of its centroid
+    by the enhanced iterative algorithm with stop condition
+
+    Arguments:
+    ----------
+    it2fs -- IntervalType2FuzzySet, the set to reduce
+    precision -- int, the number of decimal places of the centroid when
+                information is 'none'
+    information -- 'none' or 'full', the amount of information logged
+
+    Returns:
+    --------
+    centroid -- CrispSet
+    '''
+    return _it2_stop_condition_reduce(it2_eiasc_centroid, it2fs, precision, information)
+
+
+def it2_iasc_centroid(primary_domain, lower_mf, upper_mf, log=False):
+    '''
+    Finds the centroid of an interval type-2 fuzzy set by IASC
+
+    Arguments:
+    ----------
+    primary_domain -- 1D array, the sorted primary domain values
+    lower_mf -- 1D array, the lower membership function
+    upper_mf -- 1D array, the upper membership function
+    log -- bool, whether every iteration is logged
+
+    Returns:
+    --------
+    centroid_left -- float, the left limit of the centroid
+    centroid_right -- float, the right limit of the centroid
+    iterations -- (int, int), the number of iterations for the left and right limits
+    '''
+    primary_domain, lower_mf, upper_mf, numerator, denominator = _initial_sums(
+        primary_domain, lower_mf, upper_mf)
+
+    if denominator[1] == 0:
+        return _zero_centroid(primary_domain)
+
+    # the right limit is never below the last domain value with a positive upper
+    # membership, that is not moved so that the denominator cannot cancel out
+    last_upper = len(upper_mf) - 1 - next(idx for idx, upper in enumerate(reversed(upper_mf)) if upper > 0)
+
+    centroid_left, iterations_left = _iasc_limit(
+        primary_domain, lower_mf, upper_mf, numerator[0], denominator[0], left=True, log=log)
+    centroid_right, iterations_right = _iasc_limit(
+        primary_domain[:last_upper], lower_mf, upper_mf, numerator[1], denominator[1], left=False, log=log)
+
+    return centroid_left, centroid_right, (iterations_left, iterations_right)
+
+
+def it2_eiasc_centroid(primary_domain, lower_mf, upper_mf, log=False):
+    '''
+    Finds the centroid of an interval type-2 fuzzy set by EIASC
+
+    Arguments:
+    ----------
+    primary_domain -- 1D array, the sorted primary domain values
+    lower_mf -- 1D array, the lower membership function
+    upper_mf -- 1D array, the upper membership function
+    log -- bool, whether every iteration is logged
+
+    Returns:
+    --------
+    centroid_left -- float, the left limit of the centroid
+    centroid_right -- float, the right limit of the centroid
+    iterations -- (int, int), the number of iterations for the left and right limits
+    '''
+    primary_domain, lower_mf, upper_mf, numerator, denominator = _initial_sums(
+        primary_domain, lower_mf, upper_mf)
+
+    if denominator[1] == 0:
+        return _zero_centroid(primary_domain)
+
+    centroid_left, iterations_left = _eiasc_limit(
+        primary_domain, lower_mf, upper_mf, numerator[0], denominator[0], left=True, log=log)
+    centroid_right, iterations_right = _eiasc_limit(
+        primary_domain, lower_mf, upper_mf, numerator[0], denominator[0], left=False, log=log)
+
+    return centroid_left, centroid_right, (iterations_left, iterations_right)
+
+
+def _initial_sums(primary_domain, lower_mf, upper_mf):
+    '''
+    Returns the domain and membership functions as lists, for scalar
+    iterations, and the numerators and denominators of the centroids of the
+    lower and upper membership functions
+    '''
+    primary_domain = np.asarray(primary_domain, dtype=float)
+    lower_mf = np.asarray(lower_mf, dtype=float)
+    upper_mf = np.asarray(upper_mf, dtype=float)
+
+    numerator = (float(np.dot(primary_domain, lower_mf)), float(np.dot(primary_domain, upper_mf)))
+    denominator = (float(np.sum(lower_mf)), float(np.sum(upper_mf)))
+
+    return primary_domain.tolist(), lower_mf.tolist(), upper_mf.tolist(), numerator, denominator
+
+
+def _zero_centroid(primary_domain):
+    '''
+    Returns the middle domain element as both limits of the centroid of a set
+    whose upper membership function is 0, as it2_kernikmendel_reduce does
+    '''
+    logging.log(logging.ERROR, 'error in calculating the centroid, upper membership function is 0')
+    mid_domain_element = primary_domain[len(primary_domain) // 2] if primary_domain else 0.0
+
+    return mid_domain_element, mid_domain_element, (0, 0)
+
+
+def _log_iteration(switch_point, numerator, denominator, centroid):
+    logging.log(
+        logging.DEBUG,
+        'switch point: %s, numerator: %s, denominator: %s, centroid: %s',
+        switch_point,
+        numerator,
+        denominator,
+        centroid)
+
+
+def _iasc_limit(primary_domain, lower_mf, upper_mf, numerator, denominator, left, log=False):
+    '''
+    Runs the IASC iterations for a limit of the centroid. The left limit
+    starts from the lower membership function and the right limit from the
+    upper one, the domain values being moved to the other function from the
+    left until the limit does not improve. A limit that does not change goes
+    on, so that domain values without uncertainty do not stop the iterations
+
+    Returns:
+    --------
+    centroid -- float, the limit of the centroid
+    iterations -- int, the number of iterations
+    '''
+    # moving a domain value adds its terms of U - L to the left limit and
+    # removes them from the right one
+    sign = 1 if left else -1
+    centroid = numerator / denominator if denominator > 0 else np.inf
+
+    for switch_point, (domain_val, lower, upper) in enumerate(zip(primary_domain, lower_mf, upper_mf)):
+        numerator += sign * domain_val * (upper - lower)
+        denominator += sign * (upper - lower)
+
+        if denominator <= 0:
+            continue
+
+        next_centroid = numerator / denominator
+
+        if log:
+            _log_iteration(switch_point + 1, numerator, denominator, next_centroid)
+
+        if (next_centroid > centroid) if left else (next_centroid < centroid):
+            return centroid, switch_point + 1
+
+        centroid = next_centroid
+
+    return centroid, len(primary_domain)
+
+
+def _eiasc_limit(primary_domain, lower_mf, upper_mf, numerator, denominator, left, log=False):
+    '''
+    Runs the EIASC iterations for a limit of the centroid, both limits
+    starting from the lower membership function. The left limit moves the
+    domain values to the upper membership function from the left while they
+    are below it, the right limit from the right while they are above it
+
+    Returns:
+    --------
+    centroid -- float, the limit of the centroid
+    iterations -- int, the number of iterations
+    '''
+    if denominator > 0:
+        centroid = numerator / denominator
+    else:
+        centroid = np.inf if left else -np.inf
+
+    switch_points = range(len(primary_domain)) if left else range(len(primary_domain) - 1, -1, -1)
+    iterations = 0
+
+    for switch_point in switch_points:
+        domain_val = primary_domain[switch_point]
+
+        if (domain_val >= centroid) if left else (domain_val <= centroid):
+            break
+
+        numerator += domain_val * (upper_mf[switch_point] - lower_mf[switch_point])
+        denominator += upper_mf[switch_point] - lower_mf[switch_point]
+        iterations += 1
+
+        if denominator > 0:
+            centroid = numerator / denominator
+
+        if log:
+            _log_iteration(switch_point, numerator, denominator, centroid)
+
+    return centroid, iterations
+
+
+def _it2_stop_condition_reduce(centroid_function, it2fs, precision, information):
+    reduced_set = None
+
+    if information == 'none':
+        centroid_left, centroid_right, _ = centroid_function(
+            it2fs.primary_domain(), it2fs.lower_membership_function(), it2fs.higher_membership_function())
+        reduced_set = CrispSet(round(centroid_left, precision), round(centroid_right, precision))
+
+    elif information == 'full':
+        logging.log(logging.INFO, 'starting iterations...')
+
+        centroid_left, centroid_right, iterations = centroid_function(
+            it2fs.primary_domain(), it2fs.lower_membership_function(), it2fs.higher_membership_function(),
+            log=True)
+        logging.log(logging.DEBUG, 'centroid left converged in %s iterations', iterations[0])
+        logging.log(logging.DEBUG, 'centroid right converged in %s iterations', iterations[1])
+
+        reduced_set = CrispSet(centroid_left, centroid_right)
+
+    return reduced_set
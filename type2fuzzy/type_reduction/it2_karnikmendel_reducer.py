@@ -1,110 +1,346 @@
 import logging
+import numpy as np
 from type2fuzzy.membership.crispset import CrispSet
 from type2fuzzy.membership.intervaltype2fuzzyset import IntervalType2FuzzySet
 
 
-def it2_kernikmendel_reduce(it2fs, precision=5, information='none'):
-    reduced_set = None
+IT2_ALGORITHMS = ('km', 'ekm')
 
-    if information == 'none':
-        reduced_set = _it2_kernikmendel_reduce_noinfo(it2fs, precision)
-    elif information == 'full':
-        reduced_set = _it2_kernikmendel_reduce_fullinfo(it2fs, precision)
 
-    return reduced_set
+def it2_kernikmendel_reduce(it2fs, precision=5, information='none', algorithm='km'):
+    '''
+    Reduces an interval type-2 fuzzy set to the interval of its centroid
 
-def _it2_kernikmendel_reduce_noinfo(it2fs, precision=5):
+    Arguments:
+    ----------
+    it2fs -- IntervalType2FuzzySet, the set to reduce
+    precision -- int, the number of decimal places of the centroid when
+                information is 'none'
+    information -- 'none' or 'full', the amount of information logged
+    algorithm -- 'km', the Karnik-Mendel algorithm started from the middle
+                domain element, see it2_kernikmendel_centroid, or 'ekm', the
+                enhanced Karnik-Mendel algorithm, see it2_enhanced_kernikmendel_centroid
 
-    numerator = 0
-    denominator = 0
-    error_threshold = 1e-5
-    counter = 0
-    primary_domain_elements = it2fs.primary_domain()
+    Returns:
+    --------
+    centroid -- CrispSet
 
-    centroid = CrispSet(
-        primary_domain_elements[0],
-        primary_domain_elements[len(primary_domain_elements)-1])
+    Raises:
+    -------
+    ValueError -- if the algorithm is unknown
+    '''
+    if algorithm not in IT2_ALGORITHMS:
+        raise ValueError(f'Unknown algorithm {algorithm}, expected one of {IT2_ALGORITHMS}')
 
-    centroid_left = it2fs.mid_domain_element()
-    while True:
-
-        centroid.left = centroid_left
-        numerator = 0
-        denominator = 0
+    reduced_set = None
 
-        for domain_element in it2fs.primary_domain():
+    if information == 'none':
+        reduced_set = _it2_kernikmendel_reduce_noinfo(it2fs, precision, algorithm)
+    elif information == 'full':
+        reduced_set = _it2_kernikmendel_reduce_fullinfo(it2fs, precision, algorithm)
 
-            if domain_element >= centroid_left:
-                numerator = numerator + (domain_element * it2fs[domain_element].left)
-                denominator = denominator + it2fs[domain_element].left
-            else:
-                numerator = numerator + (domain_element * it2fs[domain_element].right)
-                denominator = denominator + it2fs[domain_element].right
+    return reduced_set
 
+def it2_kernikmendel_centroid(primary_domain, lower_mf, upper_mf):
+    '''
+    Finds the centroid of an interval type-2 fuzzy set by the Karnik-Mendel
+    algorithm, working on the switch points. With the first k domain values
+    weighted by the upper membership function and the others by the lower
+    one, the left limit is
+        (sum_{i<k} x_i U_i + sum_{i>=k} x_i L_i) / (sum_{i<k} U_i + sum_{i>=k} L_i)
+    and is found in O(1) from prefix sums of x L, L, x U and U; the right limit
+    swaps the two functions. The switch point of every iteration is found by
+    binary search, and the iterations stop when the switch point is repeated,
+    which the monotone convergence of Karnik-Mendel guarantees in at most n
+    iterations, giving the exact centroid
+
+    Reference:
+    ----------
+    N. N. Karnik and J. M. Mendel, "Centroid of a type-2 fuzzy set,"
+    Information Sciences, vol. 132, pp. 195–220, 2001.
+
+    Arguments:
+    ----------
+    primary_domain -- 1D array, the sorted primary domain values
+    lower_mf -- 1D array, the lower membership function
+    upper_mf -- 1D array, the upper membership function
+
+    Returns:
+    --------
+    centroid_left -- float, the left limit of the centroid
+    centroid_right -- float, the right limit of the centroid
+    iterations -- (int, int), the number of iterations for the left and right limits
+    '''
+    primary_domain = np.asarray(primary_domain, dtype=float)
+    prefix_sums = _prefix_sums(primary_domain, lower_mf, upper_mf)
+    mid_domain_element = primary_domain[len(primary_domain) // 2]
+
+    centroid_left, iterations_left = _kernikmendel_limit(
+        primary_domain, prefix_sums, mid_domain_element, left=True)
+    centroid_right, iterations_right = _kernikmendel_limit(
+        primary_domain, prefix_sums, mid_domain_element, left=False)
+
+    return centroid_left, centroid_right, (iterations_left, iterations_right)
+
+
+def it2_enhanced_kernikmendel_centroid(primary_domain, lower_mf, upper_mf):
+    '''
+    Finds the centroid of an interval type-2 fuzzy set by the enhanced
+    Karnik-Mendel algorithm. The switch points start at round(n/2.4) for the
+    left limit and round(n/1.7) for the right limit, closer to the final ones
+    than the middle of the domain, and the numerator and denominator are
+    computed once over the whole domain. Moving the switch point then only
+    changes the terms of the domain values it passes, so that every iteration
+    updates the sums in O(|k' - k|) instead of O(n)
+
+    Reference:
+    ----------
+    D. Wu and J. M. Mendel, "Enhanced Karnik-Mendel algorithms," IEEE Trans.
+    Fuzzy Systems, vol. 17, no. 4, pp. 923–934, 2009.
+
+    Arguments:
+    ----------
+    primary_domain -- 1D array, the sorted primary domain values
+    lower_mf -- 1D array, the lower membership function
+    upper_mf -- 1D array, the upper membership function
+
+    Returns:
+    --------
+    centroid_left -- float, the left limit of the centroid
+    centroid_right -- float, the right limit of the centroid
+    iterations -- (int, int), the number of iterations for the left and right limits
+    '''
+    primary_domain = np.asarray(primary_domain, dtype=float)
+    lower_mf = np.asarray(lower_mf, dtype=float)
+    upper_mf = np.asarray(upper_mf, dtype=float)
+
+    centroid_left, iterations_left = _enhanced_kernikmendel_limit(
+        primary_domain, lower_mf, upper_mf, left=True)
+    centroid_right, iterations_right = _enhanced_kernikmendel_limit(
+        primary_domain, lower_mf, upper_mf, left=False)
+
+    return centroid_left, centroid_right, (iterations_left, iterations_right)
+
+
+def _enhanced_switch_points(domain_size):
+    '''
+    Returns the initial switch points of the enhanced Karnik-Mendel algorithm,
+    the number of domain values weighted by the upper membership function for
+    the left limit, and by the lower one for the right limit, for a domain
+    size given as an int or an int array
+    '''
+    return np.round(domain_size / 2.4).astype(int), np.round(domain_size / 1.7).astype(int)
+
+
+def _enhanced_kernikmendel_limit(primary_domain, lower_mf, upper_mf, left, log=False):
+    '''
+    Runs the enhanced Karnik-Mendel iterations for the left or right limit of
+    the centroid, the switch points following the same convention as
+    _kernikmendel_limit
+
+    Returns:
+    --------
+    centroid -- float, the limit of the centroid
+    iterations -- int, the number of iterations
+    '''
+    side = 'left' if left else 'right'
+    switch_point = _enhanced_switch_points(len(primary_domain))[0 if left else 1]
+
+    # the first switch_point values take the first weights, the others the second ones
+    first_mf, second_mf = (upper_mf, lower_mf) if left else (lower_mf, upper_mf)
+    numerator, denominator = _weighted_sums(primary_domain, first_mf, second_mf, switch_point)
+
+    # without any weighted domain value at the start, the iterations start from
+    # the upper membership function of every value, 0 only if the set is empty
+    if denominator == 0:
+        switch_point = len(primary_domain) if left else 0
+        numerator, denominator = _weighted_sums(primary_domain, first_mf, second_mf, switch_point)
+
+    # a denominator updated down to a rounding residue of its terms is summed again,
+    # so that it is exactly 0 when no domain value is weighted
+    residue = len(primary_domain) * np.finfo(float).eps * np.sum(upper_mf)
+
+    # raising the switch point moves values from the second weights to the first
+    difference = first_mf - second_mf
+    previous = np.inf if left else -np.inf
+
+    for iterations in range(1, len(primary_domain) + 2):
+        # a switch point without any weighted domain value does not improve the limit
         if denominator == 0:
-            centroid.left = it2fs.mid_domain_element()
+            if np.isfinite(previous):
+                return float(previous), iterations
             logging.log(logging.ERROR, 'error in calculating z_l, denominator is 0')
-            break
-
-        centroid_left = numerator / denominator
-
-        if abs(centroid_left - centroid.left) <= error_threshold:
-            break
-
-        if counter == 15:
-            break
-
-        counter = counter + 1
+            return float(primary_domain[len(primary_domain) // 2]), iterations
+
+        centroid = numerator / denominator
+
+        if log:
+            logging.log(
+                logging.DEBUG,
+                'switch point: %s, numerator: %s, denominator: %s, centroid: %s',
+                switch_point,
+                numerator,
+                denominator,
+                centroid)
+
+        if not _improves(centroid, previous, left):
+            return float(previous), iterations
+        previous = centroid
+
+        next_switch_point = int(np.searchsorted(primary_domain, centroid, side=side))
+
+        if next_switch_point == switch_point:
+            return float(centroid), iterations
+
+        low, high = sorted((switch_point, next_switch_point))
+        sign = 1 if next_switch_point > switch_point else -1
+        numerator += sign * np.dot(primary_domain[low:high], difference[low:high])
+        denominator += sign * np.sum(difference[low:high])
+
+        switch_point = next_switch_point
+
+        if denominator <= residue:
+            numerator, denominator = _weighted_sums(primary_domain, first_mf, second_mf, switch_point)
+
+    logging.log(logging.ERROR, 'cannot converge...')
+    return float(centroid), iterations
+
+
+def _weighted_sums(primary_domain, first_mf, second_mf, switch_point):
+    '''
+    Returns the numerator and denominator of a limit of the centroid, the
+    first switch_point domain values being weighted by first_mf and the
+    others by second_mf
+    '''
+    return (np.dot(primary_domain[:switch_point], first_mf[:switch_point])
+                + np.dot(primary_domain[switch_point:], second_mf[switch_point:]),
+            np.sum(first_mf[:switch_point]) + np.sum(second_mf[switch_point:]))
+
+
+def _prefix_sums(primary_domain, lower_mf, upper_mf):
+    '''
+    Returns the sums of x L and L over the whole domain and the prefix sums
+    of x (U - L) and U - L, with a leading 0 so that element k holds the sum
+    of the first k terms. Moving a domain value from the lower to the upper
+    membership function adds its terms of U - L, so that these two prefix
+    sums give the numerator and denominator at every switch point
+    '''
+    lower_mf = np.asarray(lower_mf, dtype=float)
+
+    # both prefix sums are accumulated in place in the rows of a single buffer
+    sums = np.empty((2, len(primary_domain) + 1))
+    sums[:, 0] = 0.0
+    np.subtract(upper_mf, lower_mf, out=sums[1, 1:])
+    np.multiply(primary_domain, sums[1, 1:], out=sums[0, 1:])
+    np.cumsum(sums, axis=1, out=sums)
+
+    return np.dot(primary_domain, lower_mf), np.sum(lower_mf), sums[0], sums[1]
+
+
+def _switch_point_sums(prefix_sums, switch_point, left, end=-1):
+    '''
+    Returns the numerator and denominator of a limit of the centroid for the
+    given switch point, the number of domain values weighted by the upper
+    membership function for the left limit, by the lower one for the right limit.
+    switch_point and end index the prefix sums, end at their last element
+    '''
+    x_lower, lower, x_difference, difference = prefix_sums
+
+    if left:
+        return (x_lower + x_difference[switch_point],
+                lower + difference[switch_point])
+
+    return (x_lower + x_difference[end] - x_difference[switch_point],
+            lower + difference[end] - difference[switch_point])
+
+
+def _improves(centroid, previous, left):
+    '''
+    Returns whether an iteration lowers the left limit or raises the right one.
+    The limits of the iterations are monotone, but when a limit falls on a
+    domain value rounding may make the switch points alternate around it, and
+    the iterations stop at the first one that does not improve the limit
+    '''
+    return centroid < previous if left else centroid > previous
+
+
+def _kernikmendel_limit(primary_domain, prefix_sums, start, left, log=False):
+    '''
+    Runs the Karnik-Mendel iterations for the left or right limit of the
+    centroid, starting from the domain value start.
+    As in the previous implementation, the domain values below the left limit,
+    or up to the right limit, are weighted by the upper membership function
+
+    Returns:
+    --------
+    centroid -- float, the limit of the centroid
+    iterations -- int, the number of iterations
+    '''
+    side = 'left' if left else 'right'
+    switch_point = int(np.searchsorted(primary_domain, start, side=side))
+
+    # without any weighted domain value at the start, the iterations start from
+    # the upper membership function of every value, 0 only if the set is empty
+    if _switch_point_sums(prefix_sums, switch_point, left)[1] == 0:
+        switch_point = len(primary_domain) if left else 0
+
+    previous = np.inf if left else -np.inf
+
+    # the sequence of switch points is monotone, so that it repeats within n+1 iterations
+    for iterations in range(1, len(primary_domain) + 2):
+        numerator, denominator = _switch_point_sums(prefix_sums, switch_point, left)
+
+        # a switch point without any weighted domain value does not improve the limit
+        if denominator == 0:
+            if np.isfinite(previous):
+                return float(previous), iterations
+            logging.log(logging.ERROR, 'error in calculating z_l, denominator is 0')
+            return float(start), iterations
 
-    counter = 0
-    centroid_right = it2fs.mid_domain_element()
+        centroid = numerator / denominator
 
-    while True:
+        if log:
+            logging.log(
+                logging.DEBUG,
+                'numerator: %s, denominator: %s, centroid: %s',
+                numerator,
+                denominator,
+                centroid)
 
-        centroid.right = centroid_right
-        numerator = 0
-        denominator = 0
+        if not _improves(centroid, previous, left):
+            return float(previous), iterations
+        previous = centroid
 
-        for domain_element in it2fs.primary_domain():
+        next_switch_point = int(np.searchsorted(primary_domain, centroid, side=side))
 
-            if domain_element <= centroid_right:
-                numerator = numerator + (domain_element * it2fs[domain_element].left)
-                denominator = denominator + it2fs[domain_element].left
-            else:
-                numerator = numerator + (domain_element * it2fs[domain_element].right)
-                denominator = denominator + it2fs[domain_element].right
+        if next_switch_point == switch_point:
+            return float(centroid), iterations
 
-        if denominator == 0:
-            centroid_right = it2fs.mid_domain_element()
-            logging.log(logging.ERROR, 'error in calculating z_l, denominator is 0')
-            break
+        switch_point = next_switch_point
 
-        centroid_right = numerator / denominator
+    logging.log(logging.ERROR, 'cannot converge...')
+    return float(centroid), iterations
 
-        if abs(centroid_right - centroid.right) <= error_threshold:
-            break
 
-        if counter == 15:
-            break
+def _it2_kernikmendel_reduce_noinfo(it2fs, precision=5, algorithm='km'):
 
-        counter = counter + 1
+    centroid_function = (it2_enhanced_kernikmendel_centroid if algorithm == 'ekm'
+                            else it2_kernikmendel_centroid)
+    centroid_left, centroid_right, _ = centroid_function(
+        it2fs.primary_domain(), it2fs.lower_membership_function(), it2fs.higher_membership_function())
 
-    centroid.left = round(centroid.left, precision)
-    centroid.right = round(centroid.right, precision)
+    centroid = CrispSet(round(centroid_left, precision), round(centroid_right, precision))
     return centroid
 
 
-def _it2_kernikmendel_reduce_fullinfo(it2fs, precision=5):
+def _it2_kernikmendel_reduce_fullinfo(it2fs, precision=5, algorithm='km'):
 
-    numerator = 0
-    denominator = 0
-    error_threshold = 1e-5
-    counter = 0
-    primary_domain_elements = it2fs.primary_domain()
+    if algorithm == 'ekm':
+        return _it2_enhanced_kernikmendel_reduce_fullinfo(it2fs)
 
-    centroid = CrispSet(
-        primary_domain_elements[0],
-        primary_domain_elements[len(primary_domain_elements)-1])
+    primary_domain_elements = it2fs.primary_domain()
+    prefix_sums = _prefix_sums(primary_domain_elements,
+                                it2fs.lower_membership_function(), it2fs.higher_membership_function())
 
     logging.log(logging.INFO,'starting recursion...')
 
@@ -114,85 +350,141 @@ def _it2_kernikmendel_reduce_fullinfo(it2fs, precision=5):
         'Initial value of centroid left= %s',
         centroid_left)
 
-    while True:
-
-        centroid.left = centroid_left
-        numerator = 0
-        denominator = 0
-
-        for domain_element in it2fs.primary_domain():
-
-            if domain_element >= centroid_left:
-                numerator = numerator + (domain_element * it2fs[domain_element].left)
-                denominator = denominator + it2fs[domain_element].left
-            else:
-                numerator = numerator + (domain_element * it2fs[domain_element].right)
-                denominator = denominator + it2fs[domain_element].right
-
-        logging.log(
-            logging.DEBUG,
-            'numerator: %s, denominator: %s, centroid: %s',
-            numerator,
-            denominator,
-            centroid_left)
-
-        if denominator == 0:
-            centroid.left = it2fs.mid_domain_element()
-            logging.log(logging.ERROR, 'error in calculating z_l, denominator is 0')
-            break
-
-        centroid_left = numerator / denominator
-
-        if abs(centroid_left - centroid.left) <= error_threshold:
-            break
+    centroid_left, iterations = _kernikmendel_limit(
+        primary_domain_elements, prefix_sums, centroid_left, left=True, log=True)
+    logging.log(logging.DEBUG, 'centroid left converged in %s iterations', iterations)
 
-        if counter == 15:
-            logging.log(logging.ERROR, 'cannot converge...')
-            break
-
-        counter = counter + 1
-
-    counter = 0
     centroid_right = it2fs.mid_domain_element()
     logging.log(
         logging.DEBUG,
         'Initial value of centroid right= %s',centroid_right)
 
-    while True:
-
-        centroid.right = centroid_right
-        numerator = 0
-        denominator = 0
+    centroid_right, iterations = _kernikmendel_limit(
+        primary_domain_elements, prefix_sums, centroid_right, left=False, log=True)
+    logging.log(logging.DEBUG, 'centroid right converged in %s iterations', iterations)
 
-        for domain_element in it2fs.primary_domain():
+    centroid = CrispSet(centroid_left, centroid_right)
+    return centroid
 
-            if domain_element <= centroid_right:
-                numerator = numerator + (domain_element * it2fs[domain_element].left)
-                denominator = denominator + it2fs[domain_element].left
-            else:
-                numerator = numerator + (domain_element * it2fs[domain_element].right)
-                denominator = denominator + it2fs[domain_element].right
 
-        if denominator == 0:
-            centroid_right = it2fs.mid_domain_element()
-            logging.log(logging.ERROR, 'error in calculating z_l, denominator is 0')
-            break
+def _it2_enhanced_kernikmendel_reduce_fullinfo(it2fs):
 
-        centroid_right = numerator / denominator
+    primary_domain_elements = np.asarray(it2fs.primary_domain(), dtype=float)
+    lower_mf = np.asarray(it2fs.lower_membership_function(), dtype=float)
+    upper_mf = np.asarray(it2fs.higher_membership_function(), dtype=float)
 
-        logging.log(
-            logging.DEBUG,
-            'numerator: %s, denominator: %s, centroid: %s',
-            numerator,
-            denominator,
-            centroid_right)
+    logging.log(logging.INFO,'starting enhanced recursion...')
 
-        if abs(centroid_right - centroid.right) <= error_threshold:
-            break
+    switch_point_left, switch_point_right = _enhanced_switch_points(len(primary_domain_elements))
+    logging.log(
+        logging.DEBUG,
+        'Initial switch points left= %s, right= %s',
+        switch_point_left,
+        switch_point_right)
 
-        if counter == 15:
-            break
+    centroid_left, iterations = _enhanced_kernikmendel_limit(
+        primary_domain_elements, lower_mf, upper_mf, left=True, log=True)
+    logging.log(logging.DEBUG, 'centroid left converged in %s iterations', iterations)
 
-        counter = counter + 1
+    centroid_right, iterations = _enhanced_kernikmendel_limit(
+        primary_domain_elements, lower_mf, upper_mf, left=False, log=True)
+    logging.log(logging.DEBUG, 'centroid right converged in %s iterations', iterations)
 
+    centroid = CrispSet(centroid_left, centroid_right)
     return centroid
+
+
+def _it2_kernikmendel_reduce_batch(primary_domain, lower_mfs, upper_mfs, algorithm='km'):
+    '''
+    Runs the Karnik-Mendel iterations on a batch of interval type-2 fuzzy sets
+    sharing the same primary domain, the rows of lower_mfs and upper_mfs.
+    A primary domain value marked by NaN bounds is not part of the set in
+    that row. Every row follows the same switch points as
+    it2_kernikmendel_centroid, the numerators and denominators of all the
+    rows being read from their prefix sums at once, without rounding the centroids.
+    With algorithm 'ekm' the rows start from the enhanced Karnik-Mendel
+    switch points instead, the prefix sums already giving the sums of every
+    switch point in O(1)
+
+    Arguments:
+    ----------
+    primary_domain -- 1D array, the sorted primary domain values
+    lower_mfs -- 2D array, the lower membership function of every set
+    upper_mfs -- 2D array, the upper membership function of every set
+    algorithm -- 'km' or 'ekm', as in it2_kernikmendel_reduce
+
+    Returns:
+    --------
+    centroid_left -- 1D array, the left limit of the centroid of every set
+    centroid_right -- 1D array, the right limit of the centroid of every set
+    '''
+    primary_domain = np.asarray(primary_domain, dtype=float)
+    included = ~np.isnan(lower_mfs)
+    lower_mfs = np.where(included, lower_mfs, 0)
+    upper_mfs = np.where(included, upper_mfs, 0)
+
+    # the middle domain element of every row, among the included values
+    position = np.cumsum(included, axis=1)
+    mid_idx = np.argmax(position > (position[:, -1:] // 2), axis=1)
+    mid_domain_elements = primary_domain[mid_idx]
+
+    # sums and prefix sums of every row, as in _prefix_sums
+    difference = upper_mfs - lower_mfs
+    prefix_sums = (lower_mfs @ primary_domain, np.sum(lower_mfs, axis=1),
+                    np.zeros((len(lower_mfs), len(primary_domain) + 1)),
+                    np.zeros((len(lower_mfs), len(primary_domain) + 1)))
+    prefix_sums[2][:, 1:] = np.cumsum(primary_domain * difference, axis=1)
+    prefix_sums[3][:, 1:] = np.cumsum(difference, axis=1)
+
+    rows = np.arange(len(lower_mfs))
+
+    if algorithm == 'ekm':
+        # the prefixes holding the first round(m/2.4) and round(m/1.7) of the
+        # m included values, excluded values having no weight
+        initial_switch_points = [np.sum(position <= switch_points[:, np.newaxis], axis=1)
+                                    for switch_points in _enhanced_switch_points(position[:, -1])]
+
+    centroids = []
+    for left in (True, False):
+        side = 'left' if left else 'right'
+        if algorithm == 'ekm':
+            switch_points = initial_switch_points[0 if left else 1]
+        else:
+            switch_points = np.searchsorted(primary_domain, mid_domain_elements, side=side)
+
+        # rows without any weighted domain value at the start, as in _kernikmendel_limit
+        _, denominator = _switch_point_sums(prefix_sums, (rows, switch_points), left, end=(rows, -1))
+        switch_points = np.where(denominator == 0, len(primary_domain) if left else 0, switch_points)
+
+        centroid = mid_domain_elements.copy()
+        previous = np.full(len(centroid), np.inf if left else -np.inf)
+        active = np.ones(len(centroid), dtype=bool)
+
+        # converged rows are recomputed with the others but no longer updated
+        for _ in range(len(primary_domain) + 1):
+            if not np.any(active):
+                break
+
+            numerator, denominator = _switch_point_sums(
+                prefix_sums, (rows, switch_points), left, end=(rows, -1))
+
+            # rows reaching a switch point without any weighted domain value keep
+            # their previous limit, the middle element if they have none
+            failed = active & (denominator == 0)
+            if np.any(failed & np.isinf(previous)):
+                centroid = np.where(failed & np.isinf(previous), mid_domain_elements, centroid)
+                logging.log(logging.ERROR, 'error in calculating z_l, denominator is 0')
+
+            updated = active & ~failed
+            next_centroid = numerator / np.where(updated, denominator, 1)
+            updated &= _improves(next_centroid, previous, left)
+            centroid = np.where(updated, next_centroid, centroid)
+            previous = centroid
+
+            next_switch_points = np.searchsorted(primary_domain, centroid, side=side)
+            active = updated & (next_switch_points != switch_points)
+            switch_points = np.where(active, next_switch_points, switch_points)
+
+        centroids.append(centroid)
+
+    return centroids[0], centroids[1]
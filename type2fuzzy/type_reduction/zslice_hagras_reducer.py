@@ -1,9 +1,13 @@
 import logging
+import numpy as np
 from type2fuzzy.membership.zslicetype2fuzzyset import ZSliceType2FuzzySet
+from type2fuzzy.membership.densezslicetype2fuzzyset import DenseZSliceType2FuzzySet
+from type2fuzzy.membership.crispsetarray import CrispSetArray
 from type2fuzzy.membership.alphacuttype1fuzzyset import AlphaCutType1FuzzySet
-from type2fuzzy.type_reduction.it2_karnikmendel_reducer import it2_kernikmendel_reduce
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import IT2_ALGORITHMS, it2_kernikmendel_reduce
+from type2fuzzy.type_reduction.it2_karnikmendel_reducer import _it2_kernikmendel_reduce_batch
 
-def zslice_hagras_reduce(zt2fs, precision=5, information='none'):
+def zslice_hagras_reduce(zt2fs, precision=5, information='none', algorithm='km'):
 	'''
 	References:
 	-----------
@@ -11,44 +15,58 @@ def zslice_hagras_reduce(zt2fs, precision=5, information='none'):
 
 	Arguments:
 	----------
-	zt2fs -- the z-slice type 2 fuzzy set
+	zt2fs -- the z-slice type 2 fuzzy set, a DenseZSliceType2FuzzySet
+		is reduced on all its z-slices at once
 	precision -- the precision applied when computing N/D and F
 	information -- the amount of information given to the user;
-		none - no information
+		none - no information, the centroids are rounded to precision
+		full - all the information is logged, the centroids are not rounded
+		any other value returns None
+	algorithm -- the interval type-2 reducer of every z-slice, 'km' or
+		'ekm', as in it2_kernikmendel_reduce
 	'''
 
+	if algorithm not in IT2_ALGORITHMS:
+		raise ValueError(f'Unknown algorithm {algorithm}, expected one of {IT2_ALGORITHMS}')
+
 	reduced_set = None
 
-	if information == 'none':
-		reduced_set = _zslice_hagras_noinfo(zt2fs, precision)
-	elif information == 'full':
-		reduced_set = _zslice_hagras_fullinfo(zt2fs, precision)
+	if information not in ('none', 'full'):
+		return reduced_set
+
+	if isinstance(zt2fs, DenseZSliceType2FuzzySet):
+		reduced_set = _zslice_hagras_dense(zt2fs, precision, information, algorithm)
+	elif information == 'none':
+		reduced_set = _zslice_hagras_noinfo(zt2fs, precision, algorithm)
+	else:
+		reduced_set = _zslice_hagras_fullinfo(zt2fs, precision, algorithm)
 	
 	return reduced_set
 
-def _zslice_hagras_noinfo(zt2fs, precision):
+def _zslice_hagras_noinfo(zt2fs, precision, algorithm='km'):
 	'''
 	Type reduction for z-slice type-2 fuzzy set using Hagras algorithm
 	logging no the information during the execution.
 	'''
 
-	reduced_set = AlphaCutType1FuzzySet()
-
 	zslices = zt2fs.zslices()
-
+	centroids = []
 
 	for zslice in zslices:
 
 		it2fs = zt2fs[zslice]
 
-		centroid = it2_kernikmendel_reduce(it2fs, precision=precision)
+		centroid = it2_kernikmendel_reduce(it2fs, precision=precision, algorithm=algorithm)
 
-		reduced_set.add_element(zslice, centroid)
+		centroids.append(centroid)
+
+	centroids = CrispSetArray.from_crispsets(centroids)
+	reduced_set = AlphaCutType1FuzzySet.from_arrays(zslices, centroids.left, centroids.right)
 
 	return reduced_set
 
 
-def _zslice_hagras_fullinfo(zt2fs, precision):
+def _zslice_hagras_fullinfo(zt2fs, precision, algorithm='km'):
 	'''
 	Type reduction for z-slice type-2 fuzzy set using Hagras algorithm
 	logging all the information during the execution.
@@ -63,11 +81,42 @@ def _zslice_hagras_fullinfo(zt2fs, precision):
 		logging.log(logging.DEBUG, f'correspnding set:{it2fs}')
 
 		if not it2fs.empty:
-			centroid = it2_kernikmendel_reduce(it2fs, precision=precision)
+			centroid = it2_kernikmendel_reduce(it2fs, precision=precision, information='full',
+				algorithm=algorithm)
 			logging.log(logging.DEBUG, f'centroid of interval set:{centroid}')
 			if not centroid.empty:
 				reduced_set.add_element(zslice, centroid)
 
 	logging.log(logging.DEBUG, f'reduced set: {reduced_set}')
 
-	return reduced_set
\ No newline at end of file
+	return reduced_set
+
+
+def _zslice_hagras_dense(dzt2fs, precision, information, algorithm='km'):
+	'''
+	Type reduction for dense z-slice type-2 fuzzy set using Hagras algorithm.
+	The Karnik-Mendel iterations run on the bounds of all the z-slices at once
+	'''
+	zslices, primary_domain, bounds = dzt2fs.to_array()
+
+	# slices without any primary domain value have no centroid
+	included = np.any(~np.isnan(bounds[..., 0]), axis=1)
+	zslices = zslices[included]
+
+	centroid_left, centroid_right = _it2_kernikmendel_reduce_batch(
+		primary_domain, bounds[included, :, 0], bounds[included, :, 1], algorithm)
+
+	if information == 'none':
+		centroid_left = [round(left, precision) for left in centroid_left.tolist()]
+		centroid_right = [round(right, precision) for right in centroid_right.tolist()]
+
+	reduced_set = AlphaCutType1FuzzySet.from_arrays(zslices, centroid_left, centroid_right)
+
+	if information == 'full':
+		for zslice in reduced_set.cuts():
+			logging.log(logging.DEBUG, f'z-slice value: {zslice}')
+			logging.log(logging.DEBUG, f'centroid of interval set:{reduced_set[zslice]}')
+
+		logging.log(logging.DEBUG, f'reduced set: {reduced_set}')
+
+	return reduced_set